@@ -0,0 +1,105 @@
+"""
+Email login lookup ka benchmark.
+
+In-memory SQLite me ``--users`` users banata hai, phir mixed-case emails se
+``authenticate()`` (EmailBackend) ka time aur query count print karta hai, aur
+lookup ko ``email__iexact`` (purana case-insensitive tareeka) se compare karta
+hai — saath me dono ka SQLite query plan. Test settings ka MD5 hasher use hota
+hai, to timing me zyada hissa DB lookup ka hai. Stdlib + Django only.
+
+Example:
+
+    python benchmarks/email_login.py --users 50000 --logins 2000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup():
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings.test')
+    import django
+
+    django.setup()
+    from django.core.management import call_command
+
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+def build(users):
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+
+    from project_review_app.models import CustomUser
+
+    password = make_password('secret')
+    with transaction.atomic():
+        # bulk_create save() skip karta hai — emails pehle se lowercase
+        CustomUser.objects.bulk_create(
+            (CustomUser(username=f'u{i}', email=f'first.last{i}@college.edu', password=password, role='teacher')
+             for i in range(users)),
+            batch_size=5000,
+        )
+
+
+def timed(fn, emails):
+    timings = []
+    for email in emails:
+        start = time.perf_counter()
+        fn(email)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, max(timings) * 1000
+
+
+def plan(qs):
+    from django.db import connection
+
+    sql, params = qs.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return ' / '.join(row[-1] for row in cursor.fetchall())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--logins', type=int, default=2000)
+    args = parser.parse_args()
+
+    setup()
+    from django.contrib.auth import authenticate
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from project_review_app.models import CustomUser, normalize_email
+
+    start = time.perf_counter()
+    build(args.users)
+    print(f"built {args.users} users in {time.perf_counter() - start:.2f}s")
+
+    rng = random.Random(0)
+    emails = [f'First.Last{rng.randrange(args.users)}@College.EDU' for _ in range(args.logins)]
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert authenticate(username=emails[0], password='secret') is not None
+    median, worst = timed(lambda e: authenticate(username=e, password='secret'), emails)
+    print(f"authenticate: {len(ctx.captured_queries)} query, median {median:.3f} ms, max {worst:.3f} ms")
+
+    lookups = [
+        ('exact (normalized)', lambda e: CustomUser.objects.filter(email=normalize_email(e))),
+        ('iexact', lambda e: CustomUser.objects.filter(email__iexact=e)),
+    ]
+    for label, qs in lookups:
+        median, worst = timed(lambda e: qs(e).first(), emails[:200])
+        print(f"{label:>18}: median {median:.3f} ms, max {worst:.3f} ms | {plan(qs(emails[0]))}")
+
+
+if __name__ == '__main__':
+    main()
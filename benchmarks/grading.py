@@ -0,0 +1,102 @@
+"""
+Cohort grading engine ka benchmark.
+
+In-memory SQLite me ek cohort banata hai (``--students`` students, 3 per
+group, 5-criterion rubric, har group ki ``--submissions`` scored submissions)
+aur ``grading.compute_grades`` (cold, bina cache) aur CSV export ka time aur
+query count print karta hai. Stdlib + Django only.
+
+Example:
+
+    python benchmarks/grading.py --students 3000 --runs 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup():
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings.test')
+    import django
+
+    django.setup()
+    from django.core.management import call_command
+
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+def build(students, submissions):
+    from django.db import transaction
+
+    from project_review_app.models import (
+        Criterion, CriterionScore, CustomUser, GroupMember, ProjectGroup, Rubric, Submission,
+    )
+
+    teacher = CustomUser.objects.create_user('bench-teacher', role='teacher', password='x')
+    with transaction.atomic():
+        rubric = Rubric.objects.create(name='Final', semester=5, created_by=teacher)
+        criteria = Criterion.objects.bulk_create(
+            Criterion(rubric=rubric, name=f'C{i}', weight=i + 1, max_score=10, position=i) for i in range(5)
+        )
+        users = CustomUser.objects.bulk_create(
+            CustomUser(username=f's{i}', email=f's{i}@example.com', role='student', semester=5, division='A', roll_no=f'R{i:05d}')
+            for i in range(students)
+        )
+        groups = ProjectGroup.objects.bulk_create(
+            ProjectGroup(name=f'G{i}', teacher=teacher, semester=5, division='A') for i in range((students + 2) // 3)
+        )
+        GroupMember.objects.bulk_create(
+            GroupMember(group=groups[i // 3], student=user) for i, user in enumerate(users)
+        )
+        subs = Submission.objects.bulk_create(
+            Submission(group=group, file=f'submissions/{group.pk}-{n}.zip')
+            for group in groups for n in range(submissions)
+        )
+        CriterionScore.objects.bulk_create(
+            (CriterionScore(submission=sub, criterion=c, score=(sub.pk + c.pk) % 11) for sub in subs for c in criteria),
+            batch_size=2000,
+        )
+    return teacher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=3000)
+    parser.add_argument('--submissions', type=int, default=2, help="Scored submissions per group.")
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from project_review_app.grading import compute_grades, csv_lines
+    from project_review_app.models import ProjectGroup
+
+    start = time.perf_counter()
+    teacher = build(args.students, args.submissions)
+    print(f"built {args.students} students in {time.perf_counter() - start:.2f}s")
+
+    groups = ProjectGroup.objects.filter(teacher=teacher)
+    timings = []
+    for _ in range(args.runs):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            rows = compute_grades(groups)
+            timings.append(time.perf_counter() - start)
+    print(f"compute_grades: {len(rows)} rows, {len(ctx.captured_queries)} queries, "
+          f"median {statistics.median(timings) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    size = sum(len(line) for line in csv_lines(rows))
+    print(f"csv export: {size / 1024:.0f} KB in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Tiny HTTP load generator for a single URL.
+
+Opens ``--clients`` keep-alive connections and hammers one URL for
+``--duration`` seconds, then prints throughput and latency percentiles.
+Stdlib only, so it runs anywhere the app runs.
+
+Sync-under-WSGI vs async-under-ASGI, same settings, DB and worker count. The
+async views (async_views.py) have sync twins in views.py under ``.../sync/``:
+
+    # 1. sync views, WSGI (gunicorn threads)
+    gunicorn project_review.wsgi:application --workers 4 --threads 8 --bind 127.0.0.1:8001
+    python benchmarks/http_load.py http://127.0.0.1:8001/teacher-dashboard/counters/sync/ \
+        --clients 500 --duration 30 --cookie sessionid=<teacher session>
+    python benchmarks/http_load.py http://127.0.0.1:8001/teacher/search/sync/?q=gr ...
+    python benchmarks/http_load.py http://127.0.0.1:8001/submissions/1/download/sync/ ...
+
+    # 2. async views, ASGI (production entry point)
+    uvicorn project_review.asgi:application --workers 4 --port 8002
+    python benchmarks/http_load.py http://127.0.0.1:8002/teacher-dashboard/counters/ ...
+    python benchmarks/http_load.py http://127.0.0.1:8002/teacher/search/?q=gr ...
+    python benchmarks/http_load.py http://127.0.0.1:8002/submissions/1/download/ ...
+
+Dono runs me throughput ke saath p99 latency aur errors bhi dekho: WSGI par
+500 clients ke liye sirf workers x threads slots hain, baaki connections queue
+ya reset hote hain. Load generator aur server alag cores par hon, warna
+numbers generator ke CPU se bandh jaate hain.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    status = int(status_line.split()[1])
+    length = None
+    chunked = False
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        name = name.strip().lower()
+        if name == 'content-length':
+            length = int(value.strip())
+        elif name == 'transfer-encoding' and 'chunked' in value.lower():
+            chunked = True
+
+    received = 0
+    if chunked:
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            received += size
+            if size == 0:
+                break
+    elif length:
+        await reader.readexactly(length)
+        received = length
+    return status, received
+
+
+async def _client(url, headers, deadline, stats):
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: {parts.hostname}\r\n"
+        + ''.join(f"{k}: {v}\r\n" for k, v in headers.items())
+        + "\r\n"
+    ).encode()
+
+    reader = writer = None
+    while time.monotonic() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(
+                    parts.hostname, port, ssl=parts.scheme == 'https'
+                )
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, size = await _read_response(reader)
+            stats['latencies'].append(time.perf_counter() - start)
+            stats['bytes'] += size
+            stats['status'][status] = stats['status'].get(status, 0) + 1
+        except (ConnectionError, OSError, asyncio.IncompleteReadError, ValueError):
+            stats['errors'] += 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run(url, clients, duration, headers):
+    stats = {'latencies': [], 'bytes': 0, 'errors': 0, 'status': {}}
+    deadline = time.monotonic() + duration
+    started = time.monotonic()
+    await asyncio.gather(*(_client(url, headers, deadline, stats) for _ in range(clients)))
+    return stats, time.monotonic() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('url')
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--cookie', default=None, help="e.g. sessionid=abc123")
+    args = parser.parse_args()
+
+    headers = {'Connection': 'keep-alive'}
+    if args.cookie:
+        headers['Cookie'] = args.cookie
+
+    stats, elapsed = asyncio.run(run(args.url, args.clients, args.duration, headers))
+    latencies = sorted(stats['latencies'])
+    done = len(latencies)
+    print(f"requests: {done}  errors: {stats['errors']}  status: {stats['status']}")
+    print(f"throughput: {done / elapsed:.1f} req/s  {stats['bytes'] / elapsed / 1e6:.2f} MB/s")
+    if latencies:
+        print(
+            "latency ms: p50 %.1f  p95 %.1f  p99 %.1f  max %.1f" % (
+                statistics.median(latencies) * 1000,
+                latencies[int(done * 0.95) - 1] * 1000,
+                latencies[int(done * 0.99) - 1] * 1000,
+                latencies[-1] * 1000,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
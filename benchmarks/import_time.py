@@ -0,0 +1,103 @@
+"""
+Process startup / worker boot profile using ``python -X importtime``.
+
+Spawns a fresh interpreter (so nothing is cached in-process) that does what a
+worker does on boot: ``django.setup()``, load the URLconf (which imports every
+view module) and build the WSGI/ASGI handler. Prints total wall time, the
+slowest imports by cumulative time, and a per-package summary, so startup
+regressions show up in review. Stdlib only.
+
+Example:
+
+    python benchmarks/import_time.py --settings project_review.settings.prod --runs 5
+    python benchmarks/import_time.py --top 30 --package project_review_app
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BOOT_CODE = """
+import time
+start = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+from django.core.{handler} import get_{handler}_application
+get_{handler}_application()
+print('BOOT', time.perf_counter() - start)
+"""
+
+# "import time:  self [us] | cumulative | imported package"
+LINE_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def boot_once(settings_module, handler):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module, PYTHONDONTWRITEBYTECODE='')
+    env.setdefault('DJANGO_SECRET_KEY', 'import-time-benchmark')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', BOOT_CODE.format(handler=handler)],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        raise SystemExit(proc.returncode)
+
+    boot = float(proc.stdout.split('BOOT', 1)[1])
+    imports = []
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return boot, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--settings', default='project_review.settings.prod')
+    parser.add_argument('--handler', choices=['wsgi', 'asgi'], default='wsgi')
+    parser.add_argument('--runs', type=int, default=3, help="Boot this many fresh interpreters.")
+    parser.add_argument('--top', type=int, default=20, help="Show the N slowest imports (cumulative).")
+    parser.add_argument('--package', default=None, help="Only list imports under this package prefix.")
+    args = parser.parse_args()
+
+    boots = []
+    imports = None
+    for _ in range(args.runs):
+        boot, run_imports = boot_once(args.settings, args.handler)
+        boots.append(boot)
+        # sabse tez run ki import list rakho (disk cache warm)
+        if imports is None or boot <= min(boots):
+            imports = run_imports
+
+    print(f"settings={args.settings} handler={args.handler} runs={args.runs}")
+    print(f"boot (setup + urls + handler): min {min(boots) * 1000:.1f} ms, "
+          f"median {statistics.median(boots) * 1000:.1f} ms")
+
+    top_level = [item for item in imports if item[3] == 0]
+    total_us = sum(cum for _, _, cum, _ in top_level)
+    print(f"import time (top-level cumulative): {total_us / 1000:.1f} ms across {len(imports)} modules")
+
+    listed = [item for item in imports if not args.package or item[0].startswith(args.package)]
+    print(f"\nslowest imports{' under ' + args.package if args.package else ''} (cumulative ms / self ms):")
+    for name, self_us, cum_us, _ in sorted(listed, key=lambda item: -item[2])[:args.top]:
+        print(f"  {cum_us / 1000:8.1f} {self_us / 1000:8.1f}  {name}")
+
+    per_package = {}
+    for name, self_us, _, _ in imports:
+        root = name.split('.', 1)[0]
+        per_package[root] = per_package.get(root, 0) + self_us
+    print("\nself time by top-level package (ms):")
+    for root, us in sorted(per_package.items(), key=lambda item: -item[1])[:15]:
+        print(f"  {us / 1000:8.1f}  {root}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings')
+    # `manage.py test` fast test profile use karta hai, baaki sab dev
+    profile = 'test' if len(sys.argv) > 1 and sys.argv[1] == 'test' else 'dev'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'project_review.settings.{profile}')
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -2,6 +2,9 @@
 ASGI config for project_review project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+This is the production entry point, e.g.::
+
+    uvicorn project_review.asgi:application --workers 4
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -11,6 +14,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings.prod')
+
+django_application = get_asgi_application()
+
+# upload admission gate Django ke body padhne se pehle (admission.py)
+from project_review_app.admission import gate_uploads  # noqa: E402
 
-application = get_asgi_application()
+application = gate_uploads(django_application)
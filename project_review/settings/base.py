@@ -0,0 +1,220 @@
+"""
+Django settings for project_review project — shared base.
+
+Environment-specific profiles (``dev``, ``test``, ``prod``) isi module ko
+``from .base import *`` karke override karte hain.
+
+Generated by 'django-admin startproject' using Django 5.2.4.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.2/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.2/ref/settings/
+"""
+import os
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = os.environ.get(
+    'DJANGO_SECRET_KEY', 'django-insecure-3ktum-j5otdr0nvc@g=@=k)(z74$*-=y57otl*1(y*r966#6zv'
+)
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = False
+
+ALLOWED_HOSTS = []
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'widget_tweaks',
+    'project_review_app'
+]
+
+MIDDLEWARE = [
+    'project_review_app.middleware.MetricsMiddleware',
+    # upload body padhne (CSRF) se pehle admission gate
+    'project_review_app.middleware.UploadGateMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'project_review_app.middleware.AuditMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'project_review.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [os.path.join(BASE_DIR, 'templates')],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'project_review.wsgi.application'
+# production entry point (async_views ke streams sirf ASGI par stream hote hain)
+ASGI_APPLICATION = 'project_review.asgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+
+# SQLite ka default DEFERRED transaction pehle read lock leta hai aur pehli
+# write par upgrade karta hai; do requests ek saath SELECT-then-UPDATE karein
+# (review claim, bulk review, seat lena) to upgrade par deadlock hota hai aur
+# ek ko turant "database is locked" milta hai, ``timeout`` ka wait bhi nahi.
+# IMMEDIATE me ``atomic()`` shuru hote hi write lock milta hai, to writers
+# queue me ``timeout`` tak wait karte hain.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+    }
+}
+
+
+# Password validation
+# https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.2/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.2/howto/static-files/
+
+STATIC_URL = 'static/'
+
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# archive_semester command yahan .tar.gz likhta hai
+ARCHIVE_ROOT = BASE_DIR / 'archives'
+
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+AUTH_USER_MODEL = 'project_review_app.CustomUser'  
+LOGIN_URL = '/login/'
+LOGIN_REDIRECT_URL = '/'
+LOGOUT_REDIRECT_URL = '/login/'
+
+AUTHENTICATION_BACKENDS = [
+    # email login pehle: username-wali values ye bina query ke aage bhej deta hai
+    'project_review_app.backends.EmailBackend',   # custom
+    'django.contrib.auth.backends.ModelBackend',  # default
+]
+
+# Live updates (SSE / long-poll). 'local' = single process, 'database' = multi-worker
+PUBSUB_BACKEND = 'local'
+PUBSUB_POLL_INTERVAL = 1.0
+
+# Upload ke baad archive inspection: 'process' (worker pool), 'sync' ya 'off'
+SUBMISSION_INSPECTION_MODE = 'process'
+SUBMISSION_INSPECTION_WORKERS = 2
+
+# Cache: CACHE_PROFILE env se 'locmem' (dev default), 'file' ya 'redis'. locmem
+# sirf ek process ke liye hai; prod.py shared backend maangta hai.
+# (redis kisi bhi Redis-protocol server ke saath chalta hai; redis-py chahiye)
+CACHE_PROFILES = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'project-review',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', str(BASE_DIR / 'cache')),
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'redis://127.0.0.1:6379/0'),
+    },
+    'dummy': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+}
+CACHES = {
+    'default': {
+        **CACHE_PROFILES[os.environ.get('CACHE_PROFILE', 'locmem')],
+        'KEY_PREFIX': 'pr',
+        'TIMEOUT': 300,
+    },
+}
+
+# /metrics/: multi-worker (gunicorn) me sab workers ka shared writable directory
+METRICS_MULTIPROC_DIR = os.environ.get('METRICS_MULTIPROC_DIR')
+METRICS_FLUSH_INTERVAL = 1.0
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+# Upload admission control (per worker process) aur deadline grace
+UPLOAD_MAX_CONCURRENT = 8
+UPLOAD_QUEUE_LIMIT = 32
+UPLOAD_QUEUE_WAIT = 5
+UPLOAD_RETRY_AFTER = 10
+UPLOAD_GRACE_MINUTES = 30
+
+# Change feed itne seconds se purane changes hi deta hai, taaki jo transaction
+# pehle stamp hokar baad me commit hui wo cursor ke peeche na chhoote. DB
+# ``timeout`` + sabse lambi write transaction se bada rakho.
+CHANGE_FEED_SETTLE_SECONDS = 30
+
+# rotate_audit_log itne din se purani audit entries archive karke hatata hai
+AUDIT_LOG_RETENTION_DAYS = 365
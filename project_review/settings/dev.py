@@ -0,0 +1,6 @@
+# Local development: runserver, DEBUG on, db.sqlite3
+from .base import *  # noqa: F401,F403
+
+DEBUG = True
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1', '[::1]']
@@ -0,0 +1,41 @@
+# Production: env se secrets/hosts, persistent DB connections, cached templates
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+from .base import CACHE_PROFILES, CACHES, DATABASES, TEMPLATES
+
+DEBUG = False
+
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    raise ImproperlyConfigured("DJANGO_SECRET_KEY must be set in production.")
+
+ALLOWED_HOSTS = [h.strip() for h in os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if h.strip()]
+
+# har request par naya connection kholne ki jagah worker me reuse
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# templates ek baar compile hokar memory me rehte hain
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
+# Cache versions (caching.py) ka bump sab workers ko dikhna chahiye. locmem har
+# process ka apna hota hai — ek worker ka bump baaki workers ke cache ko
+# invalidate nahi karta aur wo purana data dete rehte hain. Isliye production
+# me shared backend hi: 'file' (default, ek host ke saare workers) ya 'redis'
+# (kai hosts). 'dummy' se caching band.
+CACHE_PROFILE = os.environ.get('CACHE_PROFILE', 'file')
+if CACHE_PROFILE not in ('file', 'redis', 'dummy'):
+    raise ImproperlyConfigured(
+        f"CACHE_PROFILE={CACHE_PROFILE!r} is per-process; use 'file' or 'redis' so cache "
+        "invalidation reaches every worker."
+    )
+CACHES['default'] = {**CACHES['default'], **CACHE_PROFILES[CACHE_PROFILE]}
@@ -0,0 +1,36 @@
+# Test runner profile (``manage.py test`` isi ko use karta hai).
+# Speed ke liye: in-memory SQLite, MD5 hasher, migrations ki jagah seedha
+# models se tables, aur upload inspection off.
+import tempfile
+
+from .base import *  # noqa: F401,F403
+from .base import CACHES, DATABASES
+
+
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+DEBUG = False
+
+# production wale OPTIONS (IMMEDIATE transactions) ke saath, taaki locking
+# tests wahi behaviour dekhein jo deploy hota hai
+DATABASES = {'default': {**DATABASES['default'], 'NAME': ':memory:'}}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+MIGRATION_MODULES = DisableMigrations()
+
+# uploads repo ke media/ me na jayen
+MEDIA_ROOT = tempfile.mkdtemp(prefix='project-review-test-media-')
+ARCHIVE_ROOT = tempfile.mkdtemp(prefix='project-review-test-archives-')
+
+CACHES = {'default': {**CACHES['default'], 'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'tests'}}
+
+SUBMISSION_INSPECTION_MODE = 'off'
+PUBSUB_BACKEND = 'local'
+METRICS_MULTIPROC_DIR = None
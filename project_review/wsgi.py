@@ -3,6 +3,11 @@ WSGI config for project_review project.
 
 It exposes the WSGI callable as a module-level variable named ``application``.
 
+Production runs on asgi.py (e.g. ``uvicorn project_review.asgi:application``).
+Under WSGI the streaming views fall back to sync responses: downloads go through
+``FileResponse`` and the submission event stream (SSE) answers 204, so pages
+get no live updates. See project_review_app/async_views.py.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
@@ -11,6 +16,6 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_review.settings.prod')
 
 application = get_wsgi_application()
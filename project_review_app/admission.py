@@ -0,0 +1,199 @@
+import asyncio
+import collections
+import threading
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+
+
+# --------------------
+# Upload admission control
+# --------------------
+# Deadline ke paas sab ek saath upload karte hain. Gate ek process me ek waqt
+# par ``UPLOAD_MAX_CONCURRENT`` uploads hi andar aane deta hai; baaki
+# ``UPLOAD_QUEUE_WAIT`` seconds tak FIFO queue me slot ka wait karte hain, aur
+# queue bhi bhari ho (``UPLOAD_QUEUE_LIMIT``) ya wait khatam ho jaye to client
+# ko 503 + ``Retry-After`` milta hai. Deadline ke baad retry karne wale clients
+# ko upload ticket (milestones.py) ki grace period bachati hai.
+#
+# Gate request body padhne se *pehle* lagta hai, warna wo sirf parse/save ko
+# rokta, network se body receive hona nahi:
+#   - ASGI: Django handler middleware se pehle poori body padh leta hai, isliye
+#     ``gate_uploads`` ASGI app ko wrap karta hai (asgi.py).
+#   - WSGI: body lazily padhi jati hai (pehli baar CsrfViewMiddleware me), to
+#     ``UploadGateMiddleware`` (middleware.py) CSRF se pehle gate lagata hai.
+#
+# Slot release hote hi seedha queue ke pehle waiter ko milta hai (handoff), koi
+# polling nahi. Waiters alag event loops (WSGI par har async view ka apna loop)
+# ya threads me ho sakte hain, isliye asyncio.Semaphore ki jagah apni deque.
+
+UPLOAD_VIEWS = {'upload_submission'}
+
+
+class _LoopWaiter:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.future = self.loop.create_future()
+
+    def grant(self):
+        self.loop.call_soon_threadsafe(self._set)
+
+    def _set(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class _ThreadWaiter:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def grant(self):
+        self.event.set()
+
+
+class UploadGate:
+    def __init__(self, limit, queue_limit, queue_wait, retry_after):
+        self.limit = limit
+        self.queue_limit = queue_limit
+        self.queue_wait = queue_wait
+        self.retry_after_base = retry_after
+        self.active = 0
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self):
+        return len(self._waiters)
+
+    def _enter_or_enqueue(self, make_waiter):
+        """``True`` (slot mila), ``False`` (queue full) ya queue me laga waiter."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return True
+            if len(self._waiters) >= self.queue_limit:
+                return False
+            waiter = make_waiter()
+            self._waiters.append(waiter)
+            return waiter
+
+    def _settle(self, waiter):
+        """
+        Wait khatam (grant, timeout ya cancel). Waiter queue se nikal chuka hai to
+        ``release`` ne slot use de diya tha — wahi sach hai, future/event nahi.
+        """
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                return False
+            return True
+
+    async def acquire(self):
+        """Slot mila to True; queue full / wait timeout par False."""
+        waiter = self._enter_or_enqueue(_LoopWaiter)
+        if not isinstance(waiter, _LoopWaiter):
+            return waiter
+        try:
+            await asyncio.wait_for(waiter.future, self.queue_wait)
+        except asyncio.TimeoutError:
+            pass
+        except BaseException:
+            # client chala gaya: mila hua slot wapas do
+            if self._settle(waiter):
+                self.release()
+            raise
+        return self._settle(waiter)
+
+    def acquire_blocking(self):
+        """``acquire`` ka sync roop (WSGI middleware)."""
+        waiter = self._enter_or_enqueue(_ThreadWaiter)
+        if not isinstance(waiter, _ThreadWaiter):
+            return waiter
+        waiter.event.wait(self.queue_wait)
+        return self._settle(waiter)
+
+    def release(self):
+        with self._lock:
+            if self._waiters:
+                # slot seedha agle waiter ka; active count wahi rehta hai
+                self._waiters.popleft().grant()
+            else:
+                self.active -= 1
+
+    def retry_after(self):
+        """Queue jitni lambi, utna bada hint (seconds)."""
+        backlog = self.waiting // max(self.limit, 1)
+        return self.retry_after_base * (1 + backlog)
+
+
+_gate = None
+
+
+def get_gate():
+    global _gate
+    if _gate is None:
+        _gate = UploadGate(
+            limit=getattr(settings, 'UPLOAD_MAX_CONCURRENT', 8),
+            queue_limit=getattr(settings, 'UPLOAD_QUEUE_LIMIT', 32),
+            queue_wait=getattr(settings, 'UPLOAD_QUEUE_WAIT', 5),
+            retry_after=getattr(settings, 'UPLOAD_RETRY_AFTER', 10),
+        )
+    return _gate
+
+
+def is_upload(method, path_info):
+    if method != 'POST':
+        return False
+    try:
+        return resolve(path_info).url_name in UPLOAD_VIEWS
+    except Resolver404:
+        return False
+
+
+def busy_message(retry_after):
+    return f'Too many uploads in progress. Please retry in {retry_after} seconds.'
+
+
+def busy_response(gate):
+    from . import metrics
+
+    metrics.UPLOAD_REJECTIONS.inc(reason='busy')
+    retry_after = gate.retry_after()
+    response = HttpResponse(busy_message(retry_after), status=503, content_type='text/plain')
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def gate_uploads(app):
+    """
+    ASGI app wrapper: upload POST ko body padhne se pehle gate se guzaro. Busy ho
+    to body padhe bina 503; andar gaye request ke scope me ``upload_admitted``,
+    taaki ``UploadGateMiddleware`` dobara slot na le.
+    """
+    async def application(scope, receive, send):
+        if scope['type'] != 'http':
+            return await app(scope, receive, send)
+        path = scope['path']
+        root_path = scope.get('root_path', '')
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        if not is_upload(scope['method'], path):
+            return await app(scope, receive, send)
+
+        gate = get_gate()
+        if not await gate.acquire():
+            response = busy_response(gate)
+            await send({
+                'type': 'http.response.start',
+                'status': response.status_code,
+                'headers': [(k.lower().encode(), v.encode()) for k, v in response.items()],
+            })
+            await send({'type': 'http.response.body', 'body': response.content})
+            return
+        try:
+            await app({**scope, 'upload_admitted': True}, receive, send)
+        finally:
+            gate.release()
+
+    return application
@@ -0,0 +1,313 @@
+import base64
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_GET
+
+from .models import CustomUser, GroupMember, ProjectGroup, Query, Submission, Topic
+
+
+# --------------------
+# JSON API (v1)
+# --------------------
+# Read-only API for timetable/LMS sync. Har resource apne fields declare karta
+# hai; ``?fields=`` se jo fields maange gaye unhi ke hisaab se select_related /
+# prefetch_related lagte hain, baaki joins nahi hote.
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class Field:
+    def __init__(self, getter, select=None, prefetch=None):
+        self.getter = getter
+        self.select = select
+        self.prefetch = prefetch
+
+    def value(self, obj):
+        if callable(self.getter):
+            return self.getter(obj)
+        for part in self.getter.split('.'):
+            obj = getattr(obj, part, None) if obj is not None else None
+        return obj
+
+
+class Resource:
+    def __init__(self, queryset, fields, default_fields=None, scope=None):
+        self.queryset = queryset
+        self.fields = fields
+        # scope(qs, user); default model ka ``for_user`` (jahan ho)
+        self.scope = scope
+        self.default_fields = default_fields or [
+            name for name, field in fields.items() if not (field.select or field.prefetch)
+        ]
+
+    def scoped(self, user=None):
+        """Resource ki rows jo ``user`` dekh sakta hai (``None`` = sab)."""
+        qs = self.queryset()
+        if user is not None:
+            if self.scope is not None:
+                qs = self.scope(qs, user)
+            elif hasattr(qs, 'for_user'):
+                qs = qs.for_user(user)
+        return qs
+
+    def get_queryset(self, selected, user=None):
+        qs = self.scoped(user)
+        select = {self.fields[name].select for name in selected if self.fields[name].select}
+        prefetch = {self.fields[name].prefetch for name in selected if self.fields[name].prefetch}
+        if select:
+            qs = qs.select_related(*sorted(select))
+        if prefetch:
+            qs = qs.prefetch_related(*sorted(prefetch))
+        return qs.order_by('pk')
+
+    def serialize(self, obj, selected):
+        return {name: self.fields[name].value(obj) for name in selected}
+
+
+def _file_url(sub):
+    return sub.file.url if sub.file else None
+
+
+USER_FIELDS = {
+    'id': Field('id'),
+    'username': Field('username'),
+    'email': Field('email'),
+    'first_name': Field('first_name'),
+    'last_name': Field('last_name'),
+    'date_joined': Field('date_joined'),
+}
+
+RESOURCES = {
+    'students': Resource(
+        lambda: CustomUser.objects.filter(role='student'),
+        {
+            **USER_FIELDS,
+            'roll_no': Field('roll_no'),
+            'semester': Field('semester'),
+            'division': Field('division'),
+        },
+    ),
+    'teachers': Resource(
+        lambda: CustomUser.objects.filter(role='teacher'),
+        {
+            **USER_FIELDS,
+            'department': Field('department'),
+            'subject': Field('subject'),
+        },
+    ),
+    'topics': Resource(
+        lambda: Topic.objects.all(),
+        {
+            'id': Field('id'),
+            'title': Field('title'),
+            'description': Field('description'),
+            'created_at': Field('created_at'),
+            'created_by': Field('created_by_id'),
+            'created_by_username': Field('created_by.username', select='created_by'),
+            'teacher': Field('teacher_id'),
+            'teacher_username': Field('teacher.username', select='teacher'),
+        },
+    ),
+    'groups': Resource(
+        lambda: ProjectGroup.objects.all(),
+        {
+            'id': Field('id'),
+            'name': Field('name'),
+            'max_members': Field('max_members'),
+            'division': Field('division'),
+            'semester': Field('semester'),
+            'created_at': Field('created_at'),
+            'topic': Field('topic_id'),
+            'topic_title': Field('topic.title', select='topic'),
+            'teacher': Field('teacher_id'),
+            'teacher_username': Field('teacher.username', select='teacher'),
+            'member_ids': Field(
+                lambda g: [m.student_id for m in g.members.all()], prefetch='members'
+            ),
+        },
+    ),
+    'members': Resource(
+        lambda: GroupMember.objects.all(),
+        {
+            'id': Field('id'),
+            'group': Field('group_id'),
+            'group_name': Field('group.name', select='group'),
+            'student': Field('student_id'),
+            'student_username': Field('student.username', select='student'),
+            'joined_at': Field('joined_at'),
+        },
+        scope=lambda qs, user: qs.filter(group__in=ProjectGroup.objects.for_user(user).values('pk')),
+    ),
+    'submissions': Resource(
+        lambda: Submission.objects.all(),
+        {
+            'id': Field('id'),
+            'group': Field('group_id'),
+            'group_name': Field('group.name', select='group'),
+            'uploaded_by': Field('uploaded_by_id'),
+            'uploaded_by_username': Field('uploaded_by.username', select='uploaded_by'),
+            'file': Field(_file_url),
+            'note': Field('note'),
+            'status': Field('status'),
+            'feedback': Field('feedback'),
+            'submitted_at': Field('submitted_at'),
+            'reviewed_at': Field('reviewed_at'),
+        },
+    ),
+    'queries': Resource(
+        lambda: Query.objects.all(),
+        {
+            'id': Field('id'),
+            'group': Field('group_id'),
+            'group_name': Field('group.name', select='group'),
+            'student': Field('student_id'),
+            'student_username': Field('student.username', select='student'),
+            'author': Field('author_id'),
+            'author_username': Field('author.username', select='author'),
+            'message': Field('message'),
+            'created_at': Field('created_at'),
+        },
+    ),
+}
+
+
+# --------------------
+# Helpers
+# --------------------
+def _error(status, message, **extra):
+    return JsonResponse({'error': message, **extra}, status=status)
+
+
+def encode_cursor(pk):
+    return base64.urlsafe_b64encode(str(pk).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+def _selected_fields(request, resource):
+    raw = request.GET.get('fields')
+    if not raw:
+        return resource.default_fields
+    selected = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in selected if name not in resource.fields]
+    if unknown:
+        raise ValueError(unknown)
+    # id hamesha chahiye (cursor aur sync ke liye)
+    if 'id' not in selected:
+        selected.insert(0, 'id')
+    return selected
+
+
+def _page_size(request):
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        limit = DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def etag_response(request, payload):
+    """
+    Strong ETag body ke SHA-256 se banta hai. ``If-None-Match`` match ho to
+    304 bina body ke jata hai, taaki nightly sync unchanged pages dobara na le.
+    """
+    body = json.dumps(payload, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()
+    response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return get_conditional_response(request, etag=etag, response=response)
+
+
+def api_auth(view_func):
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return _error(401, 'Authentication required.')
+        user = request.user
+        if not (user.is_superuser or user.role in ('teacher', 'admin')):
+            return _error(403, 'API access is limited to teachers and admins.')
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+# --------------------
+# Views
+# --------------------
+@require_GET
+@api_auth
+def api_list(request, resource):
+    resource = RESOURCES.get(resource)
+    if resource is None:
+        return _error(404, 'Unknown resource.')
+    try:
+        selected = _selected_fields(request, resource)
+    except ValueError as exc:
+        return _error(400, 'Unknown fields.', unknown=exc.args[0], allowed=sorted(resource.fields))
+
+    qs = resource.get_queryset(selected, request.user)
+    cursor = request.GET.get('cursor')
+    if cursor:
+        try:
+            qs = qs.filter(pk__gt=decode_cursor(cursor))
+        except ValueError:
+            return _error(400, 'Invalid cursor.')
+
+    limit = _page_size(request)
+    rows = list(qs[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return etag_response(request, {
+        'results': [resource.serialize(obj, selected) for obj in rows],
+        'next': encode_cursor(rows[-1].pk) if has_more else None,
+    })
+
+
+@require_GET
+@api_auth
+def api_detail(request, resource, pk):
+    resource = RESOURCES.get(resource)
+    if resource is None:
+        return _error(404, 'Unknown resource.')
+    try:
+        selected = _selected_fields(request, resource)
+    except ValueError as exc:
+        return _error(400, 'Unknown fields.', unknown=exc.args[0], allowed=sorted(resource.fields))
+
+    obj = resource.get_queryset(selected, request.user).filter(pk=pk).first()
+    if obj is None:
+        return _error(404, 'Not found.')
+    return etag_response(request, resource.serialize(obj, selected))
+
+
+@require_GET
+@api_auth
+def api_changes(request):
+    """Change feed: ``?cursor=`` ke baad ke inserts/updates/deletes order me (user ke scope me)."""
+    from .changefeed import changes_since
+
+    try:
+        events, next_cursor = changes_since(request.GET.get('cursor'), _page_size(request), request.user)
+    except ValueError:
+        return _error(400, 'Invalid cursor.')
+    return JsonResponse({'changes': events, 'next': next_cursor})
+
+
+@require_GET
+@api_auth
+def api_cache_stats(request):
+    """Is worker process ke cache hit/miss counters (monitoring ke liye)."""
+    from .caching import cache_stats
+
+    return JsonResponse(cache_stats())
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProjectReviewAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'project_review_app'
+
+    def ready(self):
+        from .signals import connect_receivers
+        connect_receivers()
@@ -0,0 +1,207 @@
+import io
+import json
+import os
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from . import audit
+from .caching import TRACKED_MODELS, bump_on_commit
+from .changefeed import group_owners
+from .topics import release_claims
+from .models import (
+    AuditEntry, CriterionScore, Fingerprint, GroupMember, GroupSummary, MemberAdjustment, Milestone, ProjectGroup, Query,
+    QueryReadMarker, ReviewLog, SimilarityMatch, Submission, SubmissionManifest, Tombstone,
+)
+
+
+# --------------------
+# Semester archival / purge
+# --------------------
+# Django ka delete collector har related row memory me load karke model-wise
+# delete karta hai (aur files kabhi delete nahi hoti). Purane semester ke liye
+# ye bahut slow hai, isliye yahan set-based deletes hote hain: har batch me
+# child tables par ek ``DELETE ... WHERE group_id IN (...)`` aur phir groups.
+
+DEFAULT_BATCH_SIZE = 200
+
+# (model, group lookup) — child pehle, parent last. Naye group-owned models
+# yahan add karne hain.
+GROUP_OWNED = [
+    (ReviewLog, 'submission__group_id__in'),
+    (SubmissionManifest, 'submission__group_id__in'),
+    (CriterionScore, 'submission__group_id__in'),
+    (Submission, 'group_id__in'),
+    (Query, 'group_id__in'),
+    (QueryReadMarker, 'group_id__in'),
+    (GroupMember, 'group_id__in'),
+    (Milestone, 'group_id__in'),
+    (GroupSummary, 'group_id__in'),
+    (MemberAdjustment, 'group_id__in'),
+    (ProjectGroup, 'pk__in'),
+]
+
+# similarity index — purge me GROUP_OWNED se pehle hatta hai, archive me nahi
+# jata (restore ke baad ``inspect_submissions --all`` dobara bana deta hai)
+GROUP_DERIVED = [
+    (SimilarityMatch, 'submission__group_id__in'),
+    (SimilarityMatch, 'other__group_id__in'),
+    (Fingerprint, 'submission__group_id__in'),
+]
+
+# change feed ke liye kin models ke deletes tombstone chahiye
+TOMBSTONE_RESOURCES = {
+    Submission: 'submissions',
+    Query: 'queries',
+    GroupMember: 'members',
+    ProjectGroup: 'groups',
+}
+
+
+def semester_groups(semester, division=None, before=None):
+    qs = ProjectGroup.objects.filter(semester=semester)
+    if division:
+        qs = qs.filter(division=division)
+    if before:
+        qs = qs.filter(created_at__lt=before)
+    return qs.order_by('pk')
+
+
+def _batches(ids, size):
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def purge_groups(group_ids, batch_size=DEFAULT_BATCH_SIZE, delete_files=True):
+    """
+    Groups aur unka saara data batch-wise set-based deletes se hatao.
+    Deletes ke tombstones ``bulk_create`` se likhe jate hain aur files commit
+    ke baad storage se hat ti hain. Deleted groups ki count return hoti hai.
+    """
+    group_ids = list(group_ids)
+    deleted = 0
+    for batch in _batches(group_ids, batch_size):
+        with transaction.atomic():
+            files = list(
+                Submission.objects.filter(group_id__in=batch).exclude(file='').values_list('file', flat=True)
+            )
+            now = timezone.now()
+            tombstones = []
+            owners = group_owners(batch)
+            for model, resource in TOMBSTONE_RESOURCES.items():
+                lookup, group_field = ('pk__in', 'pk') if model is ProjectGroup else ('group_id__in', 'group_id')
+                rows = list(model.objects.filter(**{lookup: batch}).values_list('pk', group_field))
+                tombstones.extend(
+                    Tombstone(resource=resource, object_id=pk, deleted_at=now,
+                              teacher_id=owners[group_id][0], topic_owner_id=owners[group_id][1])
+                    for pk, group_id in rows
+                )
+                if model is ProjectGroup:
+                    # _raw_delete signals nahi bhejta; group ke saath uska data bhi gaya
+                    for pk, _ in rows:
+                        audit.record_raw(AuditEntry.ACTION_DELETE, ProjectGroup, pk, {'purged': [False, True]})
+
+            topic_counts = dict(
+                ProjectGroup.objects.filter(pk__in=batch, topic__isnull=False)
+                .values('topic_id').annotate(n=Count('pk')).values_list('topic_id', 'n')
+            )
+
+            for model, lookup in GROUP_DERIVED + GROUP_OWNED:
+                # _raw_delete: seedha DELETE, bina collector / per-row signals
+                count = model.objects.filter(**{lookup: batch})._raw_delete(model.objects.db)
+                if model is ProjectGroup:
+                    deleted += count
+            Tombstone.objects.bulk_create(tombstones, batch_size=1000)
+            release_claims(topic_counts)
+            # _raw_delete signals nahi bhejta
+            bump_on_commit(*TRACKED_MODELS)
+
+            if delete_files and files:
+                transaction.on_commit(lambda names=files: _delete_files(names))
+    return deleted
+
+
+def _delete_files(names):
+    storage = Submission._meta.get_field('file').storage
+    for name in names:
+        try:
+            storage.delete(name)
+        except OSError:
+            pass
+
+
+def _write_json(tar, name, chunks):
+    """Fixture-format JSON array (``loaddata`` se restore ho sakta hai)."""
+    import tarfile
+    import tempfile
+
+    from django.core import serializers
+
+    # tar ko size pehle chahiye, isliye temp file me likh kar phir add karte hain
+    buf = tempfile.TemporaryFile()
+    buf.write(b'[')
+    first = True
+    for chunk in chunks:
+        data = serializers.serialize('json', chunk)[1:-1].strip()
+        if not data:
+            continue
+        if not first:
+            buf.write(b',')
+        buf.write(data.encode())
+        first = False
+    buf.write(b']')
+    info = tarfile.TarInfo(name)
+    info.size = buf.tell()
+    info.mtime = int(timezone.now().timestamp())
+    buf.seek(0)
+    tar.addfile(info, buf)
+    buf.close()
+
+
+def archive_groups(group_ids, path, batch_size=DEFAULT_BATCH_SIZE, include_files=True):
+    """
+    Groups ka data (fixtures) aur uploaded files ek ``.tar.gz`` me likho.
+    Rows batch me padhe jate hain taaki memory bounded rahe.
+    """
+    # sirf archive command ko chahiye; web workers (group delete -> purge) inhe import nahi karte
+    import tarfile
+
+    group_ids = list(group_ids)
+    counts = {}
+    with tarfile.open(path, 'w:gz') as tar:
+        for model, lookup in reversed(GROUP_OWNED):
+            label = model._meta.label_lower
+            counts[label] = 0
+
+            def chunks(model=model, lookup=lookup, label=label):
+                for batch in _batches(group_ids, batch_size):
+                    rows = list(model.objects.filter(**{lookup: batch}).order_by('pk'))
+                    counts[label] += len(rows)
+                    yield rows
+
+            _write_json(tar, f'data/{label}.json', chunks())
+
+        if include_files:
+            storage = Submission._meta.get_field('file').storage
+            for batch in _batches(group_ids, batch_size):
+                names = Submission.objects.filter(group_id__in=batch).exclude(file='').values_list('file', flat=True)
+                for name in names:
+                    if not storage.exists(name):
+                        continue
+                    info = tarfile.TarInfo(f'files/{name}')
+                    info.size = storage.size(name)
+                    with storage.open(name, 'rb') as f:
+                        tar.addfile(info, f)
+
+        meta = json.dumps({'created_at': timezone.now().isoformat(), 'groups': len(group_ids), 'counts': counts}).encode()
+        info = tarfile.TarInfo('manifest.json')
+        info.size = len(meta)
+        tar.addfile(info, io.BytesIO(meta))
+    return counts
+
+
+def default_archive_path(directory, semester, division=None):
+    stamp = timezone.now().strftime('%Y%m%d-%H%M%S')
+    name = f"semester-{semester}{'-' + division if division else ''}-{stamp}.tar.gz"
+    return os.path.join(directory, name)
@@ -0,0 +1,254 @@
+import json
+import mimetypes
+import os
+import time
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import redirect
+
+from . import metrics
+from .forms import SubmissionForm
+from .memberships import current_membership
+from .milestones import admit_upload
+from .models import CustomUser, GroupMember, ProjectGroup, Submission, Topic
+from .pubsub import subscribe
+from .queries import group_channel, serialize_message, thread_messages
+
+
+# --------------------
+# Async (ASGI) views
+# --------------------
+# I/O-heavy endpoints: ASGI server par ye event loop par chalte hain, to badi
+# file upload/download ke dauran worker threads block nahi hote. Production
+# isliye asgi.py par chalta hai (uvicorn/daphne), wsgi.py par nahi.
+#
+# WSGI (runserver, gunicorn sync workers) par Django async iterator ko poora
+# padh kar hi response bhejta hai: download poori file RAM me, SSE stream khatam
+# hone tak kuch nahi. Isliye streaming views server dekhte hain — WSGI par
+# download ``FileResponse`` (``wsgi.file_wrapper``) se jata hai aur SSE 204 deta
+# hai. Counters/search/download ke sync twins views.py me ``.../sync/`` URLs par
+# hain (benchmarks/http_load.py ka WSGI run).
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+LONG_POLL_TIMEOUT = 25
+SSE_HEARTBEAT = 15
+SSE_MAX_DURATION = 300
+SEARCH_LIMIT = 20
+
+
+def _async_role_required(role):
+    def decorator(view_func):
+        async def wrapper(request, *args, **kwargs):
+            user = await request.auser()
+            if not user.is_authenticated:
+                return redirect('login')
+            if user.role != role:
+                return JsonResponse({'error': f'Only {role}s can access this page.'}, status=403)
+            # resolved user rakh do, warna request.user async context me sync query karega
+            request.user = user
+            return await view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async_teacher_required = _async_role_required('teacher')
+async_student_required = _async_role_required('student')
+
+
+def _is_asgi(request):
+    return isinstance(request, ASGIRequest)
+
+
+# querysets async views aur unke sync twins (views.py) dono ke liye
+def counter_querysets(teacher):
+    return {
+        'students_count': CustomUser.objects.filter(role='student'),
+        'topics_count': Topic.objects.filter(created_by=teacher),
+        'groups_count': ProjectGroup.objects.filter(topic__created_by=teacher),
+        'pending_reviews_count': Submission.objects.filter(
+            status=Submission.STATUS_PENDING, group__topic__created_by=teacher,
+        ),
+    }
+
+
+def search_querysets(teacher, q):
+    """``q`` 2 characters se chhota ho to khali dict (koi query nahi)."""
+    if len(q) < 2:
+        return {}
+    return {
+        'topics': Topic.objects.for_teacher(teacher).filter(title__icontains=q).values('id', 'title')[:SEARCH_LIMIT],
+        'groups': ProjectGroup.objects.for_teacher(teacher).filter(
+            name__icontains=q
+        ).values('id', 'name', 'semester', 'division')[:SEARCH_LIMIT],
+        'students': CustomUser.objects.filter(
+            Q(username__icontains=q) | Q(roll_no__icontains=q), role='student'
+        ).values('id', 'username', 'roll_no', 'semester', 'division')[:SEARCH_LIMIT],
+    }
+
+
+def submission_file_response(sub):
+    """Sync download response; WSGI server ise ``wsgi.file_wrapper`` se stream karta hai."""
+    if not sub.file or not sub.file.storage.exists(sub.file.name):
+        raise Http404("File missing")
+    return FileResponse(
+        sub.file.storage.open(sub.file.name, 'rb'), as_attachment=True, filename=os.path.basename(sub.file.name),
+    )
+
+
+@async_teacher_required
+async def dashboard_counters(request):
+    """Teacher dashboard ke counters JSON me (dashboard inhe async refresh kar sakta hai)."""
+    counts = {}
+    for name, qs in counter_querysets(request.user).items():
+        counts[name] = await qs.acount()
+    return JsonResponse(counts)
+
+
+@async_teacher_required
+async def search(request):
+    results = {'topics': [], 'groups': [], 'students': []}
+    for name, qs in search_querysets(request.user, request.GET.get('q', '').strip()).items():
+        results[name] = [row async for row in qs]
+    return JsonResponse(results)
+
+
+async def _file_chunks(field_file):
+    f = await sync_to_async(field_file.storage.open)(field_file.name, 'rb')
+    try:
+        while True:
+            chunk = await sync_to_async(f.read)(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await sync_to_async(f.close)()
+
+
+async def download_submission(request, sub_id):
+    user = await request.auser()
+    if not user.is_authenticated:
+        return redirect('login')
+    try:
+        sub = await Submission.objects.for_user(user).aget(pk=sub_id)
+    except Submission.DoesNotExist:
+        raise Http404("Submission not found")
+    if not _is_asgi(request):
+        return await sync_to_async(submission_file_response)(sub)
+    if not sub.file or not await sync_to_async(sub.file.storage.exists)(sub.file.name):
+        raise Http404("File missing")
+
+    filename = os.path.basename(sub.file.name)
+    content_type, _ = mimetypes.guess_type(filename)
+    response = StreamingHttpResponse(_file_chunks(sub.file), content_type=content_type or 'application/octet-stream')
+    response['Content-Length'] = await sync_to_async(sub.file.storage.size)(sub.file.name)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+@async_student_required
+async def upload_submission(request):
+    """
+    Project file upload. Admission gate (concurrency cap) body padhne se pehle
+    lag chuka hota hai (admission.py); yahan milestone window check, phir
+    multipart body ka parse (disk par temp file) thread me, aur validation/save
+    async ORM se.
+    """
+    if request.method != 'POST':
+        return redirect('project_submission')
+
+    member = await current_membership(request.user).select_related('group').afirst()
+    if member is None:
+        await sync_to_async(messages.error)(request, 'You are not assigned to any group yet.')
+        return redirect('student_dashboard')
+
+    allowed, milestone = await sync_to_async(admit_upload)(
+        request.user, member.group, request.GET.get('ticket'),
+    )
+    if not allowed:
+        metrics.UPLOAD_REJECTIONS.inc(reason='closed')
+        await sync_to_async(messages.error)(request, 'The submission window for your group is closed.')
+        return redirect('project_submission')
+
+    post, files = await sync_to_async(lambda: (request.POST, request.FILES))()
+    form = SubmissionForm(post, files)
+    if not await sync_to_async(form.is_valid)():
+        await sync_to_async(messages.error)(request, 'Submission failed. Please check the form.')
+        return redirect('project_submission')
+
+    sub = form.save(commit=False)
+    sub.group = member.group
+    sub.uploaded_by = request.user
+    sub.milestone = milestone
+    await sub.asave()
+    await sync_to_async(messages.success)(request, 'Project submitted successfully.')
+    return redirect('view_submissions')
+
+
+async def group_queries_poll(request, group_id):
+    """
+    Long-poll: ``?after=<id>`` ke baad ka naya message aate hi return karta hai,
+    warna ``LONG_POLL_TIMEOUT`` seconds baad khali list. Wait ke dauran DB query
+    nahi hoti; pehle subscribe karke phir ek baar check hota hai, taaki beech me
+    aaya message miss na ho.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required.'}, status=401)
+    try:
+        group = await ProjectGroup.objects.for_user(user).aget(pk=group_id)
+    except ProjectGroup.DoesNotExist:
+        raise Http404("Group not found")
+    try:
+        after = int(request.GET.get('after', 0))
+    except ValueError:
+        after = 0
+
+    with subscribe(group_channel(group.pk)) as sub:
+        thread = await sync_to_async(thread_messages)(group.pk, after=after)
+        if not thread and await sub.get(timeout=LONG_POLL_TIMEOUT) is not None:
+            thread = await sync_to_async(thread_messages)(group.pk, after=after)
+
+    return JsonResponse({'messages': [serialize_message(m, user) for m in thread]})
+
+
+async def _sse_stream(channels):
+    # EventSource khud reconnect karta hai, isliye stream ko SSE_MAX_DURATION
+    # ke baad band kar dete hain taaki dead connections hamesha ke liye na atke
+    with subscribe(*channels) as sub:
+        yield 'retry: 3000\n\n'
+        deadline = time.monotonic() + SSE_MAX_DURATION
+        while time.monotonic() < deadline:
+            message = await sub.get(timeout=SSE_HEARTBEAT)
+            if message is None:
+                yield ': keep-alive\n\n'
+                continue
+            _, payload = message
+            if payload.get('type') != 'submission':
+                continue
+            yield f"event: submission\ndata: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n"
+
+
+@async_student_required
+async def submission_events(request):
+    """
+    Server-Sent Events: student ke groups ke submissions ka status change push
+    hota hai, taaki ``view_submissions``/``my_group`` baar baar reload na karne pade.
+    Sirf ASGI par; WSGI par 204, jis par EventSource reconnect karna band kar deta hai.
+    """
+    if not _is_asgi(request):
+        return HttpResponse(status=204)
+    group_ids = [
+        gid async for gid in GroupMember.objects.filter(student=request.user).values_list('group_id', flat=True)
+    ]
+    response = StreamingHttpResponse(
+        _sse_stream([group_channel(gid) for gid in group_ids]),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
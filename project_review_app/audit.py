@@ -0,0 +1,262 @@
+import contextvars
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.fields.files import FieldFile
+
+from .models import (
+    AuditEntry, Criterion, CustomUser, GroupMember, MemberAdjustment, Milestone, ProjectGroup, Rubric, Submission,
+    Topic,
+)
+
+
+# --------------------
+# Audit log
+# --------------------
+# Model load hote hi (post_init) audited fields ka snapshot instance par rakh
+# dete hain; post_save par usi se diff banta hai — ``{field: [old, new]}`` —
+# bina kisi extra SELECT ke. Entries request ke buffer me jama hoti hain aur
+# response par ``AuditMiddleware`` ek hi ``bulk_create`` me likhta hai, to write
+# path par audit ki wajah se sirf ek query badhti hai. Request ke bahar (shell,
+# management commands) entry turant likhi jati hai.
+#
+# Buffer me sirf wahi entries likhi jati hain jinka write commit hua: atomic
+# block ke andar bani entry ke saath ek ``on_commit`` marker register hota hai.
+# Block (ya savepoint) rollback hua to Django marker hata deta hai aur flush
+# entry chhod deta hai — jaise ``set_members`` ke fail hone par uske deletes.
+#
+# queryset ``update()`` / ``bulk_create`` / ``_raw_delete`` signals nahi
+# bhejte; jo code unse audited data badalta hai (bulk review, rubric scores,
+# topic claims, purge) wo ``record`` / ``record_raw`` khud call karta hai.
+
+AUDITED_MODELS = (
+    CustomUser, Topic, ProjectGroup, GroupMember, Submission, Milestone, Rubric, Criterion, MemberAdjustment,
+)
+
+# timestamps, derived counters aur review lease churn diff me nahi aate
+EXCLUDED_FIELDS = {
+    'created_at', 'updated_at', 'joined_at', 'submitted_at', 'last_login', 'date_joined',
+    'claimed_count', 'claimed_by', 'claimed_until', 'member_count',
+}
+REDACTED_FIELDS = {'password'}
+REDACTED = '<redacted>'
+
+# object_repr ke liye pehla maujood field (``__str__`` related rows load karta hai)
+REPR_FIELDS = ('username', 'title', 'name', 'file')
+
+_current = contextvars.ContextVar('audit_batch', default=None)
+_fields = {}
+
+
+class _Commit:
+    """``on_commit`` marker: commit par ``done``; rollback par Django ise list se hata deta hai."""
+    __slots__ = ('done',)
+
+    def __init__(self):
+        self.done = False
+
+    def __call__(self):
+        self.done = True
+
+
+class Batch:
+    def __init__(self, path=''):
+        self.path = path[:200]
+        self._pending = []
+
+    def add(self, entry):
+        marker = None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            marker = _Commit()
+            transaction.on_commit(marker)
+        self._pending.append((entry, marker))
+
+    @property
+    def entries(self):
+        """Wo entries jinka write commit ho chuka (ya abhi bahar wale open transaction me hai)."""
+        waiting = {id(func) for _, func, _ in connections[DEFAULT_DB_ALIAS].run_on_commit}
+        return [
+            entry for entry, marker in self._pending
+            if marker is None or marker.done or id(marker) in waiting
+        ]
+
+    def flush(self, actor_id=None):
+        """Saari entries ek ``bulk_create`` me; jinka actor set nahi unhe ``actor_id``."""
+        entries = self.entries
+        self._pending = []
+        if not entries:
+            return 0
+        for entry in entries:
+            if entry.actor_id is None:
+                entry.actor_id = actor_id
+            entry.path = entry.path or self.path
+        AuditEntry.objects.bulk_create(entries)
+        return len(entries)
+
+
+@contextmanager
+def capture(path=''):
+    """Block ke andar ki entries ``Batch`` me jama hoti hain; likhna caller ka kaam (``flush``)."""
+    batch = Batch(path)
+    token = _current.set(batch)
+    try:
+        yield batch
+    finally:
+        _current.reset(token)
+
+
+def audited_fields(model):
+    """``(name, attname)`` pairs, model ke hisaab se ek baar compute."""
+    fields = _fields.get(model)
+    if fields is None:
+        fields = _fields[model] = [
+            (f.name, f.attname) for f in model._meta.concrete_fields
+            if not f.primary_key and f.name not in EXCLUDED_FIELDS
+        ]
+    return fields
+
+
+def _plain(value):
+    if isinstance(value, FieldFile):
+        return value.name or ''
+    return value
+
+
+def _values(instance):
+    data = instance.__dict__
+    # deferred fields (only()/defer()) __dict__ me nahi hote — unka diff nahi banta
+    return {name: _plain(data[attname]) for name, attname in audited_fields(type(instance)) if attname in data}
+
+
+def _redact(changes):
+    for name in REDACTED_FIELDS & changes.keys():
+        old, new = changes[name]
+        changes[name] = [old and REDACTED, new and REDACTED]
+    return changes
+
+
+def _repr(instance):
+    for name in REPR_FIELDS:
+        value = instance.__dict__.get(name)
+        if value:
+            return str(_plain(value))[:200]
+    return f'{instance._meta.model_name} #{instance.pk}'
+
+
+def record_raw(action, model, object_id, changes=None, object_repr='', actor=None):
+    entry = AuditEntry(
+        action=action,
+        model=model._meta.model_name,
+        object_id=object_id,
+        object_repr=object_repr[:200],
+        changes=_redact(changes or {}),
+        actor_id=getattr(actor, 'pk', actor),
+    )
+    batch = _current.get()
+    if batch is None:
+        AuditEntry.objects.bulk_create([entry])
+    else:
+        batch.add(entry)
+    return entry
+
+
+def record(action, instance, changes=None, actor=None):
+    return record_raw(action, type(instance), instance.pk, changes, _repr(instance), actor)
+
+
+# --------------------
+# Signal receivers (signals.connect_receivers)
+# --------------------
+def take_snapshot(sender, instance, **kwargs):
+    instance._audit_snapshot = _values(instance)
+
+
+def record_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    new = _values(instance)
+    old = getattr(instance, '_audit_snapshot', {})
+    instance._audit_snapshot = new
+    if created:
+        changes = {name: [None, value] for name, value in new.items() if value not in (None, '')}
+        record(AuditEntry.ACTION_CREATE, instance, changes)
+        return
+
+    names = new.keys() if update_fields is None else {
+        name for name, attname in audited_fields(sender) if name in update_fields or attname in update_fields
+    }
+    changes = {
+        name: [old[name], new[name]]
+        for name in names if name in old and name in new and old[name] != new[name]
+    }
+    if changes:
+        record(AuditEntry.ACTION_UPDATE, instance, changes)
+
+
+def record_delete(sender, instance, **kwargs):
+    last = getattr(instance, '_audit_snapshot', None) or _values(instance)
+    changes = {name: [value, None] for name, value in last.items() if value not in (None, '')}
+    record(AuditEntry.ACTION_DELETE, instance, changes)
+
+
+# --------------------
+# Query view + rotation
+# --------------------
+AUDIT_PAGE_SIZE = 50
+ROTATE_BATCH_SIZE = 5000
+
+
+def search(model=None, object_id=None, actor=None, action=None, since=None, until=None, before=None):
+    """
+    Admin audit view ki query. Har filter ek index se match karta hai
+    (``audit_object_idx``, ``audit_actor_idx``, ``audit_time_idx``); pagination
+    ``before=<id>`` keyset hai, to purane pages bhi OFFSET scan nahi karte.
+    """
+    entries = AuditEntry.objects.select_related('actor')
+    if model:
+        entries = entries.filter(model=model)
+        if object_id:
+            entries = entries.filter(object_id=object_id)
+    if actor:
+        entries = entries.filter(actor_id=actor)
+    if action:
+        entries = entries.filter(action=action)
+    if since:
+        entries = entries.filter(created_at__gte=since)
+    if until:
+        entries = entries.filter(created_at__lt=until)
+    if before:
+        entries = entries.filter(id__lt=before)
+    return entries.order_by('-id')
+
+
+def rotate(cutoff, path=None, batch_size=ROTATE_BATCH_SIZE):
+    """
+    ``cutoff`` se purani entries batch-wise hatao. ``path`` diya ho to har batch
+    delete se pehle gzip JSON Lines me append hota hai. Hatai gayi count return.
+    """
+    import gzip
+    import json
+
+    from django.core.serializers.json import DjangoJSONEncoder
+    from django.db import transaction
+
+    fields = [f.attname for f in AuditEntry._meta.concrete_fields]
+    old = AuditEntry.objects.filter(created_at__lt=cutoff).order_by('id').values(*fields)
+    out = gzip.open(path, 'at', encoding='utf-8') if path else None
+    removed, last_id = 0, 0
+    try:
+        while True:
+            rows = list(old.filter(id__gt=last_id)[:batch_size])
+            if not rows:
+                break
+            if out:
+                out.writelines(json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows)
+                out.flush()
+            last_id = rows[-1]['id']
+            with transaction.atomic():
+                removed += AuditEntry.objects.filter(id__in=[row['id'] for row in rows]).delete()[0]
+    finally:
+        if out:
+            out.close()
+    return removed
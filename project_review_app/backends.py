@@ -1,12 +1,23 @@
 from django.contrib.auth.backends import ModelBackend
-from .models import CustomUser
+from .models import CustomUser, normalize_email
 
 class EmailBackend(ModelBackend):
+    """
+    Email + password login. Emails lowercase store hote hain, to lookup exact
+    match hai aur ``email`` ka unique index use hota hai (``iexact`` index
+    skip karke poori table scan karta). Settings me ModelBackend se pehle hai;
+    jo value email nahi (``@`` nahi) use bina query ke ModelBackend ko de deta hai.
+    """
+
     def authenticate(self, request, username=None, password=None, **kwargs):
+        if not username or '@' not in username:
+            return None
         try:
-            user = CustomUser.objects.get(email=username)
+            user = CustomUser.objects.get(email=normalize_email(username))
         except CustomUser.DoesNotExist:
+            # hash yahan nahi: aage ModelBackend ka username miss dummy hash karta
+            # hai, to "email nahi mila" aur "galat password" ka timing same rehta hai
             return None
-        if user.check_password(password):
+        if user.check_password(password) and self.user_can_authenticate(user):
             return user
         return None
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import (
+    Criterion, CriterionScore, CustomUser, GroupMember, MemberAdjustment, ProjectGroup, Rubric, Submission, Topic,
+)
+
+
+# --------------------
+# Versioned model caches
+# --------------------
+# Har tracked model ka ek version number cache me rehta hai. Cached values ki key
+# me unke dependent models ke versions hote hain, to model save/delete par
+# version bump hote hi purani keys apne aap bekaar ho jati hain (delete pattern
+# ya key list ki zarurat nahi). Version missing ho (eviction / naya cache) to
+# time-based value se shuru hota hai, taaki purani keys kabhi wapas match na hon.
+#
+# Bump do baar hota hai: save/delete ke turant baad (isi transaction ke reads
+# ke liye) aur commit ke baad (beech me kisi ne purana data cache kiya ho to
+# wo bhi discard ho jaye).
+
+VERSION_PREFIX = 'v'
+
+# in models ke save/delete par version bump hota hai (signals.py)
+TRACKED_MODELS = (
+    Topic, ProjectGroup, GroupMember, Submission, CustomUser, Rubric, Criterion, CriterionScore, MemberAdjustment,
+)
+
+_stats_lock = threading.Lock()
+_stats = {}   # name -> [hits, misses]
+
+
+def _version_key(model):
+    return f'{VERSION_PREFIX}:{model._meta.label_lower}'
+
+
+def _initial_version():
+    return time.time_ns() // 1000
+
+
+def model_versions(models):
+    keys = [_version_key(m) for m in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _initial_version(), timeout=None)
+            versions[key] = cache.get(key, 0)
+    return [versions[key] for key in keys]
+
+
+def bump(*models):
+    for model in models:
+        key = _version_key(model)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), timeout=None)
+
+
+def bump_on_commit(*models):
+    bump(*models)
+    transaction.on_commit(lambda: bump(*models))
+
+
+def cache_key(name, parts=(), depends=()):
+    versions = '.'.join(str(v) for v in model_versions(depends))
+    suffix = ':'.join(str(p) for p in parts)
+    return f'{name}:{suffix}:{versions}'
+
+
+def _count(name, hit):
+    with _stats_lock:
+        counter = _stats.setdefault(name, [0, 0])
+        counter[0 if hit else 1] += 1
+
+
+def cached(name, parts, depends, compute, timeout=None):
+    """
+    ``compute()`` ka result cache se do, ya compute karke rakh do.
+    ``depends`` wo models hain jinke save/delete par ye value invalid honi chahiye.
+    ``None`` result cache nahi hota.
+    """
+    key = cache_key(name, parts, depends)
+    value = cache.get(key)
+    if value is not None:
+        _count(name, True)
+        return value
+    _count(name, False)
+    value = compute()
+    if value is not None:
+        cache.set(key, value, timeout)
+    return value
+
+
+def cache_stats():
+    """Is process ke hit/miss counters, naam ke hisaab se aur total."""
+    with _stats_lock:
+        per_name = {name: {'hits': h, 'misses': m} for name, (h, m) in _stats.items()}
+    hits = sum(v['hits'] for v in per_name.values())
+    misses = sum(v['misses'] for v in per_name.values())
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+        'caches': per_name,
+    }
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
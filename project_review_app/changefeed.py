@@ -0,0 +1,193 @@
+import base64
+import heapq
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .api import RESOURCES
+from .models import CustomUser, ProjectGroup, Topic, Tombstone
+
+
+# --------------------
+# Change feed
+# --------------------
+# Downstream sync ko poora DB nightly pull nahi karna pade: har core model ka
+# ``updated_at`` (indexed) aur deletes ke liye ``Tombstone`` table milkar ek
+# ordered stream banate hain. Order key ``(timestamp, resource, id)`` hai aur
+# cursor bhi yahi key encode karta hai, isliye same timestamp wale bulk updates
+# bhi pages ke beech skip ya repeat nahi hote.
+#
+# ``updated_at`` save ke waqt lagta hai, commit ke waqt nahi: lambi transaction
+# ka row apne se naye row ke baad commit ho sakta hai. Isliye feed sirf
+# ``CHANGE_FEED_SETTLE_SECONDS`` se purane changes deta hai (cursor is horizon
+# se aage nahi jata); isse lambi transactions hi late commit ho sakti hain.
+#
+# Feed user ke hisaab se scoped hai — wahi rows jo list/detail API deti hai.
+# Deletes ke liye tombstone par delete ke waqt ke owners save hote hain.
+
+DELETED = '~deleted'
+
+# resource -> created timestamp field (insert vs update decide karne ke liye)
+CREATED_FIELDS = {
+    'students': 'date_joined',
+    'teachers': 'date_joined',
+    'topics': 'created_at',
+    'groups': 'created_at',
+    'members': 'joined_at',
+    'submissions': 'submitted_at',
+    'queries': 'created_at',
+}
+
+ROLE_RESOURCES = {'student': 'students', 'teacher': 'teachers'}
+
+MODEL_RESOURCES = {
+    'Topic': 'topics',
+    'ProjectGroup': 'groups',
+    'GroupMember': 'members',
+    'Submission': 'submissions',
+    'Query': 'queries',
+}
+
+
+def encode_cursor(key):
+    ts, resource, pk = key
+    raw = json.dumps([ts.isoformat(), resource, pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        ts, resource, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        ts = parse_datetime(ts)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if ts is None:
+        raise ValueError("Invalid cursor")
+    return ts, resource, int(pk)
+
+
+def _after(field, resource, cursor):
+    """Keyset condition: rows whose (field, resource, pk) key is after the cursor."""
+    if cursor is None:
+        return Q()
+    ts, cursor_resource, cursor_pk = cursor
+    if resource > cursor_resource:
+        return Q(**{f'{field}__gte': ts})
+    if resource == cursor_resource:
+        return Q(**{f'{field}__gt': ts}) | Q(**{field: ts, 'pk__gt': cursor_pk})
+    return Q(**{f'{field}__gt': ts})
+
+
+def settle_horizon(now=None):
+    seconds = getattr(settings, 'CHANGE_FEED_SETTLE_SECONDS', 30)
+    return (now or timezone.now()) - timedelta(seconds=seconds)
+
+
+def _upserts(resource_name, cursor, limit, user, horizon):
+    resource = RESOURCES[resource_name]
+    fields = resource.default_fields
+    created_field = CREATED_FIELDS[resource_name]
+    qs = (
+        resource.scoped(user)
+        .filter(_after('updated_at', resource_name, cursor), updated_at__lte=horizon)
+        .order_by('updated_at', 'pk')[:limit]
+    )
+    for obj in qs:
+        created = getattr(obj, created_field)
+        op = 'insert' if cursor is None or created > cursor[0] else 'update'
+        yield (obj.updated_at, resource_name, obj.pk), {
+            'op': op,
+            'resource': resource_name,
+            'id': obj.pk,
+            'at': obj.updated_at,
+            'data': resource.serialize(obj, fields),
+        }
+
+
+def _deletes(cursor, limit, user, horizon):
+    qs = Tombstone.objects.all() if user is None else Tombstone.objects.for_user(user)
+    qs = (
+        qs.filter(_after('deleted_at', DELETED, cursor), deleted_at__lte=horizon)
+        .order_by('deleted_at', 'pk')[:limit]
+    )
+    for tomb in qs:
+        yield (tomb.deleted_at, DELETED, tomb.pk), {
+            'op': 'delete',
+            'resource': tomb.resource,
+            'id': tomb.object_id,
+            'at': tomb.deleted_at,
+        }
+
+
+def changes_since(cursor=None, limit=500, user=None):
+    """
+    ``cursor`` ke baad ke ``limit`` tak changes (inserts/updates/deletes) order me
+    return karta hai, saath me agla cursor. Har source se sirf ``limit`` rows
+    aati hain (indexed range scan) aur heap merge se final order banta hai.
+    ``user`` ho to sirf uske scope ke changes; ``None`` = poora feed (commands).
+    """
+    decoded = decode_cursor(cursor) if cursor else None
+    horizon = settle_horizon()
+    streams = [_upserts(name, decoded, limit, user, horizon) for name in CREATED_FIELDS]
+    streams.append(_deletes(decoded, limit, user, horizon))
+
+    events = []
+    last_key = decoded
+    for key, event in heapq.merge(*streams, key=lambda item: item[0]):
+        events.append(event)
+        last_key = key
+        if len(events) >= limit:
+            break
+
+    next_cursor = encode_cursor(last_key) if last_key else cursor
+    return events, next_cursor
+
+
+def iter_pages(cursor=None, page_size=500):
+    """Saare pending changes pages me stream karta hai; ``(events, cursor)`` yield hota hai."""
+    while True:
+        events, cursor = changes_since(cursor, page_size)
+        if events:
+            yield events, cursor
+        if len(events) < page_size:
+            return
+
+
+def tombstone_resource(instance):
+    """Deleted instance kis feed resource ka tha (admins feed me nahi hain)."""
+    if isinstance(instance, CustomUser):
+        return ROLE_RESOURCES.get(instance.role)
+    return MODEL_RESOURCES.get(type(instance).__name__)
+
+
+def group_owners(group_ids):
+    """``{group_id: (teacher_id, topic_owner_id)}`` — group-owned tombstones ka scope."""
+    return {
+        pk: (teacher_id, topic_owner_id)
+        for pk, teacher_id, topic_owner_id in ProjectGroup.objects.filter(pk__in=group_ids)
+        .values_list('pk', 'teacher_id', 'topic__created_by_id')
+    }
+
+
+def tombstone_owners(instance):
+    """
+    Delete ke waqt ``(teacher_id, topic_owner_id)``, wahi relations jin par
+    ``for_teacher`` scope lagta hai. Cascade me children parent se pehle delete
+    hote hain, to group abhi mil jata hai.
+    """
+    if isinstance(instance, Topic):
+        return instance.teacher_id, instance.created_by_id
+    if isinstance(instance, ProjectGroup):
+        topic_owner_id = None
+        if instance.topic_id:
+            topic_owner_id = Topic.objects.filter(pk=instance.topic_id).values_list('created_by_id', flat=True).first()
+        return instance.teacher_id, topic_owner_id
+    group_id = getattr(instance, 'group_id', None)
+    if group_id is None:
+        return None, None
+    return group_owners([group_id]).get(group_id, (None, None))
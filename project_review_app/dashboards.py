@@ -0,0 +1,67 @@
+from django.db.models import Count, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import CustomUser, GroupMember, GroupSummary, Query, QueryReadMarker, Submission, Topic
+
+
+# --------------------
+# Role router + dashboard preloading
+# --------------------
+# Login ke baad user seedha apne dashboard par jata hai (``home`` par ek aur
+# redirect nahi), aur har dashboard apna saara data ek hi query me laata hai:
+# counts scalar subqueries hain, group details ``GroupSummary`` projection se.
+
+def dashboard_for(user):
+    """User ke role ka dashboard (URL name). Superuser / admin -> admin dashboard."""
+    if user.is_superuser or user.role == 'admin':
+        return 'dashboard'
+    if user.role == 'teacher':
+        return 'teacher_dashboard'
+    return 'student_dashboard'
+
+
+def _scalar(qs, aggregate):
+    # ``(SELECT <aggregate> FROM ...)`` — bade SELECT ka ek column; khali ho to 0
+    return Coalesce(Subquery(qs.order_by().annotate(_g=Value(1)).values('_g').annotate(v=aggregate).values('v')), 0)
+
+
+def admin_overview():
+    return CustomUser.objects.aggregate(
+        total_teachers=Count('pk', filter=Q(role='teacher')),
+        total_students=Count('pk', filter=Q(role='student')),
+        total_admins=Count('pk', filter=Q(role='admin')),
+    )
+
+
+def teacher_overview(teacher):
+    # groups aur pending reviews summary table se
+    summaries = GroupSummary.objects.filter(group__topic__created_by=teacher)
+    return CustomUser.objects.filter(pk=teacher.pk).values(
+        students_count=_scalar(CustomUser.objects.filter(role='student'), Count('pk')),
+        topics_count=_scalar(Topic.objects.filter(created_by=teacher), Count('pk')),
+        groups_count=_scalar(summaries, Count('pk')),
+        pending_reviews_count=_scalar(summaries, Sum('pending_count')),
+    ).get()
+
+
+def student_overview(student):
+    """
+    Student ki memberships — group, topic/teacher naam, latest submission
+    status (``group.summary``), apni submissions ki count aur unread messages
+    ke saath — ek query me.
+    """
+    marker = QueryReadMarker.objects.filter(user=student, group_id=OuterRef('group_id')).values('last_read_id')[:1]
+    unread = (
+        Query.objects.filter(group_id=OuterRef('group_id'), id__gt=Coalesce(Subquery(marker), Value(0)))
+        .exclude(author=student)
+    )
+    submissions = Submission.objects.filter(group_id=OuterRef('group_id'))
+    return list(
+        GroupMember.objects.filter(student=student)
+        .select_related('group__summary')
+        .annotate(
+            unread=_scalar(unread, Count('pk')),
+            submissions_count=_scalar(submissions, Count('pk')),
+        )
+        .order_by('joined_at', 'pk')
+    )
@@ -0,0 +1,54 @@
+"""
+Winnowing fingerprints (Schleimer, Wilkerson, Aiken) — similarity check ke liye.
+
+``inspection`` ki tarah isme bhi Django import nahi hota; inspection pool ke
+workers ise seedha chalate hain. Text lowercase tokens me tootta hai, har
+``K`` consecutive tokens (shingle) ka 64-bit hash banta hai, aur har ``WINDOW``
+hashes ki window ka minimum fingerprint ban jata hai. Do documents me ``K + WINDOW - 1``
+tokens jitna bhi common text ho to kam se kam ek fingerprint zaroor common hota hai.
+"""
+import hashlib
+import re
+
+K = 5
+WINDOW = 4
+MAX_FINGERPRINTS = 4000
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def _hash(shingle):
+    # signed 64-bit, taaki BigIntegerField me seedha jaye
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big', signed=True)
+
+
+def winnow(hashes, window=WINDOW):
+    """Har window ka rightmost minimum; agli window me wahi position ho to dobara nahi."""
+    if not hashes:
+        return []
+    if len(hashes) <= window:
+        return [min(hashes)]
+    selected = []
+    last = -1
+    for start in range(len(hashes) - window + 1):
+        best = start
+        for i in range(start + 1, start + window):
+            if hashes[i] <= hashes[best]:
+                best = i
+        if best != last:
+            selected.append(hashes[best])
+            last = best
+    return selected
+
+
+def fingerprint(text, k=K, window=WINDOW, limit=MAX_FINGERPRINTS):
+    """
+    Text ke unique fingerprints (sorted). ``limit`` se zyada hon to sabse chhote
+    hashes rakhe jate hain — har document par same rule, to bade documents ka
+    sample bhi aapas me comparable rehta hai.
+    """
+    tokens = TOKEN_RE.findall(text.lower())
+    if len(tokens) < k:
+        return []
+    hashes = [_hash(' '.join(tokens[i:i + k])) for i in range(len(tokens) - k + 1)]
+    return sorted(set(winnow(hashes, window)))[:limit]
@@ -1,17 +1,83 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 
-from .models import CustomUser, Submission, Topic, ProjectGroup, Query
+from .models import TOPIC_HAS_SEATS, Criterion, CustomUser, Milestone, Rubric, Submission, Topic, ProjectGroup, Query
 
 User = get_user_model()
 
 
+# --------------------
+# Unique fields: DB constraint hi guard hai
+# --------------------
+# Pehle har form save se pehle ``exists()`` query se email/username check karta
+# tha — ek extra round trip, aur do parallel signups dono check pass karke
+# ek ko 500 dete the. Ab pre-check nahi hota: save par DB ka unique constraint
+# fail ho to ``IntegrityError`` ko field error bana dete hain.
+
+# (field, constraint ke columns, named constraint, message). Match exact hota
+# hai: SQLite "UNIQUE constraint failed: <table>.<col>, ..." me columns deta
+# hai, Postgres ``diag.constraint_name`` me constraint ka naam. Baaki sab
+# IntegrityErrors (check constraints, FKs, doosre tables) caller ko wapas raise.
+UNIQUE_ERRORS = (
+    ('roll_no', ('semester', 'division', 'roll_no'), 'student_roll_no_uniq',
+     "A student with this roll number already exists in this semester and division."),
+    ('email', ('email',), None, "An account with this email already exists."),
+    ('username', ('username',), None, "This username is already taken."),
+)
+SQLITE_UNIQUE_PREFIX = 'UNIQUE constraint failed: '
+
+
+def _field_constraint(name, table, column):
+    # unique=True: CREATE TABLE me inline "<table>_<col>_key", AlterField se "<table>_<col>_<hash>_uniq"
+    return name == f'{table}_{column}_key' or (name.startswith(f'{table}_{column}_') and name.endswith('_uniq'))
+
+
+def unique_error(exc):
+    """``IntegrityError`` -> ``(field, message)``; ``UNIQUE_ERRORS`` wala violation na ho to ``None``."""
+    table = CustomUser._meta.db_table
+    message = str(exc)
+    if message.startswith(SQLITE_UNIQUE_PREFIX):
+        columns = tuple(c.strip() for c in message[len(SQLITE_UNIQUE_PREFIX):].split(','))
+        for field, unique_columns, _, error in UNIQUE_ERRORS:
+            if columns == tuple(f'{table}.{c}' for c in unique_columns):
+                return field, error
+        return None
+    name = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None)
+    if not name:
+        return None
+    for field, unique_columns, constraint, error in UNIQUE_ERRORS:
+        if name == constraint or (constraint is None and _field_constraint(name, table, unique_columns[0])):
+            return field, error
+    return None
+
+
+class UniqueByDatabaseMixin:
+    def validate_unique(self):
+        # ModelForm ka exists() pre-check band; save_or_error dekhta hai
+        pass
+
+    def save_or_error(self):
+        """Save karo; unique constraint fail ho to form error add karke ``None``."""
+        try:
+            with transaction.atomic():
+                return self.save()
+        except IntegrityError as exc:
+            found = unique_error(exc)
+            if found is None:
+                raise
+            field, error = found
+            self.add_error(field if field in self.fields else None, error)
+            return None
+
+
 # --------------------
 # Signup Form Students 
 # --------------------
 
-class StudentSignUpForm(UserCreationForm):
+class StudentSignUpForm(UniqueByDatabaseMixin, UserCreationForm):
     class Meta:
         model = CustomUser
         fields = (
@@ -35,6 +101,15 @@ class StudentSignUpForm(UserCreationForm):
             user.save()
         return user
 
+    def clean_username(self):
+        # UserCreationForm yahan case-insensitive exists() query karta hai; exact
+        # uniqueness DB constraint deta hai
+        return self.cleaned_data.get('username')
+
+    def clean_roll_no(self):
+        roll_no = self.cleaned_data.get('roll_no')
+        return roll_no.strip() if roll_no else roll_no
+
     def clean(self):
         cleaned = super().clean()
         if not cleaned.get('division') or not cleaned.get('roll_no') or not cleaned.get('semester'):
@@ -45,7 +120,7 @@ class StudentSignUpForm(UserCreationForm):
 # --------------------
 # Signup Form teachers 
 # --------------------
-class TeacherForm(forms.ModelForm):
+class TeacherForm(UniqueByDatabaseMixin, forms.ModelForm):
     password = forms.CharField(widget=forms.PasswordInput)
 
     class Meta:
@@ -65,7 +140,7 @@ class TeacherForm(forms.ModelForm):
             user.save()
         return user
     
-class AdminStudentForm(forms.ModelForm):
+class AdminStudentForm(UniqueByDatabaseMixin, forms.ModelForm):
     password = forms.CharField(widget=forms.PasswordInput)
 
     class Meta:
@@ -81,7 +156,7 @@ class AdminStudentForm(forms.ModelForm):
         return user
 
 
-class AdminForm(forms.ModelForm):
+class AdminForm(UniqueByDatabaseMixin, forms.ModelForm):
     password = forms.CharField(
         required=True,   # 👈 ab blank nahi chhod sakte
         widget=forms.PasswordInput,
@@ -110,14 +185,14 @@ class AdminForm(forms.ModelForm):
 
 
 # ---------- Teacher Edit Form (Admin ke liye edit/update) ----------
-class TeacherEditForm(forms.ModelForm):
+class TeacherEditForm(UniqueByDatabaseMixin, forms.ModelForm):
     class Meta:
         model = CustomUser
         fields = ("username", "email", "department", "subject")
 
 
 # ---------- Student Edit Form (Admin ke liye edit/update) ----------
-class StudentForm(forms.ModelForm):
+class StudentForm(UniqueByDatabaseMixin, forms.ModelForm):
     class Meta:
         model = CustomUser
         fields = ("username", "email", "roll_no", "semester", "division")
@@ -148,11 +223,41 @@ class SubmissionForm(forms.ModelForm):
 class TopicForm(forms.ModelForm):
     class Meta:
         model = Topic
-        fields = ['title', 'description']
+        fields = ['title', 'description', 'capacity']
         widgets = {
             'title': forms.TextInput(attrs={'class': 'form-control'}),
             'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 4}),
+            'capacity': forms.NumberInput(attrs={'class': 'form-control', 'min': 1}),
         }
+        help_texts = {
+            'capacity': 'How many groups can take this topic. Leave blank for no limit.',
+        }
+
+    def clean_capacity(self):
+        capacity = self.cleaned_data['capacity']
+        if capacity is None:
+            return None
+        if capacity < 1:
+            raise forms.ValidationError("Capacity must be at least 1.")
+        if self.instance.pk and capacity < self.instance.claimed_count:
+            raise forms.ValidationError(
+                f"{self.instance.claimed_count} groups already have this topic."
+            )
+        return capacity
+
+    def save_or_error(self):
+        """
+        Save karo; validation ke baad groups ne itne claims le liye ki capacity
+        kam pad gayi (``topic_claims_within_capacity``) to ``capacity`` par error
+        aur ``None``.
+        """
+        try:
+            with transaction.atomic():
+                return self.save()
+        except IntegrityError:
+            claimed = Topic.objects.values_list('claimed_count', flat=True).get(pk=self.instance.pk)
+            self.add_error('capacity', f"{claimed} groups already have this topic.")
+            return None
 
 # --------------------
 # Group Creation Form
@@ -172,9 +277,91 @@ class GroupForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         user = kwargs.pop('user', None)
         super(GroupForm, self).__init__(*args, **kwargs)
+        self._initial_topic_id = self.instance.topic_id
         if user:
-         
-            self.fields['topic'].queryset = Topic.objects.filter(created_by=user)
+            # sirf jin topics me seat bachi hai (aur group ka current topic)
+            self.fields['topic'].queryset = Topic.objects.filter(created_by=user).filter(
+                TOPIC_HAS_SEATS | Q(pk=self._initial_topic_id)
+            ).only('id', 'title')
+
+    def save(self, commit=True):
+        """
+        Topic seat ``topics.change_topic`` se leta/chhodta hai, taaki
+        ``claimed_count`` sync rahe. Seat na mile to ``TopicUnavailable`` raise hota
+        hai aur kuch save nahi hota; semester badalne se members ka cohort
+        takraye to ``MembershipError``.
+        """
+        from .memberships import MembershipError, sync_semester
+        from .topics import change_topic
+
+        group = super().save(commit=False)
+        if not commit:
+            return group
+        new_topic_id = group.topic_id
+        existing = not group._state.adding
+        save_kwargs = {}
+        if existing:
+            # topic sirf change_topic (compare-and-swap) likhta hai; form ka purana
+            # topic beech me hua claim overwrite na kare
+            save_kwargs['update_fields'] = [
+                f.name for f in group._meta.concrete_fields
+                if not f.primary_key and f.name not in ('topic', 'member_count')
+            ]
+        with transaction.atomic():
+            group.topic_id = self._initial_topic_id
+            try:
+                with transaction.atomic():
+                    group.save(**save_kwargs)
+            except IntegrityError:
+                # group_members_within_max: clean_max_members ke baad koi member juda
+                raise MembershipError("The group already has more members than that.")
+            if existing and 'semester' in self.changed_data:
+                sync_semester(group)
+            change_topic(group, new_topic_id, self._initial_topic_id)
+        return group
+
+    def clean_max_members(self):
+        max_members = self.cleaned_data['max_members']
+        if max_members < self.instance.member_count:
+            raise forms.ValidationError(
+                f"The group already has {self.instance.member_count} members; remove some first."
+            )
+        return max_members
+
+
+# --------------------
+# Milestone Form
+# --------------------
+class MilestoneForm(forms.ModelForm):
+    class Meta:
+        model = Milestone
+        fields = ['title', 'group', 'semester', 'division', 'opens_at', 'closes_at']
+        widgets = {
+            'title': forms.TextInput(attrs={'class': 'form-control'}),
+            'group': forms.Select(attrs={'class': 'form-control'}),
+            'semester': forms.Select(attrs={'class': 'form-control'}),
+            'division': forms.Select(attrs={'class': 'form-control'}),
+            'opens_at': forms.DateTimeInput(attrs={'class': 'form-control', 'type': 'datetime-local'}, format='%Y-%m-%dT%H:%M'),
+            'closes_at': forms.DateTimeInput(attrs={'class': 'form-control', 'type': 'datetime-local'}, format='%Y-%m-%dT%H:%M'),
+        }
+        help_texts = {
+            'group': 'Leave empty to apply the window to a whole semester/division.',
+        }
+
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        if user:
+            self.fields['group'].queryset = ProjectGroup.objects.filter(teacher=user)
+
+    def clean(self):
+        cleaned = super().clean()
+        opens_at, closes_at = cleaned.get('opens_at'), cleaned.get('closes_at')
+        if opens_at and closes_at and closes_at <= opens_at:
+            raise forms.ValidationError("Closing time must be after opening time.")
+        if not cleaned.get('group') and not cleaned.get('semester'):
+            raise forms.ValidationError("Choose a group or a semester.")
+        return cleaned
 
 
 # --------------------
@@ -204,3 +391,74 @@ class QueryForm(forms.ModelForm):
         widgets = {
             'message': forms.Textarea(attrs={'class': 'form-control', 'rows': 4}),
         }
+
+
+# --------------------
+# Rubric Forms
+# --------------------
+class RubricForm(forms.ModelForm):
+    class Meta:
+        model = Rubric
+        fields = ['name', 'topic', 'semester', 'division']
+        widgets = {
+            'name': forms.TextInput(attrs={'class': 'form-control'}),
+            'topic': forms.Select(attrs={'class': 'form-control'}),
+            'semester': forms.Select(attrs={'class': 'form-control'}),
+            'division': forms.Select(attrs={'class': 'form-control'}),
+        }
+        help_texts = {
+            'topic': 'Leave empty to use the rubric for a whole semester/division.',
+        }
+
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        if user:
+            self.fields['topic'].queryset = Topic.objects.filter(created_by=user)
+
+    def clean(self):
+        cleaned = super().clean()
+        if not cleaned.get('topic') and not cleaned.get('semester'):
+            raise forms.ValidationError("Choose a topic or a semester.")
+        return cleaned
+
+
+CriterionFormSet = forms.inlineformset_factory(
+    Rubric, Criterion,
+    fields=['name', 'weight', 'max_score', 'position'],
+    widgets={
+        'name': forms.TextInput(attrs={'class': 'form-control'}),
+        'weight': forms.NumberInput(attrs={'class': 'form-control', 'min': 0}),
+        'max_score': forms.NumberInput(attrs={'class': 'form-control', 'min': 1}),
+        'position': forms.NumberInput(attrs={'class': 'form-control', 'min': 0}),
+    },
+    extra=3,
+    can_delete=True,
+)
+
+
+class ScoreForm(forms.Form):
+    """Rubric ke har criterion ka ek optional field (``criterion_<id>``)."""
+
+    def __init__(self, *args, criteria=(), scores=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        scores = scores or {}
+        self.criteria = list(criteria)
+        for criterion in self.criteria:
+            self.fields[f'criterion_{criterion.pk}'] = forms.FloatField(
+                label=f"{criterion.name} (/{criterion.max_score}, weight {criterion.weight})",
+                required=False,
+                min_value=0,
+                max_value=criterion.max_score,
+                initial=scores.get(criterion.pk),
+                widget=forms.NumberInput(attrs={'class': 'form-control', 'step': 'any'}),
+            )
+
+    def values(self):
+        return {c.pk: self.cleaned_data.get(f'criterion_{c.pk}') for c in self.criteria}
+
+
+class AdjustmentForm(forms.Form):
+    student = forms.IntegerField(widget=forms.HiddenInput)
+    delta = forms.FloatField(min_value=-100, max_value=100)
+    reason = forms.CharField(max_length=255, required=False)
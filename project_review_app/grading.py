@@ -0,0 +1,214 @@
+import csv
+
+from django.db import transaction
+from django.db.models import F, FloatField, Q, Sum
+
+from . import audit
+from .caching import bump_on_commit, cached
+from .models import (
+    AuditEntry, Criterion, CriterionScore, CustomUser, GroupMember, MemberAdjustment, ProjectGroup, Rubric,
+    Submission,
+)
+
+
+# --------------------
+# Rubric grading engine
+# --------------------
+# Group ka total = sum(weight * score / max_score) / sum(weight) * 100, us
+# group ki sabse nayi scored submission par (rubric ke jo criteria score nahi
+# hue wo 0 gine jate hain). Member ka final = total + uski adjustment, 0-100
+# me clamp. Poore cohort ke marks ek pass me bante hain: per-submission
+# weighted sum DB me ``GROUP BY`` aggregate hai, aur baaki (groups, rubrics,
+# members, adjustments) ek-ek query — cohort kitna bhi bada ho, 5 queries.
+# Result versioned cache me rehta hai; koi score/adjustment/rubric badle to
+# version bump se apne aap invalid.
+
+GRADE_COLUMNS = ('group_id', 'student_id', 'roll_no', 'student', 'group', 'rubric', 'group_total', 'adjustment', 'final')
+GRADING_DEPENDS = (
+    ProjectGroup, GroupMember, CustomUser, Submission, Rubric, Criterion, CriterionScore, MemberAdjustment,
+)
+
+
+def _rubric_key(teacher_id, topic_id, semester, division):
+    if topic_id:
+        return ('topic', teacher_id, topic_id)
+    return ('cohort', teacher_id, semester, division or None)
+
+
+def _rubric_index(rubrics):
+    """``(created_by, topic/cohort)`` -> rubric; ek jagah do hon to naya wala."""
+    index = {}
+    for rubric in sorted(rubrics, key=lambda r: r.pk):
+        index[_rubric_key(rubric.created_by_id, rubric.topic_id, rubric.semester, rubric.division)] = rubric
+    return index
+
+
+def _resolve(index, teacher_id, topic_id, semester, division):
+    # topic ka rubric > semester+division ka > poore semester ka
+    return (
+        (topic_id and index.get(_rubric_key(teacher_id, topic_id, None, None)))
+        or index.get(_rubric_key(teacher_id, None, semester, division))
+        or index.get(_rubric_key(teacher_id, None, semester, None))
+    )
+
+
+def rubric_for(group):
+    """Group par lagne wala rubric (criteria prefetched), ya ``None``."""
+    if not group.topic_id and not group.semester:
+        return None
+    match = Q(topic_id=group.topic_id) if group.topic_id else Q(pk__in=[])
+    if group.semester:
+        match |= Q(topic__isnull=True, semester=group.semester)
+    candidates = Rubric.objects.filter(match, created_by_id=group.teacher_id).prefetch_related('criteria')
+    return _resolve(_rubric_index(candidates), group.teacher_id, group.topic_id, group.semester, group.division)
+
+
+def compute_grades(groups):
+    """``groups`` (ProjectGroup queryset) ke har member ki ek row, ``GRADE_COLUMNS`` order me."""
+    group_rows = list(
+        groups.order_by('semester', 'division', 'name', 'pk')
+        .values_list('pk', 'name', 'teacher_id', 'topic_id', 'semester', 'division')
+    )
+    if not group_rows:
+        return []
+    group_ids = groups.values('pk')
+
+    rubrics = Rubric.objects.filter(created_by_id__in={row[2] for row in group_rows}).annotate(
+        total_weight=Sum('criteria__weight')
+    )
+    index = _rubric_index(rubrics)
+    rubric_of = {gid: _resolve(index, teacher, topic, sem, div) for gid, _, teacher, topic, sem, div in group_rows}
+
+    # (submission, rubric) ka weighted sum — ek GROUP BY, Python me per-score loop nahi
+    points = (
+        CriterionScore.objects.filter(submission__group_id__in=group_ids)
+        .values('submission_id', 'submission__group_id', 'submission__submitted_at', 'criterion__rubric_id')
+        .annotate(points=Sum(F('score') * F('criterion__weight') / F('criterion__max_score'), output_field=FloatField()))
+    )
+    latest = {}
+    for row in points:
+        gid = row['submission__group_id']
+        rubric = rubric_of.get(gid)
+        if rubric is None or row['criterion__rubric_id'] != rubric.pk:
+            continue
+        key = (row['submission__submitted_at'], row['submission_id'])
+        if gid not in latest or key > latest[gid][0]:
+            latest[gid] = (key, row['points'])
+
+    totals = {}
+    for gid, (_, value) in latest.items():
+        weight = rubric_of[gid].total_weight
+        if weight:
+            totals[gid] = round(100 * value / weight, 2)
+
+    adjustments = dict(
+        ((gid, sid), delta) for gid, sid, delta in
+        MemberAdjustment.objects.filter(group_id__in=group_ids).values_list('group_id', 'student_id', 'delta')
+    )
+    members = {}
+    for gid, sid, username, roll_no in (
+        GroupMember.objects.filter(group_id__in=group_ids)
+        .order_by('student__roll_no', 'student_id')
+        .values_list('group_id', 'student_id', 'student__username', 'student__roll_no')
+    ):
+        members.setdefault(gid, []).append((sid, username, roll_no))
+
+    rows = []
+    for gid, name, *_ in group_rows:
+        rubric = rubric_of[gid]
+        total = totals.get(gid)
+        for sid, username, roll_no in members.get(gid, ()):
+            delta = adjustments.get((gid, sid), 0)
+            final = None if total is None else round(min(max(total + delta, 0), 100), 2)
+            rows.append((gid, sid, roll_no or '', username, name, rubric.name if rubric else '', total, delta, final))
+    return rows
+
+
+def cohort_grades(teacher, semester=None, division=None):
+    groups = ProjectGroup.objects.filter(teacher=teacher)
+    if semester:
+        groups = groups.filter(semester=semester)
+    if division:
+        groups = groups.filter(division=division)
+    return cached(
+        'cohort_grades', [teacher.pk, semester or '', division or ''], GRADING_DEPENDS,
+        lambda: compute_grades(groups),
+    )
+
+
+# --------------------
+# Writes
+# --------------------
+def save_scores(submission, rubric, values, actor=None):
+    """
+    ``values``: ``{criterion_id: score}``; ``None`` score hata deta hai.
+    Range galat ho ya criterion rubric ka na ho to ``ValueError``. Badle gaye
+    criteria ki count return hoti hai.
+    """
+    criteria = {c.pk: c for c in rubric.criteria.all()}
+    for cid, score in values.items():
+        if cid not in criteria:
+            raise ValueError("Unknown criterion")
+        if score is not None and not 0 <= score <= criteria[cid].max_score:
+            raise ValueError(f"{criteria[cid].name}: score must be between 0 and {criteria[cid].max_score}.")
+
+    old = dict(
+        CriterionScore.objects.filter(submission=submission, criterion_id__in=criteria)
+        .values_list('criterion_id', 'score')
+    )
+    changed = {cid: score for cid, score in values.items() if old.get(cid) != score}
+    if not changed:
+        return 0
+    upserts = [
+        CriterionScore(submission=submission, criterion_id=cid, score=score)
+        for cid, score in changed.items() if score is not None
+    ]
+    cleared = [cid for cid, score in changed.items() if score is None]
+    with transaction.atomic():
+        if upserts:
+            CriterionScore.objects.bulk_create(
+                upserts, update_conflicts=True,
+                unique_fields=['submission', 'criterion'], update_fields=['score', 'updated_at'],
+            )
+        if cleared:
+            CriterionScore.objects.filter(submission=submission, criterion_id__in=cleared).delete()
+        # bulk_create signals nahi bhejta — cache version aur audit yahin
+        bump_on_commit(CriterionScore)
+        audit.record_raw(
+            AuditEntry.ACTION_UPDATE, Submission, submission.pk,
+            {f'score:{criteria[cid].name}': [old.get(cid), score] for cid, score in changed.items()},
+            str(submission.file.name or ''), actor,
+        )
+    return len(changed)
+
+
+def set_adjustment(group, student_id, delta, reason=''):
+    """Member ki adjustment set karo; 0 (bina reason) ho to hata do."""
+    if not GroupMember.objects.filter(group=group, student_id=student_id).exists():
+        raise ValueError("Student is not a member of this group.")
+    if not -100 <= delta <= 100:
+        raise ValueError("Adjustment must be between -100 and 100.")
+    if delta == 0 and not reason:
+        for adjustment in MemberAdjustment.objects.filter(group=group, student_id=student_id):
+            adjustment.delete()
+        return None
+    adjustment, _ = MemberAdjustment.objects.update_or_create(
+        group=group, student_id=student_id, defaults={'delta': delta, 'reason': reason},
+    )
+    return adjustment
+
+
+# --------------------
+# CSV export
+# --------------------
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    """CSV lines ka generator — ``StreamingHttpResponse`` ke liye, poori file memory me nahi banti."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(GRADE_COLUMNS)
+    for row in rows:
+        yield writer.writerow(['' if value is None else value for value in row])
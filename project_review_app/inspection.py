@@ -0,0 +1,267 @@
+"""
+Submission file inspection — worker processes me chalta hai.
+
+Is module me Django import nahi hota, taaki process pool ke (spawn) workers
+ise bina ``django.setup()`` ke import kar saken. Archives extract nahi hote:
+ZIP ka central directory padha jata hai aur TAR stream mode (``r|*``) me ek
+baar sequentially padha jata hai, isliye memory archive size se bounded rehti hai.
+"""
+import os
+import re
+import tarfile
+import zipfile
+import zlib
+
+from .fingerprints import fingerprint
+
+MAX_ENTRIES = 2000
+PREVIEW_BYTES = 4096
+PDF_SCAN_CHUNK = 256 * 1024
+
+README_RE = re.compile(r'(^|/)readme(\.(md|txt|rst))?$', re.IGNORECASE)
+TEXT_EXTENSIONS = {'.txt', '.md', '.rst', '.py', '.java', '.c', '.cpp', '.js', '.html', '.css', '.json', '.csv'}
+PDF_PAGE_RE = re.compile(rb'/Type\s*/Page(?!s)')
+
+# similarity ke liye text: itna hi padhte hain (bade archives par bhi bounded)
+MAX_TEXT_CHARS = 1_000_000
+MAX_TEXT_FILE_BYTES = 512 * 1024
+MAX_PDF_BYTES = 20 * 1024 * 1024
+# zip bomb jaisi FlateDecode streams: har stream ka raw aur inflate hua size, aur
+# poore document ka inflate hua total bounded
+MAX_PDF_STREAM_BYTES = 4 * 1024 * 1024
+MAX_PDF_INFLATED_STREAM = 4 * 1024 * 1024
+MAX_PDF_INFLATED_TOTAL = 16 * 1024 * 1024
+PDF_STREAM_START_RE = re.compile(rb'(?<!end)stream\r?\n')
+PDF_STREAM_END_RE = re.compile(rb'\r?\nendstream')
+PDF_STREAM_END_TAIL = len(b'\r\nendstream')
+PDF_TEXT_RE = re.compile(rb'\((?:\\.|[^\\)])*\)\s*(?:Tj|\')|\[(?:[^\]]*)\]\s*TJ')
+PDF_STRING_RE = re.compile(rb'\(((?:\\.|[^\\)])*)\)')
+PDF_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'(': b'(', b')': b')', b'\\': b'\\'}
+
+
+def _preview_text(raw):
+    return raw.decode('utf-8', errors='replace')
+
+
+def _pdf_summary(fileobj):
+    """PDF ke pages chunk by chunk gin lo (poora file memory me nahi aata)."""
+    pages = 0
+    tail = b''
+    while True:
+        chunk = fileobj.read(PDF_SCAN_CHUNK)
+        if not chunk:
+            break
+        data = tail + chunk
+        pages += len(PDF_PAGE_RE.findall(data))
+        # boundary par kata hua marker dobara na gina jaye
+        tail = data[-16:]
+        pages -= len(PDF_PAGE_RE.findall(tail))
+    pages += len(PDF_PAGE_RE.findall(tail))
+    return {'pages': pages}
+
+
+class _Manifest:
+    def __init__(self, kind):
+        self.kind = kind
+        self.entries = []
+        self.file_count = 0
+        self.total_size = 0
+        self.truncated = False
+        self.preview_name = ''
+        self.preview_text = ''
+        self.pdf = None
+
+    def add(self, name, size):
+        self.file_count += 1
+        self.total_size += size
+        if len(self.entries) < MAX_ENTRIES:
+            self.entries.append({'name': name, 'size': size})
+        else:
+            self.truncated = True
+
+    def wants_preview(self, name):
+        return not self.preview_name and README_RE.search(name)
+
+    def as_dict(self):
+        return {
+            'kind': self.kind,
+            'file_count': self.file_count,
+            'total_size': self.total_size,
+            'entries': self.entries,
+            'truncated': self.truncated,
+            'preview_name': self.preview_name,
+            'preview_text': self.preview_text,
+            'pdf': self.pdf,
+        }
+
+
+def _inspect_zip(path):
+    manifest = _Manifest('zip')
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            manifest.add(info.filename, info.file_size)
+            if manifest.wants_preview(info.filename):
+                with zf.open(info) as member:
+                    manifest.preview_name = info.filename
+                    manifest.preview_text = _preview_text(member.read(PREVIEW_BYTES))
+            elif manifest.pdf is None and info.filename.lower().endswith('.pdf'):
+                with zf.open(info) as member:
+                    manifest.pdf = {'name': info.filename, **_pdf_summary(member)}
+    return manifest
+
+
+def _inspect_tar(path):
+    manifest = _Manifest('tar')
+    with tarfile.open(path, mode='r|*') as tf:
+        for member in tf:
+            if not member.isfile():
+                continue
+            manifest.add(member.name, member.size)
+            if manifest.wants_preview(member.name):
+                manifest.preview_name = member.name
+                manifest.preview_text = _preview_text(tf.extractfile(member).read(PREVIEW_BYTES))
+            elif manifest.pdf is None and member.name.lower().endswith('.pdf'):
+                manifest.pdf = {'name': member.name, **_pdf_summary(tf.extractfile(member))}
+    return manifest
+
+
+def _inspect_plain(path):
+    manifest = _Manifest('file')
+    name = os.path.basename(path)
+    manifest.add(name, os.path.getsize(path))
+    ext = os.path.splitext(name)[1].lower()
+    with open(path, 'rb') as f:
+        if ext == '.pdf':
+            manifest.pdf = {'name': name, **_pdf_summary(f)}
+        elif ext in TEXT_EXTENSIONS:
+            manifest.preview_name = name
+            manifest.preview_text = _preview_text(f.read(PREVIEW_BYTES))
+    return manifest
+
+
+def inspect_file(path):
+    """File ka manifest dict banata hai (listing, sizes, README/PDF preview)."""
+    if zipfile.is_zipfile(path):
+        return _inspect_zip(path).as_dict()
+    if tarfile.is_tarfile(path):
+        return _inspect_tar(path).as_dict()
+    return _inspect_plain(path).as_dict()
+
+
+# --------------------
+# Text extraction (similarity fingerprints)
+# --------------------
+def _pdf_streams(fileobj, limit=MAX_PDF_BYTES):
+    """
+    PDF ke ``stream ... endstream`` contents, file ko ``PDF_SCAN_CHUNK`` chunks
+    me padh kar (max ``limit`` bytes). Har stream ke pehle
+    ``MAX_PDF_STREAM_BYTES`` hi rakhe jate hain, baaki skip.
+    """
+    buf = b''
+    stream = None
+    kept = 0
+    read = 0
+    while read < limit:
+        chunk = fileobj.read(min(PDF_SCAN_CHUNK, limit - read))
+        if not chunk:
+            break
+        read += len(chunk)
+        buf += chunk
+        while True:
+            if stream is None:
+                match = PDF_STREAM_START_RE.search(buf)
+                if match is None:
+                    # chunk boundary par kata hua ``stream\r\n``
+                    buf = buf[-PDF_STREAM_END_TAIL:]
+                    break
+                buf = buf[match.end():]
+                stream, kept = [], 0
+                continue
+            match = PDF_STREAM_END_RE.search(buf)
+            body = buf[:match.start()] if match else buf[:-PDF_STREAM_END_TAIL]
+            body = body[:MAX_PDF_STREAM_BYTES - kept]
+            stream.append(body)
+            kept += len(body)
+            if match is None:
+                buf = buf[-PDF_STREAM_END_TAIL:]
+                break
+            yield b''.join(stream)
+            buf = buf[match.end():]
+            stream = None
+
+
+def _inflate(raw, max_length):
+    """FlateDecode stream ko max ``max_length`` bytes tak kholo; flate na ho to raw."""
+    try:
+        return zlib.decompressobj().decompress(raw, max_length)
+    except zlib.error:
+        return raw[:max_length]
+
+
+def _pdf_text(fileobj):
+    """
+    PDF ke text operators (``Tj`` / ``TJ``) ki strings — FlateDecode streams
+    zlib se khulte hain (per-stream aur per-document output caps ke saath).
+    Custom font encodings wale PDFs se kuch nahi milta; "jahan possible ho"
+    wala best effort hai.
+    """
+    parts = []
+    budget = MAX_PDF_INFLATED_TOTAL
+    for raw in _pdf_streams(fileobj):
+        stream = _inflate(raw, min(MAX_PDF_INFLATED_STREAM, budget))
+        budget -= len(stream)
+        for op in PDF_TEXT_RE.finditer(stream):
+            for raw_text in PDF_STRING_RE.findall(op.group(0)):
+                parts.append(re.sub(rb'\\(.)', lambda m: PDF_ESCAPES.get(m.group(1), m.group(1)), raw_text))
+            parts.append(b' ')
+        if budget <= 0:
+            break
+    return b''.join(parts).decode('latin-1')
+
+
+def _member_text(name, fileobj):
+    ext = os.path.splitext(name)[1].lower()
+    if ext == '.pdf':
+        return _pdf_text(fileobj)
+    if ext in TEXT_EXTENSIONS:
+        return fileobj.read(MAX_TEXT_FILE_BYTES).decode('utf-8', errors='replace')
+    return ''
+
+
+def _iter_texts(path):
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    with zf.open(info) as member:
+                        yield _member_text(info.filename, member)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path, mode='r|*') as tf:
+            for member in tf:
+                if member.isfile():
+                    yield _member_text(member.name, tf.extractfile(member))
+    else:
+        with open(path, 'rb') as f:
+            yield _member_text(os.path.basename(path), f)
+
+
+def extract_text(path, limit=MAX_TEXT_CHARS):
+    """Source/text files aur PDFs ka text, ``limit`` characters tak."""
+    parts, size = [], 0
+    for text in _iter_texts(path):
+        if not text:
+            continue
+        parts.append(text[:limit - size])
+        size += len(parts[-1])
+        if size >= limit:
+            break
+    return '\n'.join(parts)
+
+
+def analyse_file(path):
+    """Pool task: manifest dict + similarity fingerprints (``fingerprints`` key)."""
+    result = inspect_file(path)
+    result['fingerprints'] = fingerprint(extract_text(path))
+    return result
@@ -0,0 +1,54 @@
+import os
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from project_review_app.archival import (
+    DEFAULT_BATCH_SIZE, archive_groups, default_archive_path, purge_groups, semester_groups,
+)
+
+
+class Command(BaseCommand):
+    help = "Archive a past semester's groups, memberships, submissions, queries and files, then remove them in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--semester', type=int, required=True)
+        parser.add_argument('--division', default=None)
+        parser.add_argument('--before', default=None, help="Only groups created before this date (YYYY-MM-DD).")
+        parser.add_argument('--output-dir', default=None, help="Defaults to settings.ARCHIVE_ROOT.")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--no-files', action='store_true', help="Do not copy uploaded files into the archive.")
+        parser.add_argument('--keep', action='store_true', help="Write the archive but do not delete anything.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many groups would be archived.")
+
+    def handle(self, *args, **options):
+        before = None
+        if options['before']:
+            try:
+                before = timezone.make_aware(datetime.strptime(options['before'], '%Y-%m-%d'))
+            except ValueError:
+                raise CommandError("--before must be YYYY-MM-DD")
+
+        group_ids = list(
+            semester_groups(options['semester'], options['division'], before).values_list('pk', flat=True)
+        )
+        self.stdout.write(f"{len(group_ids)} group(s) selected.")
+        if not group_ids or options['dry_run']:
+            return
+
+        output_dir = options['output_dir'] or getattr(settings, 'ARCHIVE_ROOT', settings.BASE_DIR / 'archives')
+        os.makedirs(output_dir, exist_ok=True)
+        path = default_archive_path(output_dir, options['semester'], options['division'])
+
+        counts = archive_groups(
+            group_ids, path, batch_size=options['batch_size'], include_files=not options['no_files']
+        )
+        summary = ', '.join(f"{label.split('.')[-1]}={n}" for label, n in counts.items())
+        self.stdout.write(f"Archived to {path} ({summary}).")
+
+        if options['keep']:
+            return
+        deleted = purge_groups(group_ids, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Removed {deleted} group(s) from the live database."))
@@ -0,0 +1,26 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from project_review_app.changefeed import iter_pages
+
+
+class Command(BaseCommand):
+    help = "Stream inserts/updates/deletes after a cursor as JSON lines (final cursor goes to stderr)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cursor', default=None, help="Cursor from the previous run (omit for a full export).")
+        parser.add_argument('--page-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        cursor = options['cursor']
+        count = 0
+        try:
+            for events, cursor in iter_pages(cursor, options['page_size']):
+                for event in events:
+                    self.stdout.write(json.dumps(event, cls=DjangoJSONEncoder))
+                count += len(events)
+        except ValueError:
+            raise CommandError("Invalid cursor.")
+        self.stderr.write(f"{count} change(s); next cursor: {cursor or ''}")
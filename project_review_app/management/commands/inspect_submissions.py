@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from project_review_app.models import Submission
+from project_review_app.processing import inspect_submission, shutdown
+
+
+class Command(BaseCommand):
+    help = "Build file manifests and similarity fingerprints for submissions (by default only those without one)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Re-inspect submissions that already have a manifest.")
+        parser.add_argument('--ids', type=int, nargs='*', help="Only these submission ids.")
+        parser.add_argument('--workers', action='store_true', help="Use the process pool instead of inspecting inline.")
+
+    def handle(self, *args, **options):
+        subs = Submission.objects.only('id', 'file').order_by('id')
+        if options['ids']:
+            subs = subs.filter(id__in=options['ids'])
+        if not options['all']:
+            subs = subs.filter(manifest__isnull=True)
+
+        mode = 'process' if options['workers'] else 'sync'
+        count = 0
+        for sub in subs.iterator(chunk_size=200):
+            inspect_submission(sub, mode=mode)
+            count += 1
+        if options['workers']:
+            shutdown(wait=True)
+        self.stdout.write(self.style.SUCCESS(f"Inspected {count} submission(s)."))
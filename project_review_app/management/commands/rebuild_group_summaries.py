@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from project_review_app.summaries import check_consistency, rebuild_all
+
+
+class Command(BaseCommand):
+    help = "Rebuild the GroupSummary projection from live tables, or check it for drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help="Only report mismatches; exit non-zero if any.")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        if options['check']:
+            problems = check_consistency()
+            for group_id, field, stored, live in problems:
+                self.stdout.write(f"group {group_id}: {field} stored={stored!r} live={live!r}")
+            if problems:
+                raise CommandError(f"{len(problems)} summary mismatch(es) found.")
+            self.stdout.write(self.style.SUCCESS("Group summaries are consistent."))
+            return
+
+        count = rebuild_all(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} group summary row(s)."))
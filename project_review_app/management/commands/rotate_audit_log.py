@@ -0,0 +1,43 @@
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from project_review_app.audit import ROTATE_BATCH_SIZE, rotate
+from project_review_app.models import AuditEntry
+
+
+class Command(BaseCommand):
+    help = "Archive audit log entries older than the retention window to gzip JSON Lines, then delete them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=None, help="Keep this many days (defaults to settings.AUDIT_LOG_RETENTION_DAYS).",
+        )
+        parser.add_argument('--output-dir', default=None, help="Defaults to settings.ARCHIVE_ROOT.")
+        parser.add_argument('--batch-size', type=int, default=ROTATE_BATCH_SIZE)
+        parser.add_argument('--no-archive', action='store_true', help="Delete without writing an archive file.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many entries would be rotated.")
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else getattr(settings, 'AUDIT_LOG_RETENTION_DAYS', 365)
+        if days < 0:
+            raise CommandError("--days must be zero or more")
+        cutoff = timezone.now() - timedelta(days=days)
+
+        count = AuditEntry.objects.filter(created_at__lt=cutoff).count()
+        self.stdout.write(f"{count} audit entr{'y' if count == 1 else 'ies'} older than {cutoff:%Y-%m-%d}.")
+        if not count or options['dry_run']:
+            return
+
+        path = None
+        if not options['no_archive']:
+            output_dir = options['output_dir'] or getattr(settings, 'ARCHIVE_ROOT', settings.BASE_DIR / 'archives')
+            os.makedirs(output_dir, exist_ok=True)
+            path = os.path.join(output_dir, f"audit-before-{cutoff:%Y%m%d}.jsonl.gz")
+
+        removed = rotate(cutoff, path, batch_size=options['batch_size'])
+        where = f" (archived to {path})" if path else ""
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} audit entries{where}."))
@@ -0,0 +1,101 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F, OuterRef, Subquery
+
+from .models import CustomUser, GroupMember, ProjectGroup
+
+
+# --------------------
+# Group memberships
+# --------------------
+# Do rules database enforce karta hai, taaki parallel assignments bhi inhe tod
+# na sakein:
+#   - group me ``max_members`` se zyada students nahi: seat ek conditional
+#     ``UPDATE group SET member_count = member_count + 1 WHERE id = ? AND
+#     member_count < max_members`` se milti hai (CheckConstraint bhi hai);
+#     membership delete hote hi signal seat wapas deta hai (cascade bhi).
+#   - ek semester me student ka ek hi group: ``GroupMember.semester`` par
+#     ``(student, semester)`` unique constraint. Isi se student ka current group
+#     ek index lookup hai (``current_membership``), ``.first()`` ka andaza nahi.
+#
+# Members hamesha ``add_member`` / ``set_members`` se banao; seedha
+# ``GroupMember.objects.create`` seat nahi leta.
+
+
+class MembershipError(Exception):
+    """Group full hai ya student is semester me pehle se kisi group me hai."""
+
+
+def cohort_semester(group, student):
+    """Membership ka semester: group ka, warna student ka (dono na hon to ``None``)."""
+    return group.semester if group.semester is not None else student.semester
+
+
+def current_membership(student):
+    """
+    Student ki current semester wali membership (queryset, max ek row). Semester
+    set na ho to sabse nayi membership.
+    """
+    members = GroupMember.objects.filter(student=student)
+    if student.semester is None:
+        return members.order_by('-joined_at', '-pk')
+    return members.filter(semester=student.semester)
+
+
+def add_member(group, student):
+    """Seat lo aur membership banao. Group full ho ya cohort me duplicate ho to ``MembershipError``."""
+    with transaction.atomic():
+        seated = ProjectGroup.objects.filter(pk=group.pk, member_count__lt=F('max_members')).update(
+            member_count=F('member_count') + 1,
+        )
+        if not seated:
+            raise MembershipError(f"{group.name} is full ({group.max_members} members).")
+        try:
+            # savepoint taaki IntegrityError ke baad neeche wali query chal sake;
+            # raise hote hi bahar wala atomic seat ka UPDATE rollback karta hai
+            with transaction.atomic():
+                return GroupMember.objects.create(
+                    group=group, student=student, semester=cohort_semester(group, student),
+                )
+        except IntegrityError:
+            if GroupMember.objects.filter(group=group, student=student).exists():
+                raise MembershipError(f"{student.username} is already in this group.")
+            raise MembershipError(f"{student.username} is already in another group this semester.")
+
+
+def remove_member(member):
+    # seat post_delete signal wapas deta hai (release_seat)
+    member.delete()
+
+
+def release_seat(group_id):
+    ProjectGroup.objects.filter(pk=group_id, member_count__gt=0).update(member_count=F('member_count') - 1)
+
+
+def set_members(group, students):
+    """
+    Group ke members ``students`` jaise karo: jo hate unki membership delete,
+    naye add. Koi bhi add fail ho to kuch nahi badalta (``MembershipError``).
+    """
+    wanted = {student.pk: student for student in students}
+    with transaction.atomic():
+        for member in group.members.exclude(student_id__in=wanted):
+            remove_member(member)
+        existing = set(group.members.values_list('student_id', flat=True))
+        for pk, student in wanted.items():
+            if pk not in existing:
+                add_member(group, student)
+
+
+def sync_semester(group):
+    """
+    Group ka semester badla to members ka cohort bhi. Koi member naye semester
+    me pehle se doosre group me ho to ``MembershipError``.
+    """
+    semester = group.semester
+    if semester is None:
+        semester = Subquery(CustomUser.objects.filter(pk=OuterRef('student_id')).values('semester')[:1])
+    try:
+        with transaction.atomic():
+            GroupMember.objects.filter(group=group).update(semester=semester)
+    except IntegrityError:
+        raise MembershipError("A member is already in another group for this semester.")
@@ -0,0 +1,237 @@
+import glob
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+
+# --------------------
+# Metrics (Prometheus text format)
+# --------------------
+# Chhota in-process registry: counters aur histograms, label values ke saath.
+# Gunicorn jaise multi-worker setup me har worker ka apna registry hota hai,
+# isliye ``METRICS_MULTIPROC_DIR`` set ho to har process apna snapshot
+# ``<dir>/metrics-<pid>.json`` me likhta hai (``METRICS_FLUSH_INTERVAL`` me max
+# ek baar) aur ``/metrics/`` sab files ko jod kar dikhata hai. Ye values
+# cumulative hain, isliye restart hue workers ki files bhi totals me sahi rehti hain.
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+UPLOAD_DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+UPLOAD_SIZE_BUCKETS = tuple(2 ** n for n in range(16, 28, 2))   # 64 KiB .. 128 MiB
+
+_lock = threading.Lock()
+_metrics = {}   # name -> metric
+_last_flush = 0.0
+
+
+def _label_key(labels):
+    return json.dumps(sorted(labels.items()))
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.values = {}
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def snapshot(self):
+        return dict(self.values)
+
+
+class Histogram:
+    type = 'histogram'
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self.values = {}   # label key -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        with _lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            else:
+                state[len(self.buckets)] += 1
+            state[-1] += value
+
+    def snapshot(self):
+        return {key: list(state) for key, state in self.values.items()}
+
+
+def _register(metric):
+    _metrics[metric.name] = metric
+    return metric
+
+
+def counter(name, help_text):
+    return _register(Counter(name, help_text))
+
+
+def histogram(name, help_text, buckets=DEFAULT_BUCKETS):
+    return _register(Histogram(name, help_text, buckets))
+
+
+REQUESTS = counter('http_requests_total', 'HTTP requests by URL name, method and status.')
+REQUEST_LATENCY = histogram('http_request_duration_seconds', 'Request latency by URL name.')
+DB_QUERIES = counter('db_queries_total', 'Database queries by URL name.')
+DB_TIME = counter('db_query_duration_seconds_total', 'Time spent in database queries by URL name.')
+UPLOAD_BYTES = histogram('upload_size_bytes', 'Uploaded request body sizes.', UPLOAD_SIZE_BUCKETS)
+UPLOAD_DURATION = histogram('upload_duration_seconds', 'Upload request durations.', UPLOAD_DURATION_BUCKETS)
+UPLOAD_REJECTIONS = counter('upload_rejections_total', 'Uploads turned away by reason (busy, closed).')
+LOGINS = counter('logins_total', 'Login attempts by result.')
+
+
+# --------------------
+# Snapshot / multi-process
+# --------------------
+def _cache_samples():
+    from .caching import cache_stats
+
+    values = {}
+    for name, stats in cache_stats()['caches'].items():
+        values[_label_key({'cache': name, 'result': 'hit'})] = stats['hits']
+        values[_label_key({'cache': name, 'result': 'miss'})] = stats['misses']
+    return values
+
+
+def snapshot():
+    """Is process ke saare metrics ek JSON-serializable dict me."""
+    with _lock:
+        data = {
+            name: {'type': m.type, 'help': m.help, 'buckets': getattr(m, 'buckets', None), 'values': m.snapshot()}
+            for name, m in _metrics.items()
+        }
+    data['cache_requests_total'] = {
+        'type': 'counter', 'help': 'App cache lookups by cache name and result.',
+        'buckets': None, 'values': _cache_samples(),
+    }
+    return data
+
+
+def multiproc_dir():
+    return getattr(settings, 'METRICS_MULTIPROC_DIR', None) or os.environ.get('METRICS_MULTIPROC_DIR')
+
+
+def flush(force=False):
+    """Multi-process mode me is process ka snapshot file me likho (rate limited)."""
+    global _last_flush
+    directory = multiproc_dir()
+    if not directory:
+        return
+    now = time.monotonic()
+    if not force and now - _last_flush < getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0):
+        return
+    _last_flush = now
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(snapshot(), f)
+    os.replace(tmp, os.path.join(directory, f'metrics-{os.getpid()}.json'))
+
+
+def _merge(total, data):
+    for name, metric in data.items():
+        merged = total.setdefault(name, {**metric, 'values': {}})
+        for key, value in metric['values'].items():
+            if metric['type'] == 'histogram':
+                current = merged['values'].get(key)
+                merged['values'][key] = value if current is None else [a + b for a, b in zip(current, value)]
+            else:
+                merged['values'][key] = merged['values'].get(key, 0) + value
+
+
+def collect():
+    """Saare processes ka merged snapshot (single-process mode me sirf apna)."""
+    directory = multiproc_dir()
+    if not directory:
+        return snapshot()
+    flush(force=True)
+    total = {}
+    for path in sorted(glob.glob(os.path.join(directory, 'metrics-*.json'))):
+        try:
+            with open(path) as f:
+                _merge(total, json.load(f))
+        except (OSError, ValueError):
+            continue   # worker beech me likh raha tha / file hata di gayi
+    return total
+
+
+# --------------------
+# Exposition
+# --------------------
+def _format_labels(labels):
+    if not labels:
+        return ''
+    parts = []
+    for name, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(value)
+    return str(value)
+
+
+def render(data=None):
+    data = collect() if data is None else data
+    lines = []
+    for name in sorted(data):
+        metric = data[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for key in sorted(metric['values']):
+            labels = [tuple(item) for item in json.loads(key)]
+            value = metric['values'][key]
+            if metric['type'] != 'histogram':
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+                continue
+            cumulative = 0
+            for bound, count in zip(metric['buckets'], value):
+                cumulative += count
+                lines.append(f'{name}_bucket{_format_labels(labels + [("le", bound)])} {cumulative}')
+            cumulative += value[len(metric['buckets'])]
+            lines.append(f'{name}_bucket{_format_labels(labels + [("le", "+Inf")])} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(value[-1])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+
+    cache = data.get('cache_requests_total', {}).get('values', {})
+    hits = sum(v for k, v in cache.items() if dict(json.loads(k)).get('result') == 'hit')
+    total = sum(cache.values())
+    lines.append('# HELP cache_hit_ratio App cache hit ratio across all caches.')
+    lines.append('# TYPE cache_hit_ratio gauge')
+    lines.append(f'cache_hit_ratio {_format_value(hits / total if total else 0.0)}')
+    return '\n'.join(lines) + '\n'
+
+
+# --------------------
+# Login signals
+# --------------------
+def record_login_success(sender, **kwargs):
+    LOGINS.inc(result='success')
+
+
+def record_login_failure(sender, **kwargs):
+    LOGINS.inc(result='failure')
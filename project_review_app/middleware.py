@@ -0,0 +1,201 @@
+import contextvars
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.contrib.auth import SESSION_KEY
+from django.utils.functional import SimpleLazyObject, empty
+
+from . import audit, metrics
+from .admission import UPLOAD_VIEWS, busy_response, get_gate, is_upload
+
+
+# --------------------
+# Metrics middleware
+# --------------------
+# Har request ka count/latency URL name ke hisaab se, aur us request ke DB
+# queries gine jaate hain. Upload views ke liye body size aur duration alag
+# histograms me jate hain.
+#
+# Middleware sync aur async dono chains me chalta hai. ASGI par queries
+# ``sync_to_async`` wale thread ke connection par hoti hain, is thread ke nahi,
+# isliye timer connection par nahi lagta: har connection banne par ek permanent
+# ``execute_wrapper`` (``install_query_timer``) lagta hai jo contextvar me rakhe
+# current request ke timer ko report karta hai; contextvar thread hop ke saath
+# jata hai.
+
+_timer = contextvars.ContextVar('metrics_query_timer', default=None)
+
+
+class _QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+def _time_query(execute, sql, params, many, context):
+    timer = _timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """``connection_created`` receiver. Shuru me insert, taaki ``execute_wrapper()`` ka ``pop()`` ise na hataye."""
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _time_query)
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer = _QueryTimer()
+        token = _timer.set(timer)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _timer.reset(token)
+        self.record(request, response, timer, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        timer = _QueryTimer()
+        token = _timer.set(timer)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _timer.reset(token)
+        # record() me sirf in-memory counters; flush rate limited hai
+        self.record(request, response, timer, time.perf_counter() - start)
+        return response
+
+    def record(self, request, response, timer, elapsed):
+        match = getattr(request, 'resolver_match', None)
+        view = (match.url_name or match.view_name) if match else '<unresolved>'
+        metrics.REQUESTS.inc(view=view, method=request.method, status=response.status_code)
+        metrics.REQUEST_LATENCY.observe(elapsed, view=view)
+        metrics.DB_QUERIES.inc(timer.count, view=view)
+        metrics.DB_TIME.inc(timer.duration, view=view)
+        if view in UPLOAD_VIEWS and request.method == 'POST':
+            try:
+                size = int(request.META.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                size = 0
+            metrics.UPLOAD_BYTES.observe(size)
+            metrics.UPLOAD_DURATION.observe(elapsed)
+        metrics.flush()
+
+
+# --------------------
+# Audit middleware
+# --------------------
+# Request ke dauran bani audit entries (audit.py) response par ek bulk_create me
+# likhi jati hain. Rollback hue writes ki entries ``Batch`` khud chhod deta hai;
+# 5xx response par saari entries chhod di jati hain. Sync aur async dono chains.
+
+def _actor_id(request):
+    user = getattr(request, 'user', None)
+    if user is None:
+        return None
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        # view ne user load hi nahi kiya; sirf audit ke liye user query mat karo
+        try:
+            return int(request.session.get(SESSION_KEY))
+        except (TypeError, ValueError):
+            return None
+    return user.pk if user.is_authenticated else None
+
+
+def _flush(request, batch, response):
+    if batch.entries and response.status_code < 500:
+        batch.flush(_actor_id(request))
+
+
+class AuditMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with audit.capture(request.path) as batch:
+            response = self.get_response(request)
+        _flush(request, batch, response)
+        return response
+
+    async def __acall__(self, request):
+        # batch contextvar me hai, to sync views (sync_to_async) ki entries bhi isi me
+        with audit.capture(request.path) as batch:
+            response = await self.get_response(request)
+        # entries/flush/user lookup sab DB connection chhute hain
+        await sync_to_async(_flush)(request, batch, response)
+        return response
+
+
+# --------------------
+# Upload gate (WSGI)
+# --------------------
+# WSGI par body pehli baar CsrfViewMiddleware padhta hai, isliye ye usse pehle
+# hai. ASGI par ``gate_uploads`` (asgi.py) body se pehle hi slot le chuka hota
+# hai; aise request (``upload_admitted``) yahan se seedhe guzarte hain.
+
+def _needs_gate(request):
+    scope = getattr(request, 'scope', None) or {}
+    return not scope.get('upload_admitted') and is_upload(request.method, request.path_info)
+
+
+class UploadGateMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not _needs_gate(request):
+            return self.get_response(request)
+        gate = get_gate()
+        if not gate.acquire_blocking():
+            return busy_response(gate)
+        try:
+            return self.get_response(request)
+        finally:
+            gate.release()
+
+    async def __acall__(self, request):
+        if not _needs_gate(request):
+            return await self.get_response(request)
+        gate = get_gate()
+        if not await gate.acquire():
+            return busy_response(gate)
+        try:
+            return await self.get_response(request)
+        finally:
+            gate.release()
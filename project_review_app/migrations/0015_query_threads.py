@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_query_author(apps, schema_editor):
+    Query = apps.get_model('project_review_app', 'Query')
+    Query.objects.filter(author__isnull=True).update(author=models.F('student'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0014_updated_at_tombstone'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueryReadMarker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_read_id', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='query',
+            name='author',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='query_messages', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='query',
+            name='student',
+            field=models.ForeignKey(blank=True, limit_choices_to={'role': 'student'}, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='query',
+            index=models.Index(fields=['group', 'id'], name='query_group_thread_idx'),
+        ),
+        migrations.AddField(
+            model_name='queryreadmarker',
+            name='group',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='query_markers', to='project_review_app.projectgroup'),
+        ),
+        migrations.AddField(
+            model_name='queryreadmarker',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='query_markers', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterUniqueTogether(
+            name='queryreadmarker',
+            unique_together={('user', 'group')},
+        ),
+        migrations.RunPython(backfill_query_author, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0016_pubsubevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionManifest',
+            fields=[
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='manifest', serialize=False, to='project_review_app.submission')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('kind', models.CharField(blank=True, max_length=10)),
+                ('file_count', models.PositiveIntegerField(default=0)),
+                ('total_size', models.BigIntegerField(default=0)),
+                ('entries', models.JSONField(blank=True, default=list)),
+                ('truncated', models.BooleanField(default=False)),
+                ('preview_name', models.CharField(blank=True, max_length=255)),
+                ('preview_text', models.TextField(blank=True)),
+                ('pdf', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_summaries(apps, schema_editor):
+    # historical models par summaries.py use nahi ho sakta, isliye simple loop
+    ProjectGroup = apps.get_model('project_review_app', 'ProjectGroup')
+    GroupSummary = apps.get_model('project_review_app', 'GroupSummary')
+    rows = []
+    for group in ProjectGroup.objects.select_related('topic', 'teacher').iterator():
+        subs = group.submissions.order_by('-submitted_at', '-pk')
+        latest = subs.first()
+        rows.append(GroupSummary(
+            group=group,
+            teacher_id=group.teacher_id,
+            member_count=group.members.count(),
+            pending_count=subs.filter(status='pending').count(),
+            latest_submission_at=latest.submitted_at if latest else None,
+            latest_status=latest.status if latest else '',
+            topic_title=group.topic.title if group.topic else '',
+            teacher_name=group.teacher.username if group.teacher else '',
+        ))
+    GroupSummary.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0017_submissionmanifest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupSummary',
+            fields=[
+                ('group', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='project_review_app.projectgroup')),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('pending_count', models.PositiveIntegerField(default=0)),
+                ('latest_submission_at', models.DateTimeField(blank=True, null=True)),
+                ('latest_status', models.CharField(blank=True, max_length=20)),
+                ('topic_title', models.CharField(blank=True, max_length=255)),
+                ('teacher_name', models.CharField(blank=True, max_length=150)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('teacher', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:51
+
+from django.db import migrations, models
+
+
+def backfill_claims(apps, schema_editor):
+    # pehle se assigned topics: claimed = groups ki ginti. capacity NULL rehti hai
+    # (koi limit nahi), to purane topics pehle jaise hi kitne bhi groups le sakte hain
+    Topic = apps.get_model('project_review_app', 'Topic')
+    ProjectGroup = apps.get_model('project_review_app', 'ProjectGroup')
+    counts = (
+        ProjectGroup.objects.filter(topic__isnull=False)
+        .values('topic_id').annotate(n=models.Count('pk')).values_list('topic_id', 'n')
+    )
+    for topic_id, n in counts:
+        Topic.objects.filter(pk=topic_id).update(claimed_count=n)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0019_milestones'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='topic',
+            name='capacity',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='claimed_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_claims, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='topic',
+            constraint=models.CheckConstraint(condition=models.Q(('capacity__isnull', True), ('claimed_count__lte', models.F('capacity')), _connector='OR'), name='topic_claims_within_capacity'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0022_audit_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submissionmanifest',
+            name='fingerprint_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='Fingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hash', models.BigIntegerField()),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='project_review_app.submission')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('hash', 'submission'), name='fingerprint_hash_submission_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SimilarityMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shared', models.PositiveIntegerField()),
+                ('score', models.FloatField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('other', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='project_review_app.submission')),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarity_matches', to='project_review_app.submission')),
+            ],
+            options={
+                'ordering': ['-score'],
+                'constraints': [models.UniqueConstraint(fields=('submission', 'other'), name='similarity_pair_uniq')],
+            },
+        ),
+    ]
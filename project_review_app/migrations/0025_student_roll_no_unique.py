@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:15
+
+from django.db import migrations, models
+
+
+def check_duplicate_roll_nos(apps, schema_editor):
+    # duplicate roll numbers me kaunsa sahi hai ye migration tay nahi kar sakta —
+    # admin pehle unhe theek kare. NULL wale rows constraint me clash nahi karte.
+    CustomUser = apps.get_model('project_review_app', 'CustomUser')
+    clashes = list(
+        CustomUser.objects.filter(
+            role='student', semester__isnull=False, division__isnull=False, roll_no__isnull=False,
+        ).values('semester', 'division', 'roll_no')
+        .annotate(n=models.Count('pk')).filter(n__gt=1)
+        .values_list('semester', 'division', 'roll_no')
+    )
+    if clashes:
+        listed = ', '.join(f"sem {sem} div {div} roll {roll}" for sem, div, roll in clashes)
+        raise RuntimeError(f"Duplicate student roll numbers, fix before migrating: {listed}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('project_review_app', '0024_grading'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_roll_nos, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(condition=models.Q(('role', 'student')), fields=('semester', 'division', 'roll_no'), name='student_roll_no_uniq'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:19
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    # case ke farak wale duplicates (A@x.com / a@x.com) apne aap merge nahi kar
+    # sakte — admin pehle unhe theek kare
+    CustomUser = apps.get_model('project_review_app', 'CustomUser')
+    clashes = list(
+        CustomUser.objects.annotate(lowered=Lower('email')).values('lowered')
+        .annotate(n=models.Count('pk')).filter(n__gt=1).values_list('lowered', flat=True)
+    )
+    if clashes:
+        raise RuntimeError(f"Emails differing only in case, fix before migrating: {', '.join(clashes)}")
+    CustomUser.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('project_review_app', '0025_student_roll_no_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.CheckConstraint(condition=models.Q(('email', django.db.models.functions.text.Lower('email'))), name='user_email_lowercase'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:22
+
+from django.db import migrations, models
+from django.db.models.functions import Greatest
+
+
+def backfill_memberships(apps, schema_editor):
+    # counter = asli ginti, max_members kam se kam utna (0020 ke claimed_count jaisa)
+    ProjectGroup = apps.get_model('project_review_app', 'ProjectGroup')
+    GroupMember = apps.get_model('project_review_app', 'GroupMember')
+    counts = GroupMember.objects.values('group_id').annotate(n=models.Count('pk')).values_list('group_id', 'n')
+    for group_id, n in counts:
+        ProjectGroup.objects.filter(pk=group_id).update(
+            member_count=n, max_members=Greatest('max_members', n),
+        )
+
+    # cohort = group ka semester, warna student ka. Ek cohort me pehle se kai
+    # groups ho to sirf sabse nayi membership ko semester milta hai; purani
+    # NULL (legacy) rehti hain, current group nahi ganti jati
+    seen = set()
+    members = GroupMember.objects.order_by('-joined_at', '-pk').values_list(
+        'pk', 'student_id', 'group__semester', 'student__semester',
+    )
+    for pk, student_id, group_semester, student_semester in members.iterator():
+        semester = group_semester if group_semester is not None else student_semester
+        if semester is None or (student_id, semester) in seen:
+            continue
+        seen.add((student_id, semester))
+        GroupMember.objects.filter(pk=pk).update(semester=semester)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0026_email_lowercase'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupmember',
+            name='semester',
+            field=models.PositiveIntegerField(blank=True, choices=[(1, 'Semester 1'), (2, 'Semester 2'), (3, 'Semester 3'), (4, 'Semester 4'), (5, 'Semester 5'), (6, 'Semester 6')], null=True),
+        ),
+        migrations.AddField(
+            model_name='projectgroup',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_memberships, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='groupmember',
+            constraint=models.UniqueConstraint(fields=('student', 'semester'), name='member_one_group_per_semester'),
+        ),
+        migrations.AddConstraint(
+            model_name='projectgroup',
+            constraint=models.CheckConstraint(condition=models.Q(('member_count__lte', models.F('max_members'))), name='group_members_within_max'),
+        ),
+    ]
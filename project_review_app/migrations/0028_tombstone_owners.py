@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_review_app', '0027_membership_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tombstone',
+            name='teacher_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tombstone',
+            name='topic_owner_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Milestone
+
+
+# --------------------
+# Submission windows
+# --------------------
+# Group ke liye milestones: agar group-specific milestone hain to sirf wahi,
+# warna uske cohort (semester + division, ya poora semester) wale. Jis group ka
+# koi milestone nahi hai uske uploads hamesha allowed hain (purana behaviour).
+#
+# Deadline se pehle upload page khola ho to ek signed upload ticket milta hai.
+# Deadline ke baad ``UPLOAD_GRACE_MINUTES`` tak wo ticket upload accept karwata
+# hai, taaki jo upload deadline se pehle shuru hua (slow network / queue me
+# wait) wo reject na ho.
+
+TICKET_SALT = 'project_review_app.upload_ticket'
+TICKET_MAX_AGE = 24 * 60 * 60
+
+
+def grace_period():
+    return timedelta(minutes=getattr(settings, 'UPLOAD_GRACE_MINUTES', 30))
+
+
+def milestones_for(group):
+    cohort = Q(group__isnull=True, semester=group.semester) & (
+        Q(division__isnull=True) | Q(division='') | Q(division=group.division)
+    )
+    rows = list(Milestone.objects.filter(Q(group=group) | cohort).order_by('closes_at'))
+    own = [m for m in rows if m.group_id == group.pk]
+    return own or rows
+
+
+def open_milestone(milestones, now=None):
+    now = now or timezone.now()
+    return next((m for m in milestones if m.is_open(now)), None)
+
+
+def next_milestone(milestones, now=None):
+    now = now or timezone.now()
+    return next((m for m in milestones if m.opens_at > now), None)
+
+
+def issue_ticket(user, group, milestone, now=None):
+    now = now or timezone.now()
+    return signing.dumps(
+        {'u': user.pk, 'g': group.pk, 'm': milestone.pk, 't': now.timestamp()},
+        salt=TICKET_SALT, compress=True,
+    )
+
+
+def ticket_milestone(token, user, group, milestones, now=None):
+    """Valid ticket ka milestone, ya None (invalid / expired / grace khatam)."""
+    now = now or timezone.now()
+    try:
+        data = signing.loads(token, salt=TICKET_SALT, max_age=TICKET_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    if data.get('u') != user.pk or data.get('g') != group.pk:
+        return None
+    issued = datetime.fromtimestamp(data['t'], tz=dt_timezone.utc)
+    for milestone in milestones:
+        if milestone.pk == data.get('m'):
+            if milestone.is_open(issued) and now <= milestone.closes_at + grace_period():
+                return milestone
+            return None
+    return None
+
+
+def admit_upload(user, group, ticket=None, now=None):
+    """
+    ``(allowed, milestone)``. Milestone configure nahi hai to ``(True, None)``;
+    window open hai ya ticket grace me valid hai to ``(True, milestone)``.
+    """
+    now = now or timezone.now()
+    milestones = milestones_for(group)
+    if not milestones:
+        return True, None
+    milestone = open_milestone(milestones, now)
+    if milestone is None and ticket:
+        milestone = ticket_milestone(ticket, user, group, milestones, now)
+    return milestone is not None, milestone
@@ -1,11 +1,19 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 
 
 # --------------------
 # Custom User Model
 # --------------------
+def normalize_email(email):
+    """Stored/lookup form: poora address lowercase (``user_email_lowercase``)."""
+    return (email or '').strip().lower()
+
+
 class CustomUser(AbstractUser):
     ROLE_CHOICES = (
         ('teacher', 'Teacher'),
@@ -52,11 +60,115 @@ class CustomUser(AbstractUser):
     department = models.CharField(max_length=100, blank=True, null=True)
     subject = models.CharField(max_length=100, blank=True, null=True)
 
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # roster feed ka keyset order (roster.ROSTER_ORDER)
+            models.Index(fields=['role', 'semester', 'division', 'roll_no', 'id'], name='user_roster_idx'),
+        ]
+        constraints = [
+            # ek semester/division me roll number ek hi student ka (forms.UNIQUE_ERRORS)
+            models.UniqueConstraint(
+                fields=['semester', 'division', 'roll_no'], condition=models.Q(role='student'),
+                name='student_roll_no_uniq',
+            ),
+            # email hamesha lowercase store hota hai, to email ka unique index hi
+            # case-insensitive login lookup serve karta hai (backends.EmailBackend)
+            models.CheckConstraint(condition=models.Q(email=Lower('email')), name='user_email_lowercase'),
+        ]
+
+    def clean(self):
+        super().clean()
+        # forms ka constraint validation isi normalized value par chalta hai
+        self.email = normalize_email(self.email)
+
+    def validate_constraints(self, exclude=None):
+        # clean() email normalize kar chuka hai; user_email_lowercase ka check
+        # (ek SELECT) bekaar hai — DB khud enforce karta hai
+        super().validate_constraints(exclude={*(exclude or ()), 'email'})
+
+    def save(self, *args, **kwargs):
+        self.email = normalize_email(self.email)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.username} (Student) | Roll: {self.roll_no or '-'} | Sem: {self.semester or '-'} | Div: {self.division or '-'}"
         #return f"{self.username} ({self.role})"
 
 
+# --------------------
+# Scoped querysets (authorization SQL WHERE me)
+# --------------------
+# ``Model.objects.for_user(user)`` sirf wahi rows deta hai jo user dekh sakta hai:
+#   - admin / superuser: sab
+#   - teacher: jo groups wo padhata hai (group.teacher) ya jinka topic usne banaya
+#   - student: sirf apne groups (GroupMember) ka data
+# Views/API isi se objects fetch karte hain, Python me filter nahi karte.
+# Subclass jo role override nahi karta, us role ko kuch nahi milta (deny by default).
+class ScopedQuerySet(models.QuerySet):
+    def for_admin(self):
+        return self.all()
+
+    def for_teacher(self, user):
+        return self.none()
+
+    def for_student(self, user):
+        return self.none()
+
+    def for_user(self, user):
+        if not user.is_authenticated:
+            return self.none()
+        if user.is_superuser or user.role == 'admin':
+            return self.for_admin()
+        if user.role == 'teacher':
+            return self.for_teacher(user)
+        if user.role == 'student':
+            return self.for_student(user)
+        return self.none()
+
+
+def _member_group_ids(user):
+    return GroupMember.objects.filter(student=user).values('group_id')
+
+
+# capacity NULL = koi limit nahi (capacity aane se pehle wala behaviour)
+TOPIC_HAS_SEATS = models.Q(capacity__isnull=True) | models.Q(claimed_count__lt=models.F('capacity'))
+
+
+class TopicQuerySet(ScopedQuerySet):
+    def for_teacher(self, user):
+        return self.filter(models.Q(created_by=user) | models.Q(teacher=user))
+
+    def for_student(self, user):
+        # apne group ka topic, aur group teacher ke topics (catalogue)
+        groups = ProjectGroup.objects.filter(pk__in=_member_group_ids(user))
+        teachers = groups.filter(teacher__isnull=False).values('teacher_id')
+        return self.filter(
+            models.Q(pk__in=groups.filter(topic__isnull=False).values('topic_id'))
+            | models.Q(created_by__in=teachers)
+            | models.Q(teacher__in=teachers)
+        )
+
+
+class ProjectGroupQuerySet(ScopedQuerySet):
+    def for_teacher(self, user):
+        return self.filter(models.Q(teacher=user) | models.Q(topic__created_by=user))
+
+    def for_student(self, user):
+        return self.filter(pk__in=_member_group_ids(user))
+
+
+class GroupOwnedQuerySet(ScopedQuerySet):
+    """Submission / Query jaise models jinka scope unke group se aata hai."""
+
+    def for_teacher(self, user):
+        return self.filter(models.Q(group__teacher=user) | models.Q(group__topic__created_by=user))
+
+    def for_student(self, user):
+        return self.filter(group_id__in=_member_group_ids(user))
+
+
 # --------------------
 # Topic Model
 # --------------------
@@ -80,11 +192,47 @@ class Topic(models.Model):
         related_name="topics_assigned"
     )
 
+    # kitne groups ye topic le sakte hain (None = koi limit nahi); claimed_count
+    # conditional UPDATE se badhta hai (topics.py)
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    claimed_count = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = TopicQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(capacity__isnull=True) | models.Q(claimed_count__lte=models.F('capacity')),
+                name='topic_claims_within_capacity',
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # claimed_count sirf topics.py ke conditional UPDATEs badalte hain; purane
+        # instance ka full save parallel claims ka counter overwrite na kare
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name != 'claimed_count'
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def available(self):
+        """Bachi hui seats; limit na ho to ``None``."""
+        if self.capacity is None:
+            return None
+        return max(self.capacity - self.claimed_count, 0)
+
+    @property
+    def has_seats(self):
+        return self.capacity is None or self.claimed_count < self.capacity
+
 
 # --------------------
 # Project Group Model
@@ -92,6 +240,8 @@ class Topic(models.Model):
 class ProjectGroup(models.Model):
     name = models.CharField(max_length=120)
     max_members = models.PositiveIntegerField(default=3)
+    # seat conditional UPDATE se leti hai (memberships.add_member), delete par wapas
+    member_count = models.PositiveIntegerField(default=0)
     topic = models.ForeignKey(Topic, on_delete=models.SET_NULL, null=True, blank=True)
     division = models.CharField(
         max_length=1,
@@ -105,6 +255,7 @@ class ProjectGroup(models.Model):
         null=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     teacher = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -113,9 +264,49 @@ class ProjectGroup(models.Model):
         blank=True
     )
 
+    objects = ProjectGroupQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(member_count__lte=models.F('max_members')), name='group_members_within_max',
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # form ke paas purana member_count hota hai; full save parallel add/remove
+        # ka counter overwrite na kare
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name != 'member_count'
+            ]
+        super().save(*args, **kwargs)
+
+
+
+# --------------------
+# Group Summary (read-optimized projection, summaries.py maintain karta hai)
+# --------------------
+class GroupSummary(models.Model):
+    group = models.OneToOneField(
+        ProjectGroup, on_delete=models.CASCADE, primary_key=True, related_name='summary'
+    )
+    teacher = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    member_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    latest_submission_at = models.DateTimeField(null=True, blank=True)
+    latest_status = models.CharField(max_length=20, blank=True)
+    topic_title = models.CharField(max_length=255, blank=True)
+    teacher_name = models.CharField(max_length=150, blank=True)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Summary of group {self.group_id}"
 
 
 # --------------------
@@ -128,15 +319,65 @@ class GroupMember(models.Model):
         on_delete=models.CASCADE,
         limit_choices_to={'role': 'student'}
     )
+    # cohort: group ka semester, warna student ka (memberships.cohort_semester)
+    semester = models.PositiveIntegerField(choices=CustomUser.SEMESTER_CHOICES, null=True, blank=True)
     joined_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         unique_together = ('group', 'student')
+        constraints = [
+            # ek semester me student ka ek hi group (memberships.current_membership)
+            models.UniqueConstraint(fields=['student', 'semester'], name='member_one_group_per_semester'),
+        ]
 
     def __str__(self):
         return f"{self.student.username} -> {self.group.name}"
 
 
+# --------------------
+# Milestones (submission windows)
+# --------------------
+class Milestone(models.Model):
+    """
+    Submission window. Ya to ek group ke liye (``group``) ya poore cohort ke
+    liye (``semester`` + optional ``division``). Group-specific milestone cohort
+    wale par priority leta hai.
+    """
+    title = models.CharField(max_length=200)
+    group = models.ForeignKey(
+        ProjectGroup, on_delete=models.CASCADE, null=True, blank=True, related_name='milestones'
+    )
+    semester = models.PositiveIntegerField(choices=CustomUser.SEMESTER_CHOICES, null=True, blank=True)
+    division = models.CharField(max_length=1, choices=CustomUser.DIVISION_CHOICES, null=True, blank=True)
+    opens_at = models.DateTimeField()
+    closes_at = models.DateTimeField()
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='milestones'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['closes_at']
+        indexes = [
+            models.Index(fields=['semester', 'division', 'closes_at'], name='milestone_cohort_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(closes_at__gt=models.F('opens_at')), name='milestone_window_valid'),
+            models.CheckConstraint(
+                condition=models.Q(group__isnull=False) | models.Q(semester__isnull=False),
+                name='milestone_has_scope',
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def is_open(self, now=None):
+        now = now or timezone.now()
+        return self.opens_at <= now < self.closes_at
+
+
 # --------------------
 # Submission Model
 # --------------------
@@ -161,24 +402,368 @@ class Submission(models.Model):
     feedback = models.TextField(blank=True)
     submitted_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    # Review queue lease: jis teacher ne claim kiya hai, sirf wahi expiry tak review karega
+    claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='claimed_submissions'
+    )
+    claimed_until = models.DateTimeField(null=True, blank=True)
+
+    objects = GroupOwnedQuerySet.as_manager()
+
+    # kis milestone window me upload hua (late grace ke saath)
+    milestone = models.ForeignKey(
+        Milestone, on_delete=models.SET_NULL, null=True, blank=True, related_name='submissions'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'submitted_at'], name='submission_queue_idx'),
+        ]
 
     def __str__(self):
         return f"Submission {self.id} - {self.group.name}"
 
+    def is_claimed_by_other(self, user, now=None):
+        now = now or timezone.now()
+        return (
+            self.claimed_by_id is not None
+            and self.claimed_by_id != user.pk
+            and self.claimed_until is not None
+            and self.claimed_until > now
+        )
+
+
+# --------------------
+# Submission Manifest (upload ke baad background me banta hai)
+# --------------------
+class SubmissionManifest(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_READY = 'ready'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_READY, 'Ready'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    submission = models.OneToOneField(
+        Submission, on_delete=models.CASCADE, primary_key=True, related_name='manifest'
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    kind = models.CharField(max_length=10, blank=True)
+    file_count = models.PositiveIntegerField(default=0)
+    total_size = models.BigIntegerField(default=0)
+    entries = models.JSONField(default=list, blank=True)
+    truncated = models.BooleanField(default=False)
+    preview_name = models.CharField(max_length=255, blank=True)
+    preview_text = models.TextField(blank=True)
+    pdf = models.JSONField(null=True, blank=True)
+    fingerprint_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Manifest for submission {self.submission_id} ({self.status})"
+
+
+# --------------------
+# Similarity index (similarity.py)
+# --------------------
+class Fingerprint(models.Model):
+    # inverted index: hash -> submissions. Lookup ``hash IN (...)`` index se hota
+    # hai, to naye upload ka match poore corpus ko scan nahi karta.
+    hash = models.BigIntegerField()
+    submission = models.ForeignKey(Submission, on_delete=models.CASCADE, related_name='+')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['hash', 'submission'], name='fingerprint_hash_submission_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.hash} -> submission {self.submission_id}"
+
+
+class SimilarityMatch(models.Model):
+    submission = models.ForeignKey(Submission, on_delete=models.CASCADE, related_name='similarity_matches')
+    other = models.ForeignKey(Submission, on_delete=models.CASCADE, related_name='+')
+    shared = models.PositiveIntegerField()
+    # shared / chhote submission ke fingerprints (containment), 0..1
+    score = models.FloatField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-score']
+        constraints = [
+            models.UniqueConstraint(fields=['submission', 'other'], name='similarity_pair_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.submission_id} ~ {self.other_id} ({self.score:.0%})"
+
+
+# --------------------
+# Rubrics & grading (grading.py)
+# --------------------
+class Rubric(models.Model):
+    """
+    Teacher ka evaluation rubric — ya to ek topic ke liye, ya semester
+    (aur optionally division) ke saare groups ke liye. Topic wala rubric
+    cohort wale se pehle lagta hai.
+    """
+    name = models.CharField(max_length=120)
+    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, null=True, blank=True, related_name='rubrics')
+    semester = models.PositiveIntegerField(choices=CustomUser.SEMESTER_CHOICES, null=True, blank=True)
+    division = models.CharField(max_length=1, choices=CustomUser.DIVISION_CHOICES, null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='rubrics'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(topic__isnull=False) | models.Q(semester__isnull=False),
+                name='rubric_topic_or_semester',
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class Criterion(models.Model):
+    rubric = models.ForeignKey(Rubric, on_delete=models.CASCADE, related_name='criteria')
+    name = models.CharField(max_length=120)
+    weight = models.PositiveIntegerField(default=1)
+    max_score = models.PositiveIntegerField(default=10)
+    position = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['position', 'id']
+        constraints = [
+            models.CheckConstraint(condition=models.Q(max_score__gt=0), name='criterion_max_score_positive'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.weight}x, /{self.max_score})"
+
+
+class CriterionScore(models.Model):
+    submission = models.ForeignKey(Submission, on_delete=models.CASCADE, related_name='scores')
+    criterion = models.ForeignKey(Criterion, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['submission', 'criterion'], name='criterion_score_uniq'),
+            models.CheckConstraint(condition=models.Q(score__gte=0), name='criterion_score_non_negative'),
+        ]
+
+    def __str__(self):
+        return f"{self.criterion_id}: {self.score} (submission {self.submission_id})"
+
+
+class MemberAdjustment(models.Model):
+    # group ke total (0-100) par ek member ke marks ka plus/minus
+    group = models.ForeignKey(ProjectGroup, on_delete=models.CASCADE, related_name='adjustments')
+    student = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    delta = models.FloatField()
+    reason = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['group', 'student'], name='member_adjustment_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} in {self.group_id}: {self.delta:+g}"
+
 
 # --------------------
 # Query Model
 # --------------------
 class Query(models.Model):
     group = models.ForeignKey(ProjectGroup, on_delete=models.CASCADE, related_name='queries')
+    # jis student ne sawal poocha; teacher ke jawab me ye khali rehta hai
     student = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
-        limit_choices_to={'role': 'student'}
+        limit_choices_to={'role': 'student'},
+        null=True,
+        blank=True
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='query_messages'
     )
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = GroupOwnedQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['group', 'id'], name='query_group_thread_idx'),
+        ]
 
     def __str__(self):
-        return f"Query from {self.student.username} in {self.group.name}"
+        who = self.author.username if self.author else 'unknown'
+        return f"Query from {who} in {self.group.name}"
+
+
+# --------------------
+# Query read marker (per user, per group)
+# --------------------
+class QueryReadMarker(models.Model):
+    """User ne group thread me kaunsa message tak padh liya — unread = id > last_read_id."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='query_markers')
+    group = models.ForeignKey(ProjectGroup, on_delete=models.CASCADE, related_name='query_markers')
+    last_read_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('user', 'group')
+
+    def __str__(self):
+        return f"{self.user_id} read {self.group_id} up to {self.last_read_id}"
+
+
+# --------------------
+# Review Log
+# --------------------
+class ReviewLog(models.Model):
+    """Har review (single ya bulk) ka ek row — kis teacher ne kya status diya."""
+    submission = models.ForeignKey(Submission, on_delete=models.CASCADE, related_name='review_logs')
+    reviewer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
+    status = models.CharField(max_length=20, choices=Submission.STATUS_CHOICES)
+    feedback = models.TextField(blank=True)
+    bulk = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Review of submission {self.submission_id} -> {self.status}"
+
+
+# --------------------
+# Tombstone (deleted rows ka record, downstream sync ke liye)
+# --------------------
+# API me students/teachers resources scoped nahi hain, to unke deletes sabko
+# dikhte hain. Baaki tombstones delete ke waqt ke owners (group/topic ka
+# teacher aur topic banane wala) yaad rakhte hain — row ja chuki hai, to scope
+# inhi se lagta hai. Owners na hon (purane tombstones) to sirf admins dekhte hain.
+UNSCOPED_RESOURCES = ('students', 'teachers')
+
+
+class TombstoneQuerySet(ScopedQuerySet):
+    def for_teacher(self, user):
+        return self.filter(
+            models.Q(resource__in=UNSCOPED_RESOURCES)
+            | models.Q(teacher_id=user.pk)
+            | models.Q(topic_owner_id=user.pk)
+        )
+
+    def for_student(self, user):
+        return self.filter(resource__in=UNSCOPED_RESOURCES)
+
+
+class Tombstone(models.Model):
+    resource = models.CharField(max_length=20)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+    # FK nahi: users delete hon to bhi tombstone rehna chahiye
+    teacher_id = models.BigIntegerField(null=True, blank=True)
+    topic_owner_id = models.BigIntegerField(null=True, blank=True)
+
+    objects = TombstoneQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['deleted_at', 'id']
+
+    def __str__(self):
+        return f"{self.resource} #{self.object_id} deleted at {self.deleted_at}"
+
+
+# --------------------
+# Pub/sub event (database backend ke liye, cross-worker delivery)
+# --------------------
+class PubSubEvent(models.Model):
+    channel = models.CharField(max_length=100)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.channel}: {self.payload}"
+
+
+# --------------------
+# Audit log (append-only)
+# --------------------
+class AuditQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        raise TypeError("Audit entries are append-only.")
+
+
+class AuditEntry(models.Model):
+    """
+    Kisne kya badla: model, pk aur changed fields ka ``{field: [old, new]}``.
+    Rows sirf ``audit`` module likhta hai (request ke end par ek bulk_create);
+    update kabhi nahi hota, purani rows ``rotate_audit_log`` hatata hai.
+    """
+    ACTION_CREATE = 'create'
+    ACTION_UPDATE = 'update'
+    ACTION_DELETE = 'delete'
+    ACTION_CHOICES = (
+        (ACTION_CREATE, 'Created'),
+        (ACTION_UPDATE, 'Updated'),
+        (ACTION_DELETE, 'Deleted'),
+    )
+
+    created_at = models.DateTimeField(default=timezone.now)
+    # actor delete ho jaye tab bhi id bachi rahe (FK constraint nahi)
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.DO_NOTHING, db_constraint=False,
+        null=True, blank=True, related_name='+',
+    )
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    model = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    object_repr = models.CharField(max_length=200, blank=True)
+    changes = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    path = models.CharField(max_length=200, blank=True)
+
+    objects = AuditQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['created_at'], name='audit_time_idx'),
+            models.Index(fields=['model', 'object_id', 'id'], name='audit_object_idx'),
+            models.Index(fields=['actor', 'id'], name='audit_actor_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.model} #{self.object_id} by {self.actor_id or '-'}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("Audit entries are append-only.")
+        super().save(*args, **kwargs)
 
+    def delete(self, *args, **kwargs):
+        raise TypeError("Audit entries are append-only; use rotate_audit_log.")
@@ -0,0 +1,111 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .inspection import analyse_file
+from .models import SubmissionManifest
+from .similarity import index_submission
+
+
+# --------------------
+# Post-upload pipeline
+# --------------------
+# Upload request sirf file save karke turant return karta hai; archive ki
+# listing/preview ek process pool me banti hai (request path se bahar) aur
+# ``SubmissionManifest`` me save hoti hai, taaki review page bina download ke
+# contents dikha sake. Usi pass me text ke fingerprints bhi bante hain jo
+# ``similarity`` index me jaate hain (plagiarism check).
+#
+# ``SUBMISSION_INSPECTION_MODE``:
+#   - ``process`` (default): ProcessPoolExecutor, ``SUBMISSION_INSPECTION_WORKERS`` workers
+#   - ``sync``: usi thread me (tests / management command)
+#   - ``off``: kuch nahi
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: threaded web worker ko fork karna safe nahi hai
+            _executor = ProcessPoolExecutor(
+                max_workers=getattr(settings, 'SUBMISSION_INSPECTION_WORKERS', 2),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+    return _executor
+
+
+def _file_path(submission):
+    try:
+        return submission.file.path
+    except NotImplementedError:
+        # remote storage (S3 etc.) — local path nahi hai
+        return None
+
+
+def save_manifest(submission_id, result=None, error=''):
+    fields = {'status': SubmissionManifest.STATUS_FAILED, 'error': error}
+    hashes = None
+    if result is not None:
+        result = dict(result)
+        hashes = result.pop('fingerprints', None)
+        fields = {'status': SubmissionManifest.STATUS_READY, 'error': '', **result}
+    SubmissionManifest.objects.update_or_create(submission_id=submission_id, defaults=fields)
+    if hashes is not None:
+        index_submission(submission_id, hashes)
+
+
+def _on_done(submission_id, future):
+    # ye callback executor ke management thread me chalta hai
+    try:
+        result = future.result()
+    except Exception as exc:
+        logger.warning("Inspection failed for submission %s: %s", submission_id, exc)
+        result, error = None, str(exc) or exc.__class__.__name__
+    else:
+        error = ''
+    try:
+        save_manifest(submission_id, result, error)
+    finally:
+        close_old_connections()
+
+
+def inspect_submission(submission, mode=None):
+    """Submission ke file ka manifest banao (mode ke hisaab se sync ya pool me)."""
+    mode = mode or getattr(settings, 'SUBMISSION_INSPECTION_MODE', 'process')
+    if mode == 'off' or not submission.file:
+        return None
+    path = _file_path(submission)
+    if path is None:
+        return None
+
+    SubmissionManifest.objects.get_or_create(submission_id=submission.pk)
+    if mode == 'sync':
+        try:
+            result = analyse_file(path)
+        except Exception as exc:
+            save_manifest(submission.pk, error=str(exc) or exc.__class__.__name__)
+        else:
+            save_manifest(submission.pk, result)
+        return None
+
+    future = _get_executor().submit(analyse_file, path)
+    future.add_done_callback(lambda f, pk=submission.pk: _on_done(pk, f))
+    return future
+
+
+def shutdown(wait=True):
+    """Pool band karo (pending manifests save hone tak wait)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
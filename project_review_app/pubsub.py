@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import PubSubEvent
+
+
+# --------------------
+# Pub/sub
+# --------------------
+# Long-poll/SSE waiters ek asyncio.Queue se subscribe karte hain; publish sync
+# code (signals, views) se bhi safe hai kyunki message har subscriber ke apne
+# event loop par ``call_soon_threadsafe`` se daala jata hai. Waiter tab tak so
+# raha hota hai jab tak kuch publish na ho.
+#
+# ``PUBSUB_BACKEND`` decide karta hai ki message dusre worker processes tak kaise
+# pahunche:
+#   - ``local``: sirf isi process ke subscribers (single worker / dev)
+#   - ``database``: message ek table me likha jata hai aur har process ka ek
+#     background thread use poll karke apne local subscribers ko deta hai
+# Custom backend ke liye dotted path bhi de sakte ho.
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_subscribers = {}   # channel -> set of (loop, queue)
+
+
+class Subscription:
+    def __init__(self, channels):
+        self.channels = list(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self._entry = (self.loop, self.queue)
+
+    def __enter__(self):
+        with _lock:
+            for channel in self.channels:
+                _subscribers.setdefault(channel, set()).add(self._entry)
+        get_backend().on_subscribe()
+        return self
+
+    def __exit__(self, *exc):
+        with _lock:
+            for channel in self.channels:
+                entries = _subscribers.get(channel)
+                if entries is not None:
+                    entries.discard(self._entry)
+                    if not entries:
+                        del _subscribers[channel]
+
+    async def get(self, timeout=None):
+        """Agla message (channel, payload) ya timeout par None."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+def dispatch_local(channel, payload):
+    with _lock:
+        entries = list(_subscribers.get(channel, ()))
+    for loop, queue in entries:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(queue.put_nowait, (channel, payload))
+
+
+def has_local_subscribers():
+    with _lock:
+        return bool(_subscribers)
+
+
+# --------------------
+# Backends
+# --------------------
+class LocalBackend:
+    def publish(self, channel, payload):
+        dispatch_local(channel, payload)
+
+    def on_subscribe(self):
+        pass
+
+
+class DatabaseBackend:
+    """
+    Cross-worker backend jo sirf database use karta hai (SQLite par bhi chalta
+    hai). Har process me ek hi poller thread hota hai, chahe kitne bhi clients
+    connected hon, aur jab koi subscriber nahi hota tab wo query nahi karta.
+
+    Cursor (``_last_id``) sirf subscribers ke rehte aage badhta hai. Idle hote hi
+    cursor chhod diya jata hai; agla subscription apna start time (``_since``)
+    deta hai aur pehla poll ``created_at >= _since`` se shuru hota hai — na
+    subscribe aur pehle poll ke beech ke events chhoote, na idle ke dauran ka
+    backlog naye subscribers par replay ho.
+    """
+
+    def __init__(self):
+        self.interval = getattr(settings, 'PUBSUB_POLL_INTERVAL', 1.0)
+        self.retention = timedelta(seconds=getattr(settings, 'PUBSUB_RETENTION_SECONDS', 300))
+        # doosre worker ki ghadi thodi peeche ho to bhi event na chhoote; extra
+        # event se waiter sirf ek baar DB dobara check karta hai
+        self.clock_slack = timedelta(seconds=max(self.interval, 1.0))
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._last_id = None
+        self._since = None
+
+    def publish(self, channel, payload):
+        PubSubEvent.objects.create(channel=channel, payload=payload)
+
+    def on_subscribe(self):
+        with self._thread_lock:
+            if self._last_id is None and self._since is None:
+                self._since = timezone.now() - self.clock_slack
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='pubsub-poller', daemon=True)
+                self._thread.start()
+
+    def reset_cursor(self):
+        """Koi subscriber nahi: cursor chhodo, agla subscription naya start deta hai."""
+        with self._thread_lock:
+            self._last_id = None
+            self._since = None
+
+    def poll_once(self):
+        with self._thread_lock:
+            last_id, since = self._last_id, self._since
+        events = PubSubEvent.objects.order_by('id')
+        if last_id is not None:
+            events = events.filter(id__gt=last_id)
+        elif since is not None:
+            events = events.filter(created_at__gte=since)
+        else:
+            return 0
+        events = list(events.values_list('id', 'channel', 'payload')[:500])
+        for event_id, channel, payload in events:
+            dispatch_local(channel, payload)
+        if events:
+            with self._thread_lock:
+                self._last_id = events[-1][0]
+                self._since = None
+        return len(events)
+
+    def prune(self):
+        PubSubEvent.objects.filter(created_at__lt=timezone.now() - self.retention).delete()
+
+    def _run(self):
+        last_prune = time.monotonic()
+        while True:
+            if has_local_subscribers():
+                try:
+                    close_old_connections()
+                    self.poll_once()
+                    if time.monotonic() - last_prune > self.retention.total_seconds():
+                        self.prune()
+                        last_prune = time.monotonic()
+                except Exception:
+                    logger.exception("pubsub poller failed")
+            else:
+                self.reset_cursor()
+            time.sleep(self.interval)
+
+
+BACKENDS = {
+    'local': LocalBackend,
+    'database': DatabaseBackend,
+}
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        name = getattr(settings, 'PUBSUB_BACKEND', 'local')
+        backend_cls = BACKENDS.get(name) or import_string(name)
+        _backend = backend_cls()
+    return _backend
+
+
+def subscribe(*channels):
+    return Subscription(channels)
+
+
+def publish(channel, payload):
+    get_backend().publish(channel, payload)
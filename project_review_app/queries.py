@@ -0,0 +1,81 @@
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import ProjectGroup, Query, QueryReadMarker
+
+
+# --------------------
+# Group Q&A threads
+# --------------------
+PAGE_SIZE = 30
+
+
+def group_channel(group_id):
+    return f'group:{group_id}'
+
+
+def thread_messages(group_id, before=None, after=None, limit=PAGE_SIZE):
+    """
+    Keyset pagination on ``(group, id)`` index. ``before`` purane messages ke
+    liye, ``after`` naye messages (poll) ke liye. Result hamesha id ascending.
+    """
+    qs = Query.objects.filter(group_id=group_id).select_related('author')
+    if after is not None:
+        return list(qs.filter(id__gt=after).order_by('id')[:limit])
+    if before is not None:
+        qs = qs.filter(id__lt=before)
+    return list(reversed(qs.order_by('-id')[:limit]))
+
+
+def mark_read(user, group_id, last_id):
+    """Marker sirf aage badhta hai — purana page dekhne se unread wapas nahi aata."""
+    if not last_id:
+        return
+    updated = QueryReadMarker.objects.filter(
+        user=user, group_id=group_id, last_read_id__lt=last_id
+    ).update(last_read_id=last_id)
+    if not updated:
+        QueryReadMarker.objects.get_or_create(
+            user=user, group_id=group_id, defaults={'last_read_id': last_id}
+        )
+
+
+def unread_count(user, group_id):
+    """Ek indexed range query: group ke messages jinki id marker se badi hai."""
+    marker = QueryReadMarker.objects.filter(user=user, group_id=group_id).values('last_read_id')[:1]
+    return (
+        Query.objects.filter(group_id=group_id, id__gt=Coalesce(Subquery(marker), Value(0)))
+        .exclude(author=user)
+        .count()
+    )
+
+
+def inbox_groups(teacher):
+    """
+    Teacher ke saare groups, unread count aur last message time ke saath — ek
+    hi query me, chahe groups kitne bhi hon.
+    """
+    marker = QueryReadMarker.objects.filter(user=teacher, group=OuterRef('pk')).values('last_read_id')[:1]
+    return (
+        ProjectGroup.objects.filter(teacher=teacher)
+        .select_related('topic')
+        .annotate(last_read=Coalesce(Subquery(marker), Value(0)))
+        .annotate(
+            unread=Count(
+                'queries',
+                filter=Q(queries__id__gt=F('last_read')) & ~Q(queries__author=teacher),
+            ),
+            last_message_at=Max('queries__created_at'),
+        )
+        .order_by(F('last_message_at').desc(nulls_last=True), 'name')
+    )
+
+
+def serialize_message(msg, user):
+    return {
+        'id': msg.id,
+        'author': msg.author.username if msg.author else None,
+        'mine': msg.author_id == user.pk,
+        'message': msg.message,
+        'created_at': msg.created_at,
+    }
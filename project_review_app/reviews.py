@@ -0,0 +1,208 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import audit
+from .caching import bump_on_commit
+from .models import AuditEntry, ReviewLog, Submission
+from .summaries import refresh_group_summaries
+from .signals import submissions_reviewed
+
+
+# --------------------
+# Review queue
+# --------------------
+# Kai teachers ek hi department ka backlog review karte hain. Har submission ek
+# time-limited lease ke saath ek hi reviewer ko milta hai, taaki duplicate review
+# aur lost update na ho.
+
+CLAIM_BATCH_SIZE = 20
+
+
+class ReviewConflict(Exception):
+    """Submission is currently claimed by another reviewer."""
+
+
+def claim_lease():
+    return timedelta(minutes=getattr(settings, 'REVIEW_CLAIM_LEASE_MINUTES', 15))
+
+
+def _claimable(teacher, now):
+    # free, lease expired, ya pehle se isi teacher ka claim
+    return (
+        Q(claimed_by__isnull=True)
+        | Q(claimed_until__isnull=True)
+        | Q(claimed_until__lte=now)
+        | Q(claimed_by=teacher)
+    )
+
+
+def pending_queue(teacher, now=None):
+    now = now or timezone.now()
+    return (
+        Submission.objects
+        .filter(status=Submission.STATUS_PENDING, group__teacher=teacher)
+        .filter(_claimable(teacher, now))
+        .order_by('submitted_at', 'id')
+    )
+
+
+def _try_claim(sub_id, teacher, now):
+    """Compare-and-swap claim: sirf tabhi likhega jab row abhi bhi claimable ho."""
+    return Submission.objects.filter(
+        _claimable(teacher, now), pk=sub_id, status=Submission.STATUS_PENDING,
+    ).update(claimed_by=teacher, claimed_until=now + claim_lease())
+
+
+def claim_next_submission(teacher):
+    """
+    Teacher ke groups ka agla pending submission claim karke return karta hai,
+    ya queue khali ho to None.
+
+    Jo backends ``SKIP LOCKED`` support karte hain wahan candidate rows
+    ``select_for_update(skip_locked=True)`` se lock hote hain, to do reviewers
+    kabhi same row par wait nahi karte. SQLite par row locks nahi hote, wahan
+    har candidate par conditional UPDATE hota hai — jo reviewer pehle likhta
+    hai wahi jeetta hai, baaki agla candidate try karte hain. SELECT-then-UPDATE
+    SQLite par tabhi safe hai jab transaction IMMEDIATE mode me ho (settings ka
+    ``DATABASES`` ``OPTIONS``); DEFERRED me lock upgrade par "database is locked".
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        candidates = pending_queue(teacher, now)
+        if connection.features.has_select_for_update_skip_locked:
+            of = ('self',) if connection.features.has_select_for_update_of else ()
+            candidates = candidates.select_for_update(skip_locked=True, of=of)
+        for sub_id in candidates.values_list('id', flat=True)[:CLAIM_BATCH_SIZE]:
+            if _try_claim(sub_id, teacher, now):
+                return Submission.objects.select_related('group').get(pk=sub_id)
+    return None
+
+
+def claim_submission(sub, teacher):
+    """Specific submission ko claim karo (review page open karte waqt)."""
+    now = timezone.now()
+    if not _try_claim(sub.pk, teacher, now):
+        return False
+    sub.claimed_by = teacher
+    sub.claimed_until = now + claim_lease()
+    return True
+
+
+def release_claim(sub, teacher):
+    Submission.objects.filter(pk=sub.pk, claimed_by=teacher).update(
+        claimed_by=None, claimed_until=None
+    )
+
+
+def record_review(sub, teacher, status, feedback):
+    """
+    Review save karta hai sirf status/feedback/reviewed_at (aur lease clear)
+    likh kar, taaki student ka note ya file jaise baaki columns overwrite na hon.
+    Agar kisi aur reviewer ka active lease hai to ``ReviewConflict`` raise hota hai.
+    """
+    if status not in dict(Submission.STATUS_CHOICES):
+        raise ValueError(f"Invalid status: {status}")
+
+    now = timezone.now()
+    with transaction.atomic():
+        locked = Submission.objects.select_for_update().only(
+            'id', 'claimed_by', 'claimed_until'
+        ).get(pk=sub.pk)
+        if locked.is_claimed_by_other(teacher, now):
+            raise ReviewConflict("Submission is being reviewed by another teacher.")
+
+        sub.status = status
+        sub.feedback = feedback
+        sub.reviewed_at = now
+        sub.claimed_by = None
+        sub.claimed_until = None
+        sub.save(update_fields=[
+            'status', 'feedback', 'reviewed_at', 'claimed_by', 'claimed_until', 'updated_at',
+        ])
+        ReviewLog.objects.create(submission=sub, reviewer=teacher, status=status, feedback=feedback)
+        transaction.on_commit(lambda: submissions_reviewed.send(
+            sender=Submission, submission_ids=[sub.pk], status=status, reviewer=teacher,
+        ))
+    return sub
+
+
+# --------------------
+# Bulk review
+# --------------------
+def render_feedback(template, teacher, status, now):
+    """
+    Feedback template me ``{teacher}``, ``{status}`` aur ``{date}`` placeholders
+    replace karta hai. Values har row ke liye same hain, isliye poora batch
+    ek hi UPDATE me likha ja sakta hai.
+    """
+    values = {
+        '{teacher}': teacher.get_full_name() or teacher.username,
+        '{status}': dict(Submission.STATUS_CHOICES)[status],
+        '{date}': now.strftime('%d %b %Y'),
+    }
+    for placeholder, value in values.items():
+        template = template.replace(placeholder, value)
+    return template
+
+
+def bulk_review(teacher, submission_ids, status, feedback_template=''):
+    """
+    Selected submissions par ek saath status aur feedback lagata hai:
+    ek ``UPDATE ... WHERE id IN (...)``, ek ``bulk_create`` review logs ke liye
+    aur ek ``submissions_reviewed`` notification poore batch ke liye.
+
+    Scope wahi hai jo single review ka (``Submission.objects.for_teacher``):
+    group teacher aur topic creator dono. Jo kisi aur reviewer ke active lease
+    me hain unhe chhod diya jata hai. Updated ids return hote hain.
+    """
+    if status not in dict(Submission.STATUS_CHOICES):
+        raise ValueError(f"Invalid status: {status}")
+
+    now = timezone.now()
+    feedback = render_feedback(feedback_template, teacher, status, now)
+    with transaction.atomic():
+        # scope subquery me, taaki locked query me topic wala outer join na aaye
+        scoped = Submission.objects.for_teacher(teacher).filter(id__in=submission_ids).values('id')
+        targets = Submission.objects.filter(_claimable(teacher, now), id__in=scoped)
+        if connection.features.has_select_for_update:
+            targets = targets.select_for_update()
+        # audit diff ke liye purane values update se pehle
+        previous = {sub_id: (old_status, old_feedback) for sub_id, old_status, old_feedback
+                    in targets.values_list('id', 'status', 'feedback')}
+        ids = list(previous)
+        if not ids:
+            return []
+
+        Submission.objects.filter(id__in=ids).update(
+            status=status,
+            feedback=feedback,
+            reviewed_at=now,
+            claimed_by=None,
+            claimed_until=None,
+            updated_at=now,
+        )
+        ReviewLog.objects.bulk_create([
+            ReviewLog(submission_id=sub_id, reviewer=teacher, status=status, feedback=feedback, bulk=True)
+            for sub_id in ids
+        ])
+        # queryset update() par post_save nahi chalta
+        refresh_group_summaries(
+            Submission.objects.filter(id__in=ids).values_list('group_id', flat=True).distinct()
+        )
+        bump_on_commit(Submission)
+        for sub_id, old in previous.items():
+            changes = {
+                field: [before, after]
+                for field, before, after in zip(('status', 'feedback'), old, (status, feedback))
+                if before != after
+            }
+            if changes:
+                audit.record_raw(AuditEntry.ACTION_UPDATE, Submission, sub_id, changes, actor=teacher)
+        transaction.on_commit(lambda: submissions_reviewed.send(
+            sender=Submission, submission_ids=ids, status=status, reviewer=teacher,
+        ))
+    return ids
@@ -0,0 +1,88 @@
+import base64
+import json
+
+from django.db.models import F, Q
+
+from .models import CustomUser
+
+
+# --------------------
+# Student roster (compact JSON feed)
+# --------------------
+# Teacher ka roster page ab HTML me students nahi bharta; browser is feed se
+# pages laata hai aur sirf dikhne wali rows render karta hai (virtual scroll).
+# Feed columnar hai — ek baar column names, phir har student ki ek list — aur
+# sirf ye paanch columns DB se aate hain (password hash wagairah kabhi nahi).
+# Pagination keyset hai ``(semester, division, roll_no, id)`` par, jo
+# ``user_roster_idx`` se match karta hai: page 200 bhi page 1 jitna sasta.
+
+ROSTER_COLUMNS = ('id', 'username', 'roll_no', 'semester', 'division')
+ROSTER_ORDER = ('semester', 'division', 'roll_no', 'id')
+ROSTER_PAGE_SIZE = 500
+ROSTER_MAX_PAGE_SIZE = 2000
+
+_KEY_INDEX = [ROSTER_COLUMNS.index(name) for name in ROSTER_ORDER]
+
+
+def encode_key(key):
+    raw = json.dumps(key, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_key(cursor):
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, list) or len(key) != len(ROSTER_ORDER) or not isinstance(key[-1], int):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def _after(key):
+    """
+    ``ROSTER_ORDER`` me ``key`` ke baad wali rows. NULL pehle aate hain
+    (``nulls_first``), to NULL ke "baad" matlab NOT NULL, aur "barabar" matlab
+    IS NULL.
+    """
+    cond = Q(pk__gt=key[-1])
+    for name, value in reversed(list(zip(ROSTER_ORDER[:-1], key[:-1]))):
+        if value is None:
+            greater, equal = Q(**{f'{name}__isnull': False}), Q(**{f'{name}__isnull': True})
+        else:
+            greater, equal = Q(**{f'{name}__gt': value}), Q(**{name: value})
+        cond = greater | (equal & cond)
+    return cond
+
+
+def roster_queryset(semester=None, division=None):
+    students = CustomUser.objects.filter(role='student')
+    if semester:
+        students = students.filter(semester=semester)
+    if division:
+        students = students.filter(division=division)
+    return students
+
+
+def roster_page(students, cursor=None, limit=ROSTER_PAGE_SIZE):
+    """
+    Ek page: ``{'columns', 'rows', 'next'}``. Pehle page (bina cursor) par
+    ``total`` bhi, taaki virtual scroller poori height shuru me hi jaan le.
+    """
+    page = {'columns': ROSTER_COLUMNS}
+    if cursor:
+        ordered = students.filter(_after(decode_key(cursor)))
+    else:
+        ordered = students
+        page['total'] = students.count()
+    ordered = ordered.order_by(
+        *(F(name).asc(nulls_first=True) for name in ROSTER_ORDER[:-1]), 'id'
+    ).values_list(*ROSTER_COLUMNS)
+
+    rows = list(ordered[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    page['rows'] = rows
+    page['next'] = encode_key([rows[-1][i] for i in _KEY_INDEX]) if has_more else None
+    return page
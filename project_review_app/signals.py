@@ -0,0 +1,183 @@
+from django.dispatch import Signal
+
+
+# --------------------
+# App signals
+# --------------------
+# Review path ek hi batch me notification bhejta hai (single review me bhi list
+# of one). Receivers ko ``submission_ids``, ``status`` aur ``reviewer`` milte hain.
+submissions_reviewed = Signal()
+
+
+# --------------------
+# Tombstones for the change feed
+# --------------------
+def record_tombstone(sender, instance, **kwargs):
+    from .changefeed import tombstone_owners, tombstone_resource
+    from .models import Tombstone
+
+    resource = tombstone_resource(instance)
+    if resource:
+        teacher_id, topic_owner_id = tombstone_owners(instance)
+        Tombstone.objects.create(
+            resource=resource, object_id=instance.pk, teacher_id=teacher_id, topic_owner_id=topic_owner_id,
+        )
+
+
+# --------------------
+# Live notifications
+# --------------------
+def publish_query_message(sender, instance, created, **kwargs):
+    if not created:
+        return
+    from django.db import transaction
+    from .pubsub import publish
+    from .queries import group_channel
+
+    transaction.on_commit(lambda: publish(group_channel(instance.group_id), {
+        'type': 'query', 'group': instance.group_id, 'id': instance.pk,
+    }))
+
+
+def publish_submission_status(sender, submission_ids, status, **kwargs):
+    """Review batch ke har affected group ko ek event — group members ke SSE streams tak."""
+    from .models import Submission
+    from .pubsub import publish
+    from .queries import group_channel
+
+    rows = Submission.objects.filter(id__in=submission_ids).values_list('id', 'group_id', 'status', 'reviewed_at')
+    for sub_id, group_id, current_status, reviewed_at in rows:
+        publish(group_channel(group_id), {
+            'type': 'submission',
+            'group': group_id,
+            'id': sub_id,
+            'status': current_status,
+            'reviewed_at': reviewed_at.isoformat() if reviewed_at else None,
+        })
+
+
+# --------------------
+# Post-upload inspection
+# --------------------
+def schedule_inspection(sender, instance, created, **kwargs):
+    if not created or kwargs.get('raw'):
+        return
+    from django.db import transaction
+    from .processing import inspect_submission
+
+    transaction.on_commit(lambda: inspect_submission(instance))
+
+
+# --------------------
+# Group summary projection
+# --------------------
+def refresh_summary_on_save(sender, instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    from .models import CustomUser, ProjectGroup, Topic
+    from .summaries import refresh_group_summaries
+
+    if isinstance(instance, ProjectGroup):
+        group_ids = [instance.pk]
+    elif isinstance(instance, Topic):
+        group_ids = ProjectGroup.objects.filter(topic=instance).values_list('pk', flat=True)
+    elif isinstance(instance, CustomUser):
+        # sirf username summary me hai; last_login jaise saves skip
+        update_fields = kwargs.get('update_fields')
+        if instance.role != 'teacher' or (update_fields is not None and 'username' not in update_fields):
+            return
+        group_ids = ProjectGroup.objects.filter(teacher=instance).values_list('pk', flat=True)
+    else:
+        group_ids = [instance.group_id]
+    refresh_group_summaries(list(group_ids))
+
+
+def refresh_summary_on_delete(sender, instance, **kwargs):
+    # cascade delete ke beech group abhi exist karta hai; commit ke baad refresh
+    from .summaries import refresh_after_commit
+
+    refresh_after_commit([instance.group_id])
+
+
+def refresh_summary_on_topic_delete(sender, instance, **kwargs):
+    # pre_delete: SET_NULL ke baad topic ke groups pata nahi chalenge
+    from .models import ProjectGroup
+    from .summaries import refresh_after_commit
+
+    refresh_after_commit(ProjectGroup.objects.filter(topic=instance).values_list('pk', flat=True))
+
+
+# --------------------
+# Cache versions
+# --------------------
+def bump_cache_on_save(sender, instance, **kwargs):
+    # har login par last_login save hota hai; us se cached data nahi badalta
+    if kwargs.get('update_fields') == frozenset({'last_login'}):
+        return
+    from .caching import bump_on_commit
+
+    bump_on_commit(sender)
+
+
+def bump_cache_on_delete(sender, instance, **kwargs):
+    # SET_NULL/cascade updates signals nahi bhejte, isliye delete par sab bump
+    from .caching import TRACKED_MODELS, bump_on_commit
+
+    bump_on_commit(*TRACKED_MODELS)
+
+
+# --------------------
+# Topic seats
+# --------------------
+def release_topic_on_group_delete(sender, instance, **kwargs):
+    if instance.topic_id:
+        from .topics import release_claims
+
+        release_claims({instance.topic_id: 1})
+
+
+# --------------------
+# Group seats
+# --------------------
+def release_seat_on_member_delete(sender, instance, **kwargs):
+    from .memberships import release_seat
+
+    release_seat(instance.group_id)
+
+
+def connect_receivers():
+    from django.contrib.auth.signals import user_logged_in, user_login_failed
+    from django.db.backends.signals import connection_created
+    from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+    from .audit import AUDITED_MODELS, record_delete, record_save, take_snapshot
+    from .caching import TRACKED_MODELS
+    from .metrics import record_login_failure, record_login_success
+    from .middleware import install_query_timer
+    from .models import CustomUser, GroupMember, ProjectGroup, Query, Submission, Topic
+
+    for model in (CustomUser, Topic, ProjectGroup, GroupMember, Submission, Query):
+        post_delete.connect(record_tombstone, sender=model, dispatch_uid=f'tombstone_{model.__name__}')
+    post_save.connect(publish_query_message, sender=Query, dispatch_uid='publish_query_message')
+    post_save.connect(schedule_inspection, sender=Submission, dispatch_uid='schedule_inspection')
+
+    for model in (CustomUser, Topic, ProjectGroup, GroupMember, Submission):
+        post_save.connect(refresh_summary_on_save, sender=model, dispatch_uid=f'summary_save_{model.__name__}')
+    for model in (GroupMember, Submission):
+        post_delete.connect(refresh_summary_on_delete, sender=model, dispatch_uid=f'summary_delete_{model.__name__}')
+    pre_delete.connect(refresh_summary_on_topic_delete, sender=Topic, dispatch_uid='summary_delete_Topic')
+    post_delete.connect(release_topic_on_group_delete, sender=ProjectGroup, dispatch_uid='release_topic_on_group_delete')
+    post_delete.connect(release_seat_on_member_delete, sender=GroupMember, dispatch_uid='release_seat_on_member_delete')
+
+    for model in TRACKED_MODELS:
+        post_save.connect(bump_cache_on_save, sender=model, dispatch_uid=f'cache_save_{model.__name__}')
+        post_delete.connect(bump_cache_on_delete, sender=model, dispatch_uid=f'cache_delete_{model.__name__}')
+
+    for model in AUDITED_MODELS:
+        post_init.connect(take_snapshot, sender=model, dispatch_uid=f'audit_init_{model.__name__}')
+        post_save.connect(record_save, sender=model, dispatch_uid=f'audit_save_{model.__name__}')
+        post_delete.connect(record_delete, sender=model, dispatch_uid=f'audit_delete_{model.__name__}')
+
+    submissions_reviewed.connect(publish_submission_status, dispatch_uid='publish_submission_status')
+    connection_created.connect(install_query_timer, dispatch_uid='metrics_query_timer')
+    user_logged_in.connect(record_login_success, dispatch_uid='metrics_login_success')
+    user_login_failed.connect(record_login_failure, dispatch_uid='metrics_login_failure')
@@ -0,0 +1,95 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+
+from .models import Fingerprint, SimilarityMatch, Submission, SubmissionManifest
+
+
+# --------------------
+# Similarity check (shingled fingerprints)
+# --------------------
+# Inspection pool har upload ke text ke winnowing fingerprints bhi banata hai
+# (``fingerprints.py``). Yahan wo ``Fingerprint`` inverted index me jate hain
+# aur usi waqt naye submission ke liye sabse milte-julte submissions dhoondhe
+# jate hain. Index incremental hai — naya upload sirf apne hashes ki postings
+# padhta hai (``hash IN (...)``, unique constraint ka index), poore corpus ko
+# nahi. Bahut common hashes (license header, boilerplate) skip hote hain.
+
+TOP_MATCHES = 5
+MIN_SHARED = 8
+MIN_SCORE = 0.2
+# itne se zyada submissions me mila hash boilerplate maana jata hai
+MAX_POSTINGS = 50
+LOOKUP_BATCH = 500
+INSERT_BATCH = 1000
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def index_submission(submission_id, hashes):
+    """Purane fingerprints/matches hata kar naye likho, phir matches dhoondho."""
+    hashes = sorted(set(hashes))
+    with transaction.atomic():
+        Fingerprint.objects.filter(submission_id=submission_id).delete()
+        SimilarityMatch.objects.filter(submission_id=submission_id).delete()
+        SimilarityMatch.objects.filter(other_id=submission_id).delete()
+        Fingerprint.objects.bulk_create(
+            [Fingerprint(hash=h, submission_id=submission_id) for h in hashes], batch_size=INSERT_BATCH
+        )
+        SubmissionManifest.objects.filter(submission_id=submission_id).update(fingerprint_count=len(hashes))
+        return find_matches(submission_id, hashes)
+
+
+def find_matches(submission_id, hashes):
+    """
+    Dusre groups ke top ``TOP_MATCHES`` submissions; dono directions me
+    ``SimilarityMatch`` rows likhi jati hain taaki purane submission ke review
+    page par bhi naya match dikhe. Likhe gaye matches return hote hain.
+    """
+    if not hashes:
+        return []
+    group_id = Submission.objects.filter(pk=submission_id).values_list('group_id', flat=True).first()
+
+    postings = defaultdict(list)
+    for chunk in _chunks(hashes, LOOKUP_BATCH):
+        rows = (
+            Fingerprint.objects.filter(hash__in=chunk)
+            .exclude(submission__group_id=group_id)
+            .values_list('hash', 'submission_id')
+        )
+        for h, other in rows:
+            postings[h].append(other)
+
+    shared = Counter()
+    for others in postings.values():
+        if len(others) <= MAX_POSTINGS:
+            shared.update(others)
+    candidates = [(other, n) for other, n in shared.most_common() if n >= MIN_SHARED]
+    if not candidates:
+        return []
+
+    sizes = dict(
+        SubmissionManifest.objects.filter(submission_id__in=[other for other, _ in candidates])
+        .values_list('submission_id', 'fingerprint_count')
+    )
+    scored = sorted(
+        (
+            (n / max(min(len(hashes), sizes.get(other) or n), 1), n, other)
+            for other, n in candidates
+        ),
+        reverse=True,
+    )
+    matches = []
+    for score, n, other in scored[:TOP_MATCHES]:
+        if score < MIN_SCORE:
+            break
+        score = min(score, 1.0)
+        matches.append(SimilarityMatch(submission_id=submission_id, other_id=other, shared=n, score=score))
+        matches.append(SimilarityMatch(submission_id=other, other_id=submission_id, shared=n, score=score))
+    SimilarityMatch.objects.bulk_create(
+        matches, update_conflicts=True, unique_fields=['submission', 'other'], update_fields=['shared', 'score'],
+    )
+    return matches[::2]
@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery
+
+from .models import GroupSummary, ProjectGroup, Submission
+
+
+# --------------------
+# Group summary projection
+# --------------------
+# Group listings har group ke liye member count, latest submission aur topic
+# join karke nikalte the. ``GroupSummary`` ye values pehle se rakhta hai:
+#   - saves (member add, submission upload/review, group/topic edit) par usi
+#     transaction me refresh hota hai
+#   - deletes par commit ke baad (cascade delete ke beech summary row insert na ho)
+#   - ``rebuild_group_summaries`` command poora rebuild / consistency check karta hai
+
+SUMMARY_FIELDS = [
+    'teacher_id', 'member_count', 'pending_count', 'latest_submission_at',
+    'latest_status', 'topic_title', 'teacher_name',
+]
+
+
+def live_aggregates(group_ids=None):
+    """Live tables se summary values, ek aggregate query me."""
+    latest = Submission.objects.filter(group=OuterRef('pk')).order_by('-submitted_at', '-pk')
+    qs = ProjectGroup.objects.annotate(
+        agg_member_count=Count('members', distinct=True),
+        agg_pending_count=Count(
+            'submissions', filter=Q(submissions__status=Submission.STATUS_PENDING), distinct=True
+        ),
+        agg_latest_submission_at=Max('submissions__submitted_at'),
+        agg_latest_status=Subquery(latest.values('status')[:1]),
+        agg_topic_title=F('topic__title'),
+        agg_teacher_name=F('teacher__username'),
+    )
+    if group_ids is not None:
+        qs = qs.filter(pk__in=group_ids)
+    return qs.values(
+        'pk', 'teacher_id', 'agg_member_count', 'agg_pending_count',
+        'agg_latest_submission_at', 'agg_latest_status', 'agg_topic_title', 'agg_teacher_name',
+    )
+
+
+def _to_summary(row):
+    return GroupSummary(
+        group_id=row['pk'],
+        teacher_id=row['teacher_id'],
+        member_count=row['agg_member_count'],
+        pending_count=row['agg_pending_count'],
+        latest_submission_at=row['agg_latest_submission_at'],
+        latest_status=row['agg_latest_status'] or '',
+        topic_title=row['agg_topic_title'] or '',
+        teacher_name=row['agg_teacher_name'] or '',
+    )
+
+
+def refresh_group_summaries(group_ids):
+    """Given groups ki summary dobara compute karke upsert karo (2 queries)."""
+    group_ids = {gid for gid in group_ids if gid}
+    if not group_ids:
+        return 0
+    summaries = [_to_summary(row) for row in live_aggregates(group_ids)]
+    GroupSummary.objects.bulk_create(
+        summaries,
+        update_conflicts=True,
+        unique_fields=['group'],
+        update_fields=SUMMARY_FIELDS + ['refreshed_at'],
+    )
+    return len(summaries)
+
+
+def refresh_after_commit(group_ids):
+    group_ids = set(group_ids)
+    transaction.on_commit(lambda: refresh_group_summaries(group_ids))
+
+
+def rebuild_all(batch_size=500):
+    ids = list(ProjectGroup.objects.order_by('pk').values_list('pk', flat=True))
+    total = 0
+    for i in range(0, len(ids), batch_size):
+        with transaction.atomic():
+            total += refresh_group_summaries(ids[i:i + batch_size])
+    return total
+
+
+def check_consistency():
+    """
+    Projection ko live aggregates se compare karta hai. Har mismatch ek
+    ``(group_id, field, stored, live)`` tuple hai; missing summary ke liye field ``'*'``.
+    """
+    stored = {s.group_id: s for s in GroupSummary.objects.all()}
+    problems = []
+    for row in live_aggregates().iterator(chunk_size=500):
+        live = _to_summary(row)
+        summary = stored.pop(live.group_id, None)
+        if summary is None:
+            problems.append((live.group_id, '*', None, 'missing'))
+            continue
+        for field in SUMMARY_FIELDS:
+            if getattr(summary, field) != getattr(live, field):
+                problems.append((live.group_id, field, getattr(summary, field), getattr(live, field)))
+    for group_id in stored:
+        problems.append((group_id, '*', 'orphan', None))
+    return problems
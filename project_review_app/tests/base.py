@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import threading
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import TestCase, TransactionTestCase, override_settings
+
+
+@override_settings(SUBMISSION_INSPECTION_MODE='off')
+class AppTestCase(TestCase):
+    """
+    Har test class ka apna MEDIA_ROOT (temp dir) hota hai, to ``--parallel``
+    workers ek doosre ki uploads overwrite/delete nahi karte. Cache har test se
+    pehle saaf, taaki cached views ke query budgets deterministic rahein.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._media_root = tempfile.mkdtemp(prefix='project-review-test-media-')
+        cls._media_override = override_settings(MEDIA_ROOT=cls._media_root)
+        cls._media_override.enable()
+        cls.addClassCleanup(shutil.rmtree, cls._media_root, ignore_errors=True)
+        cls.addClassCleanup(cls._media_override.disable)
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+
+class ThreadedTestCase(TransactionTestCase):
+    """
+    Concurrency tests ke liye. Test DB in-memory (shared cache) hai jisme
+    parallel writers wait karne ki jagah "table is locked" dete hain, isliye
+    ``run_threads`` ka har thread apna connection ek temp file DB par kholta hai
+    (schema class ke start par bana). Asserts bhi ``in_thread`` se usi DB par.
+    Connection ke ``OPTIONS`` settings se aate hain, koi test-only locking nahi.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        tmp = tempfile.mkdtemp(prefix='project-review-threads-')
+        cls.addClassCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        cls.file_db = {**connection.settings_dict, 'NAME': os.path.join(tmp, 'threads.sqlite3')}
+        db = DatabaseWrapper(cls.file_db)
+        with db.schema_editor() as editor:
+            for model in apps.get_models():
+                editor.create_model(model)
+        db.close()
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def _on_file_db(self, fn, *args):
+        connection.settings_dict = self.file_db
+        try:
+            return fn(*args)
+        finally:
+            connection.close()
+
+    def run_threads(self, fn, count):
+        """``fn(i)`` ``count`` threads me ek saath (barrier); results ya exceptions, ``i`` ke order me."""
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def work(i):
+            barrier.wait()
+            try:
+                results[i] = fn(i)
+            except Exception as exc:
+                results[i] = exc
+
+        threads = [threading.Thread(target=self._on_file_db, args=(work, i)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def in_thread(self, fn, *args):
+        """Setup/asserts: ``fn`` file DB par ek thread me."""
+        return self.run_threads(lambda i: fn(*args), 1)[0]
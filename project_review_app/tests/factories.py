@@ -0,0 +1,102 @@
+"""
+Test data factories. Har factory sensible defaults ke saath ek saved object
+banati hai; jo field test ke liye matter karta hai wahi pass karo. Usernames,
+emails aur roll numbers ek counter se unique rehte hain, taaki parallel workers
+aur ``setUpTestData`` dono me collisions na hon.
+"""
+import itertools
+
+from django.core.files.base import ContentFile
+from django.db.models import F
+
+from ..memberships import add_member
+from ..models import Criterion, CustomUser, ProjectGroup, Query, Rubric, Submission, Topic
+
+_seq = itertools.count(1)
+
+
+def make_user(username=None, role='student', password='pass', **extra):
+    n = next(_seq)
+    username = username or f'{role}{n}'
+    extra.setdefault('email', f'{username}@example.com')
+    if role == 'student':
+        extra.setdefault('semester', 5)
+        extra.setdefault('division', 'A')
+        extra.setdefault('roll_no', f'R{n:04d}')
+    return CustomUser.objects.create_user(username=username, password=password, role=role, **extra)
+
+
+def make_teacher(username=None, **extra):
+    return make_user(username, role='teacher', **extra)
+
+
+def make_student(username=None, **extra):
+    return make_user(username, role='student', **extra)
+
+
+def make_admin(username=None, **extra):
+    return make_user(username, role='admin', **extra)
+
+
+def make_topic(created_by=None, title=None, capacity=3, **extra):
+    created_by = created_by or make_teacher()
+    return Topic.objects.create(
+        title=title or f'Topic {next(_seq)}', created_by=created_by, capacity=capacity, **extra
+    )
+
+
+def make_group(teacher=None, topic=None, name=None, members=(), **extra):
+    """Group banao; ``topic`` ho to uski ek seat claim hoti hai, ``members`` students add hote hain."""
+    teacher = teacher or make_teacher()
+    group = ProjectGroup.objects.create(
+        name=name or f'Group {next(_seq)}', teacher=teacher, topic=topic, **extra
+    )
+    if topic is not None:
+        Topic.objects.filter(pk=topic.pk).update(claimed_count=F('claimed_count') + 1)
+    for student in members:
+        make_member(group, student)
+    return group
+
+
+def make_member(group, student=None):
+    """``add_member`` se, taaki seat counter aur cohort semester sahi rahein."""
+    return add_member(group, student or make_student())
+
+
+def make_submission(group, uploaded_by=None, content=None, name='report.txt', **extra):
+    """
+    Submission. ``content`` diya ho to file MEDIA_ROOT me sach me likhi jati hai
+    (download tests ke liye); warna sirf file ka naam save hota hai.
+    """
+    if uploaded_by is None:
+        member = group.members.select_related('student').first()
+        uploaded_by = member.student if member else None
+    sub = Submission(group=group, uploaded_by=uploaded_by, **extra)
+    if content is None:
+        sub.file.name = f'submissions/{next(_seq)}-{name}'
+        sub.save()
+    else:
+        sub.file.save(name, ContentFile(content), save=True)
+    return sub
+
+
+def make_query(group, author=None, message=None, **extra):
+    if author is None:
+        member = group.members.select_related('student').first()
+        author = member.student if member else group.teacher
+    if author.role == 'student':
+        extra.setdefault('student', author)
+    return Query.objects.create(
+        group=group, author=author, message=message or f'Question {next(_seq)}', **extra
+    )
+
+
+def make_rubric(created_by=None, criteria=(('Report', 2, 10), ('Demo', 1, 5)), name=None, **extra):
+    """Rubric with ``(name, weight, max_score)`` criteria; ``topic`` ya ``semester`` ``extra`` me do."""
+    created_by = created_by or make_teacher()
+    rubric = Rubric.objects.create(name=name or f'Rubric {next(_seq)}', created_by=created_by, **extra)
+    Criterion.objects.bulk_create([
+        Criterion(rubric=rubric, name=c_name, weight=weight, max_score=max_score, position=i)
+        for i, (c_name, weight, max_score) in enumerate(criteria)
+    ])
+    return rubric
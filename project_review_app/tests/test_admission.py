@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from ..admission import UploadGate, gate_uploads
+
+
+class UploadGateTests(SimpleTestCase):
+    def test_waiters_get_slots_in_arrival_order(self):
+        gate = UploadGate(limit=1, queue_limit=5, queue_wait=5, retry_after=10)
+        order = []
+
+        async def upload(n):
+            self.assertTrue(await gate.acquire())
+            order.append(n)
+            await asyncio.sleep(0)
+            gate.release()
+
+        async def main():
+            self.assertTrue(await gate.acquire())
+            tasks = []
+            for n in range(4):
+                tasks.append(asyncio.create_task(upload(n)))
+                await asyncio.sleep(0)
+            self.assertEqual(gate.waiting, 4)
+            gate.release()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        self.assertEqual(order, [0, 1, 2, 3])
+        self.assertEqual((gate.active, gate.waiting), (0, 0))
+
+    def test_full_queue_and_timeout_reject(self):
+        gate = UploadGate(limit=1, queue_limit=1, queue_wait=0.05, retry_after=10)
+
+        async def main():
+            self.assertTrue(await gate.acquire())
+            waiter = asyncio.create_task(gate.acquire())
+            await asyncio.sleep(0)
+            self.assertEqual(gate.retry_after(), 20)
+            self.assertFalse(await gate.acquire())   # queue full
+            self.assertFalse(await waiter)           # wait timeout
+
+        asyncio.run(main())
+        self.assertEqual((gate.active, gate.waiting), (1, 0))
+
+    def test_threads_and_event_loops_share_the_queue(self):
+        gate = UploadGate(limit=1, queue_limit=5, queue_wait=5, retry_after=10)
+        self.assertTrue(gate.acquire_blocking())
+        results = []
+        thread = threading.Thread(target=lambda: results.append(gate.acquire_blocking()))
+        thread.start()
+        while not gate.waiting:
+            time.sleep(0.001)
+
+        # async waiter bhi usi queue me, thread waiter ke peeche
+        async def late():
+            return await gate.acquire()
+
+        late_thread = threading.Thread(target=lambda: results.append(asyncio.run(late())))
+        late_thread.start()
+        while gate.waiting < 2:
+            time.sleep(0.001)
+        gate.release()
+        thread.join(5)
+        self.assertEqual(results, [True])
+        gate.release()
+        late_thread.join(5)
+        self.assertEqual(results, [True, True])
+        self.assertEqual((gate.active, gate.waiting), (1, 0))
+
+
+class UploadGateAsgiTests(SimpleTestCase):
+    def run_app(self, gate, path):
+        calls = {'receive': 0, 'scopes': []}
+        sent = []
+
+        async def inner(scope, receive, send):
+            calls['scopes'].append(scope)
+
+        async def receive():
+            calls['receive'] += 1
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': 'POST', 'path': path, 'root_path': ''}
+        with mock.patch('project_review_app.admission.get_gate', return_value=gate):
+            asyncio.run(gate_uploads(inner)(scope, receive, send))
+        return calls, sent
+
+    def test_busy_gate_rejects_before_reading_the_body(self):
+        gate = UploadGate(limit=1, queue_limit=0, queue_wait=0.05, retry_after=10)
+        self.assertTrue(gate.acquire_blocking())
+        calls, sent = self.run_app(gate, reverse('upload_submission'))
+        self.assertEqual(calls, {'receive': 0, 'scopes': []})
+        self.assertEqual(sent[0]['status'], 503)
+        self.assertIn((b'retry-after', b'10'), sent[0]['headers'])
+
+    def test_admitted_upload_holds_a_slot_until_done(self):
+        gate = UploadGate(limit=1, queue_limit=0, queue_wait=0.05, retry_after=10)
+        calls, _ = self.run_app(gate, reverse('upload_submission'))
+        self.assertTrue(calls['scopes'][0]['upload_admitted'])
+        self.assertEqual(gate.active, 0)
+        # baaki requests gate ko chhoote bhi nahi
+        self.assertTrue(gate.acquire_blocking())
+        calls, _ = self.run_app(gate, reverse('project_submission'))
+        self.assertEqual(len(calls['scopes']), 1)
+        self.assertNotIn('upload_admitted', calls['scopes'][0])
+
+    def test_wsgi_middleware_gates_before_csrf(self):
+        gate = UploadGate(limit=1, queue_limit=0, queue_wait=0.05, retry_after=10)
+        self.assertTrue(gate.acquire_blocking())
+        with mock.patch('project_review_app.middleware.get_gate', return_value=gate):
+            response = self.client.post(reverse('upload_submission'), {'note': 'x'})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '10')
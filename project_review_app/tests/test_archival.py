@@ -0,0 +1,91 @@
+import os
+import shutil
+import tarfile
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ..archival import GROUP_DERIVED, GROUP_OWNED, purge_groups
+from ..models import GroupMember, ProjectGroup, Query, Submission, Tombstone, Topic
+from .base import AppTestCase
+from .factories import make_group, make_query, make_student, make_submission, make_teacher, make_topic
+
+
+class ArchiveSemesterTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.topic = make_topic(cls.teacher, capacity=5)
+        cls.old = [make_group(cls.teacher, cls.topic, semester=5, members=[make_student()]) for _ in range(3)]
+        cls.current = make_group(cls.teacher, cls.topic, semester=6, members=[make_student(semester=6)])
+        for group in cls.old + [cls.current]:
+            make_query(group)
+
+    def setUp(self):
+        super().setUp()
+        self.out = tempfile.mkdtemp(prefix='project-review-archive-')
+        self.addCleanup(shutil.rmtree, self.out, ignore_errors=True)
+        self.files = [make_submission(group, content=b'report %d' % group.pk) for group in self.old]
+        make_submission(self.current, content=b'current')
+
+    def archive(self, *args):
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('archive_semester', '--semester', '5', '--output-dir', self.out,
+                         '--batch-size', '2', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_archives_then_purges_only_that_semester(self):
+        output = self.archive()
+        self.assertIn('3 group(s) selected.', output)
+        self.assertIn('Removed 3 group(s)', output)
+
+        self.assertEqual(list(ProjectGroup.objects.values_list('pk', flat=True)), [self.current.pk])
+        for model in (GroupMember, Submission, Query):
+            self.assertEqual(set(model.objects.values_list('group_id', flat=True)), {self.current.pk})
+        self.assertEqual(Topic.objects.get(pk=self.topic.pk).claimed_count, 1)
+        storage = Submission._meta.get_field('file').storage
+        self.assertFalse(any(storage.exists(sub.file.name) for sub in self.files))
+
+        # change feed ke liye tombstones, group owner ke saath
+        tombs = Tombstone.objects.filter(resource='groups')
+        self.assertEqual({t.object_id for t in tombs}, {g.pk for g in self.old})
+        self.assertEqual({t.teacher_id for t in tombs}, {self.teacher.pk})
+        self.assertEqual(Tombstone.objects.filter(resource='submissions').count(), 3)
+
+        [name] = os.listdir(self.out)
+        with tarfile.open(os.path.join(self.out, name)) as tar:
+            names = set(tar.getnames())
+            self.assertIn('data/project_review_app.projectgroup.json', names)
+            self.assertTrue({f'files/{sub.file.name}' for sub in self.files} <= names)
+            self.assertEqual(tar.extractfile(f'files/{self.files[0].file.name}').read(),
+                             b'report %d' % self.old[0].pk)
+
+    def test_archive_restores_with_loaddata(self):
+        self.archive()
+        with tarfile.open(os.path.join(self.out, os.listdir(self.out)[0])) as tar:
+            tar.extractall(self.out, filter='data')
+        data = os.path.join(self.out, 'data')
+        call_command('loaddata', *sorted(os.path.join(data, n) for n in os.listdir(data)), verbosity=0)
+        self.assertEqual(ProjectGroup.objects.count(), 4)
+        self.assertEqual(Submission.objects.filter(group__semester=5).count(), 3)
+
+    def test_keep_dry_run_and_bad_date(self):
+        self.assertIn('3 group(s) selected.', self.archive('--dry-run'))
+        self.assertEqual(os.listdir(self.out), [])
+        self.archive('--keep', '--no-files')
+        self.assertEqual(ProjectGroup.objects.count(), 4)
+        with self.assertRaises(CommandError):
+            self.archive('--before', '31-12-2025')
+
+    def test_purge_groups_uses_set_based_deletes(self):
+        # har model par ek DELETE aur tombstones ka ek INSERT, groups kitne bhi hon
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(purge_groups([g.pk for g in self.old]), 3)
+        sql = [q['sql'] for q in ctx.captured_queries]
+        deletes = [q for q in sql if q.startswith('DELETE')]
+        self.assertEqual(len(deletes), len(GROUP_OWNED) + len(GROUP_DERIVED))
+        self.assertEqual(len([q for q in sql if q.startswith('INSERT INTO "project_review_app_tombstone"')]), 1)
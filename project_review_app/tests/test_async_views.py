@@ -0,0 +1,66 @@
+import json
+
+from django.http import FileResponse
+from django.urls import reverse
+
+from .. import async_views
+from .base import AppTestCase
+from .factories import make_group, make_student, make_submission, make_teacher, make_topic
+
+
+class AsyncViewTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.student = make_student(username='grace')
+        cls.outsider = make_student()
+        topic = make_topic(cls.teacher, 'Graph search')
+        group = make_group(cls.teacher, topic, 'Green', members=[cls.student])
+        cls.content = b'x' * (async_views.DOWNLOAD_CHUNK_SIZE * 2 + 10)
+        cls.sub = make_submission(group, content=cls.content)
+
+    async def test_async_download_streams_in_chunks_under_asgi(self):
+        await self.async_client.aforce_login(self.student)
+        response = await self.async_client.get(reverse('download_submission', args=[self.sub.pk]))
+        self.assertNotIsInstance(response, FileResponse)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual([len(c) for c in chunks], [async_views.DOWNLOAD_CHUNK_SIZE] * 2 + [10])
+        self.assertEqual(int(response['Content-Length']), len(self.content))
+
+    def test_async_download_uses_file_response_under_wsgi(self):
+        # WSGI par async iterator poora buffer hota; sync file iterator stream hota hai
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('download_submission', args=[self.sub.pk]))
+        self.assertIsInstance(response, FileResponse)
+        self.assertFalse(response.is_async)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertIn('attachment;', response['Content-Disposition'])
+
+    def test_sync_download_is_scoped(self):
+        url = reverse('download_submission_sync', args=[self.sub.pk])
+        self.client.force_login(self.outsider)
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.client.force_login(self.teacher)
+        response = self.client.get(url)
+        self.assertIsInstance(response, FileResponse)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    async def test_sync_twins_return_same_json(self):
+        await self.async_client.aforce_login(self.teacher)
+        results = {}
+        for name, query in (('dashboard_counters', ''), ('teacher_search', 'q=gr'), ('teacher_search', 'q=g')):
+            with self.subTest(name=name, query=query):
+                async_response = await self.async_client.get(reverse(name), QUERY_STRING=query)
+                sync_response = await self.async_client.get(reverse(f'{name}_sync'), QUERY_STRING=query)
+                results[query] = json.loads(async_response.content)
+                self.assertEqual(results[query], json.loads(sync_response.content))
+        self.assertEqual(results['']['pending_reviews_count'], 1)
+        self.assertEqual([row['username'] for row in results['q=gr']['students']], ['grace'])
+        self.assertEqual([row['name'] for row in results['q=gr']['groups']], ['Green'])
+        self.assertEqual(results['q=g'], {'topics': [], 'groups': [], 'students': []})
+
+    def test_event_stream_is_off_under_wsgi(self):
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('submission_events'))
+        self.assertEqual(response.status_code, 204)
@@ -0,0 +1,158 @@
+import gzip
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .. import audit
+from ..models import AuditEntry, Submission
+from ..reviews import bulk_review
+from .base import AppTestCase
+from .factories import make_admin, make_group, make_student, make_submission, make_teacher
+
+
+class AuditLogTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin()
+        cls.teacher = make_teacher()
+        cls.student = make_student(roll_no='R1', semester=5, division='A')
+        cls.group = make_group(cls.teacher, members=[cls.student])
+        cls.subs = [make_submission(cls.group) for _ in range(3)]
+
+    def setUp(self):
+        super().setUp()
+        AuditEntry.objects.all().delete()
+
+    def test_request_writes_one_bulk_insert_with_diff(self):
+        self.client.force_login(self.admin)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(reverse('edit_student', args=[self.student.pk]), {
+                'username': self.student.username, 'email': self.student.email,
+                'roll_no': 'R42', 'semester': 5, 'division': 'B',
+            })
+        inserts = [q for q in ctx.captured_queries if 'INSERT INTO "project_review_app_auditentry"' in q['sql']]
+        self.assertEqual(len(inserts), 1)
+
+        entry = AuditEntry.objects.get()
+        self.assertEqual((entry.action, entry.model, entry.object_id), ('update', 'customuser', self.student.pk))
+        self.assertEqual(entry.changes, {'roll_no': ['R1', 'R42'], 'division': ['A', 'B']})
+        self.assertEqual(entry.actor_id, self.admin.pk)
+        self.assertEqual(entry.path, reverse('edit_student', args=[self.student.pk]))
+
+    def test_async_chain_flushes_entries(self):
+        self.async_client.force_login(self.admin)
+        async_to_sync(self.async_client.post)(reverse('edit_student', args=[self.student.pk]), {
+            'username': self.student.username, 'email': self.student.email,
+            'roll_no': 'R43', 'semester': 5, 'division': 'A',
+        })
+        entry = AuditEntry.objects.get()
+        self.assertEqual(entry.changes, {'roll_no': ['R1', 'R43']})
+        self.assertEqual(entry.actor_id, self.admin.pk)
+
+    def test_get_requests_write_nothing(self):
+        self.client.force_login(self.admin)
+        self.client.get(reverse('manage_students'))
+        self.assertFalse(AuditEntry.objects.exists())
+
+    def test_delete_and_password_redaction(self):
+        user = make_student()
+        entry = AuditEntry.objects.get(model='customuser', object_id=user.pk, action='create')
+        self.assertEqual(entry.changes['password'], [None, audit.REDACTED])
+
+        self.client.force_login(self.admin)
+        self.client.post(reverse('delete_student', args=[user.pk]))
+        entry = AuditEntry.objects.get(model='customuser', object_id=user.pk, action='delete')
+        self.assertEqual(entry.changes['username'], [user.username, None])
+        self.assertEqual(entry.actor_id, self.admin.pk)
+
+    def test_bulk_review_records_each_submission(self):
+        ids = [s.pk for s in self.subs[:2]]
+        Submission.objects.filter(pk=ids[0]).update(feedback='Needs tests')
+        with audit.capture() as batch:
+            bulk_review(self.teacher, ids, 'approved', 'Good')
+            self.assertEqual(len(batch.entries), 2)
+            batch.flush()
+        entries = AuditEntry.objects.filter(model='submission', action='update')
+        self.assertEqual(sorted(e.object_id for e in entries), ids)
+        self.assertTrue(all(e.changes['status'] == ['pending', 'approved'] for e in entries))
+        self.assertEqual(sorted(e.changes['feedback'] for e in entries), [['', 'Good'], ['Needs tests', 'Good']])
+        self.assertTrue(all(e.actor_id == self.teacher.pk for e in entries))
+
+    def test_rolled_back_writes_are_not_logged(self):
+        with audit.capture() as batch:
+            try:
+                with transaction.atomic():
+                    make_student()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            kept = make_student()
+            self.assertEqual([(e.model, e.object_id) for e in batch.entries], [('customuser', kept.pk)])
+
+        # assign_members: set_members full group par rollback karta hai, view 200 deta hai
+        member, busy = make_student(), make_student()
+        group = make_group(self.teacher, max_members=1, members=[member])
+        make_group(self.teacher, members=[busy])
+        self.client.force_login(self.teacher)
+        url = reverse('assign_members', args=[group.pk])
+        response = self.client.post(url, {'students': [busy.pk]})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['form'].has_error('students'))
+        self.assertEqual(group.members.get().student, member)
+        self.assertFalse(AuditEntry.objects.filter(path=url).exists())
+
+    def test_entries_are_append_only(self):
+        entry = audit.record(AuditEntry.ACTION_UPDATE, self.group, {'name': ['a', 'b']})
+        with self.assertRaises(TypeError):
+            AuditEntry.objects.filter(pk=entry.pk).update(model='x')
+        with self.assertRaises(TypeError):
+            entry.save()
+        with self.assertRaises(TypeError):
+            entry.delete()
+
+    def test_rotate_archives_then_deletes_old_entries(self):
+        old = audit.record(AuditEntry.ACTION_UPDATE, self.group, {'name': ['a', 'b']})
+        AuditEntry.objects.filter(pk=old.pk).delete()
+        AuditEntry.objects.bulk_create([AuditEntry(
+            action='update', model='projectgroup', object_id=self.group.pk,
+            created_at=timezone.now() - timedelta(days=400),
+        ) for _ in range(3)])
+        audit.record(AuditEntry.ACTION_UPDATE, self.group, {'name': ['b', 'c']})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'audit.jsonl.gz')
+            removed = audit.rotate(timezone.now() - timedelta(days=365), path, batch_size=2)
+            with gzip.open(path, 'rt') as f:
+                archived = [json.loads(line) for line in f]
+        self.assertEqual(removed, 3)
+        self.assertEqual(len(archived), 3)
+        self.assertEqual(AuditEntry.objects.count(), 1)
+
+        out = StringIO()
+        call_command('rotate_audit_log', '--days', '0', '--no-archive', stdout=out)
+        self.assertIn('Removed 1 audit entries', out.getvalue())
+        self.assertFalse(AuditEntry.objects.exists())
+
+    def test_admin_view_filters_and_is_admin_only(self):
+        audit.record(AuditEntry.ACTION_UPDATE, self.group, {'name': ['a', 'b']}, actor=self.teacher)
+        audit.record(AuditEntry.ACTION_UPDATE, self.student, {'roll_no': ['1', '2']})
+
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('audit_log'), {'model': 'projectgroup', 'object_id': self.group.pk})
+        self.assertEqual([e.model for e in response.context['entries']], ['projectgroup'])
+        response = self.client.get(reverse('audit_log'), {'actor': self.teacher.pk})
+        self.assertEqual(len(response.context['entries']), 1)
+        response = self.client.get(reverse('audit_log'), {'object_id': 'x', 'model': 'customuser'})
+        self.assertEqual(response.context['entries'], [])
+
+        self.client.force_login(self.teacher)
+        self.assertRedirects(self.client.get(reverse('audit_log')), reverse('home'), fetch_redirect_response=False)
@@ -0,0 +1,82 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+
+from ..caching import cache_stats, cached, model_versions, reset_stats
+from ..models import ProjectGroup, Submission, Topic
+from ..reviews import bulk_review
+from .base import AppTestCase
+from .factories import make_group, make_submission, make_teacher, make_topic
+
+
+class VersionedCacheTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.topic = make_topic(cls.teacher, title='Compilers')
+
+    def setUp(self):
+        super().setUp()
+        reset_stats()
+        self.calls = 0
+
+    def titles(self):
+        def compute():
+            self.calls += 1
+            return sorted(Topic.objects.values_list('title', flat=True))
+        return cached('titles', [self.teacher.pk], [Topic], compute)
+
+    def test_save_and_delete_invalidate_only_dependents(self):
+        self.assertEqual(self.titles(), ['Compilers'])
+        self.titles()
+        self.assertEqual(self.calls, 1)
+
+        # dependency nahi hai to version nahi badalta
+        make_group(self.teacher)
+        self.titles()
+        self.assertEqual(self.calls, 1)
+
+        topic = make_topic(self.teacher, title='Databases')
+        self.assertEqual(self.titles(), ['Compilers', 'Databases'])
+        topic.delete()
+        self.assertEqual(self.titles(), ['Compilers'])
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(cache_stats()['caches']['titles'], {'hits': 2, 'misses': 3})
+
+    def test_queryset_updates_bump_through_app_code(self):
+        group = make_group(self.teacher)
+        versions = model_versions([Submission, ProjectGroup])
+        # bulk_review jaise update() paths bump_on_commit khud bulate hain
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_review(self.teacher, [], 'approved')
+        self.assertEqual(model_versions([Submission, ProjectGroup]), versions)
+
+        sub = make_submission(group)
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_review(self.teacher, [sub.pk], 'approved')
+        self.assertGreater(model_versions([Submission])[0], versions[0])
+
+    def test_commit_bump_discards_values_cached_mid_transaction(self):
+        self.titles()
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                Topic.objects.filter(pk=self.topic.pk).update(title='Old title cached')
+                make_topic(self.teacher, title='Databases')
+                # transaction ke andar kisi request ne value cache kar li
+                self.titles()
+        self.titles()
+        self.assertEqual(self.calls, 3)
+
+    def test_evicted_versions_never_reuse_old_keys(self):
+        self.titles()
+        cache.clear()
+        self.titles()
+        self.assertEqual(self.calls, 2)
+        self.assertIsNone(cached('nothing', [], [Topic], lambda: None))
+        self.assertEqual(cache_stats()['caches']['nothing'], {'hits': 0, 'misses': 1})
+
+    def test_cached_view_sees_new_topics(self):
+        self.client.force_login(self.teacher)
+        self.assertContains(self.client.get(reverse('topics_list')), 'Compilers')
+        self.client.post(reverse('create_topic'), {'title': 'Networks', 'description': '', 'capacity': ''})
+        self.assertContains(self.client.get(reverse('topics_list')), 'Networks')
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from django.test import override_settings
+from django.utils import timezone
+
+from ..changefeed import changes_since
+from ..models import Submission
+from .base import AppTestCase
+from .factories import make_group, make_submission, make_teacher
+
+
+class ChangeFeedTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = make_group(make_teacher())
+
+    def stamp(self, sub, seconds_ago):
+        Submission.objects.filter(pk=sub.pk).update(updated_at=timezone.now() - timedelta(seconds=seconds_ago))
+
+    def submission_ids(self, events):
+        return [e['id'] for e in events if e['resource'] == 'submissions']
+
+    def test_cursor_waits_for_late_commits(self):
+        _, cursor = changes_since(None, 500)
+        # ``later`` commit ho chuka, ``earlier`` 10s pehle stamp hua par abhi commit hua
+        later = make_submission(self.group)
+        self.stamp(later, 5)
+        events, next_cursor = changes_since(cursor, 500)
+        self.assertEqual(self.submission_ids(events), [])
+        self.assertEqual(next_cursor, cursor)
+
+        earlier = make_submission(self.group)
+        self.stamp(earlier, 10)
+        with override_settings(CHANGE_FEED_SETTLE_SECONDS=0):
+            events, _ = changes_since(cursor, 500)
+        self.assertEqual(self.submission_ids(events), [earlier.pk, later.pk])
+
+    @override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+    def test_insert_update_delete_in_order(self):
+        _, cursor = changes_since(None, 500)
+        sub = make_submission(self.group)
+        events, cursor = changes_since(cursor, 500)
+        self.assertEqual([(e['op'], e['id']) for e in events if e['resource'] == 'submissions'], [('insert', sub.pk)])
+
+        sub.note = 'v2'
+        sub.save()
+        events, cursor = changes_since(cursor, 500)
+        self.assertEqual([(e['op'], e['data']['note']) for e in events], [('update', 'v2')])
+
+        sub_id = sub.pk
+        sub.delete()
+        events, cursor = changes_since(cursor, 500)
+        self.assertEqual([(e['op'], e['resource'], e['id']) for e in events], [('delete', 'submissions', sub_id)])
+        self.assertEqual(changes_since(cursor, 500), ([], cursor))
+
+    @override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+    def test_same_timestamp_rows_page_without_skips_or_repeats(self):
+        _, cursor = changes_since(None, 500)
+        subs = [make_submission(self.group) for _ in range(3)]
+        # bulk update: teeno ka updated_at ek hi
+        Submission.objects.filter(pk__in=[s.pk for s in subs]).update(updated_at=timezone.now())
+        seen = []
+        for _ in range(4):
+            events, cursor = changes_since(cursor, 1)
+            seen += [e['id'] for e in events]
+        self.assertEqual(seen, [s.pk for s in subs])
+
+        with self.assertRaises(ValueError):
+            changes_since('not-a-cursor', 10)
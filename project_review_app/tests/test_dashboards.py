@@ -0,0 +1,71 @@
+from django.urls import reverse
+
+from ..dashboards import dashboard_for
+from ..models import Submission
+from ..queries import mark_read
+from .base import AppTestCase
+from .factories import (
+    make_admin, make_group, make_query, make_student, make_submission, make_teacher, make_topic, make_user,
+)
+
+
+class RoleRouterTests(AppTestCase):
+    def test_each_role_lands_on_its_dashboard(self):
+        superuser = make_user(role='student', is_superuser=True)
+        cases = [
+            (make_admin(), 'dashboard'),
+            (superuser, 'dashboard'),
+            (make_teacher(), 'teacher_dashboard'),
+            (make_student(), 'student_dashboard'),
+        ]
+        for user, name in cases:
+            with self.subTest(user.username):
+                self.assertEqual(dashboard_for(user), name)
+                self.client.force_login(user)
+                response = self.client.get(reverse('home'))
+                self.assertRedirects(response, reverse(name), fetch_redirect_response=False)
+
+    def test_login_redirects_straight_to_dashboard(self):
+        teacher = make_teacher()
+        response = self.client.post(reverse('login'), {'username': teacher.email, 'password': 'pass'})
+        self.assertRedirects(response, reverse('teacher_dashboard'), fetch_redirect_response=False)
+
+
+class StudentDashboardTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.student = make_student()
+        cls.g1 = make_group(cls.teacher, make_topic(cls.teacher, 'Search engines'), members=[cls.student, make_student()])
+        # pichhle semester ka group (ek semester me ek hi group ho sakta hai)
+        cls.g2 = make_group(cls.teacher, semester=4, members=[cls.student])
+        make_submission(cls.g1, uploaded_by=cls.student)
+        make_submission(cls.g1, status=Submission.STATUS_APPROVED)
+        first = make_query(cls.g1, author=cls.teacher)
+        make_query(cls.g1, author=cls.teacher)
+        make_query(cls.g1, author=cls.student)
+        mark_read(cls.student, cls.g1.pk, first.pk)
+
+    def test_dashboard_preloads_groups_in_one_query(self):
+        self.client.force_login(self.student)
+        # session + user + memberships
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('student_dashboard'))
+        memberships = {m.group_id: m for m in response.context['memberships']}
+        self.assertEqual(memberships[self.g1.pk].unread, 1)
+        self.assertEqual(memberships[self.g1.pk].submissions_count, 2)
+        self.assertEqual(memberships[self.g2.pk].submissions_count, 0)
+        self.assertEqual(response.context['unread_count'], 1)
+        self.assertEqual(response.context['pending_reviews'], 1)
+        self.assertContains(response, 'Search engines')
+        self.assertContains(response, 'Latest submission: Approved')
+
+    def test_my_group_query_count_does_not_grow_with_groups(self):
+        self.client.force_login(self.student)
+        with self.assertNumQueries(4):
+            self.client.get(reverse('my_group'))
+        for semester in (1, 2, 3):
+            make_group(self.teacher, make_topic(self.teacher), semester=semester, members=[self.student, make_student()])
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('my_group'))
+        self.assertEqual(len(response.context['groups_data']), 5)
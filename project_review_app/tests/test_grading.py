@@ -0,0 +1,124 @@
+from django.urls import reverse
+
+from ..grading import GRADE_COLUMNS, cohort_grades, compute_grades, rubric_for, save_scores, set_adjustment
+from ..models import AuditEntry, CriterionScore, ProjectGroup
+from .base import AppTestCase
+from .factories import make_group, make_rubric, make_student, make_submission, make_teacher, make_topic
+
+
+class GradingTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.topic = make_topic(cls.teacher, capacity=30)
+        cls.s1, cls.s2, cls.s3 = (make_student() for _ in range(3))
+        cls.g1 = make_group(cls.teacher, cls.topic, members=[cls.s1, cls.s2], semester=5, division='A')
+        cls.g2 = make_group(cls.teacher, members=[cls.s3], semester=5, division='B')
+        # Report 2x /10, Demo 1x /5
+        cls.topic_rubric = make_rubric(cls.teacher, topic=cls.topic)
+        cls.cohort_rubric = make_rubric(cls.teacher, semester=5, criteria=(('Viva', 1, 20),))
+
+    def scores(self, submission, rubric, *values):
+        save_scores(submission, rubric, dict(zip([c.pk for c in rubric.criteria.all()], values)))
+
+    def rows(self, **filters):
+        return {row[1]: dict(zip(GRADE_COLUMNS, row)) for row in cohort_grades(self.teacher, **filters)}
+
+    def test_rubric_resolution(self):
+        self.assertEqual(rubric_for(self.g1), self.topic_rubric)
+        self.assertEqual(rubric_for(self.g2), self.cohort_rubric)
+        division_rubric = make_rubric(self.teacher, semester=5, division='B')
+        self.assertEqual(rubric_for(self.g2), division_rubric)
+        self.assertIsNone(rubric_for(make_group(self.teacher)))
+
+    def test_weighted_totals_adjustments_and_latest_submission(self):
+        old = make_submission(self.g1)
+        self.scores(old, self.topic_rubric, 2, 1)
+        latest = make_submission(self.g1)
+        # (2 * 8/10 + 1 * 5/5) / 3 = 86.67%
+        self.scores(latest, self.topic_rubric, 8, 5)
+        # sirf ek criterion score hua: doosra 0 gina jata hai -> 15/20 * 1/1 = 75%
+        self.scores(make_submission(self.g2), self.cohort_rubric, 15)
+        set_adjustment(self.g1, self.s2.pk, 20, 'led the demo')
+
+        rows = self.rows()
+        self.assertEqual(rows[self.s1.pk]['group_total'], 86.67)
+        self.assertEqual(rows[self.s1.pk]['final'], 86.67)
+        self.assertEqual(rows[self.s2.pk]['final'], 100)
+        self.assertEqual(rows[self.s2.pk]['adjustment'], 20)
+        self.assertEqual(rows[self.s3.pk]['final'], 75)
+        self.assertEqual(set(self.rows(division='B')), {self.s3.pk})
+
+    def test_unscored_group_has_no_total(self):
+        rows = self.rows()
+        self.assertIsNone(rows[self.s1.pk]['group_total'])
+        self.assertIsNone(rows[self.s1.pk]['final'])
+
+    def test_query_count_is_independent_of_cohort_size(self):
+        for _ in range(20):
+            group = make_group(self.teacher, self.topic, members=[make_student(), make_student()], semester=5)
+            self.scores(make_submission(group), self.topic_rubric, 5, 3)
+        with self.assertNumQueries(5):
+            rows = compute_grades(ProjectGroup.objects.filter(teacher=self.teacher))
+        self.assertEqual(len(rows), 43)
+
+    def test_cached_result_is_invalidated_on_score_change(self):
+        sub = make_submission(self.g1)
+        self.scores(sub, self.topic_rubric, 10, 5)
+        self.assertEqual(self.rows()[self.s1.pk]['final'], 100)
+        with self.assertNumQueries(0):
+            cohort_grades(self.teacher)
+        self.scores(sub, self.topic_rubric, 5, 5)
+        self.assertEqual(self.rows()[self.s1.pk]['final'], 66.67)
+        set_adjustment(self.g1, self.s1.pk, -70)
+        self.assertEqual(self.rows()[self.s1.pk]['final'], 0)
+
+    def test_save_scores_validates_and_audits(self):
+        sub = make_submission(self.g1)
+        report, demo = self.topic_rubric.criteria.all()
+        with self.assertRaises(ValueError):
+            save_scores(sub, self.topic_rubric, {report.pk: 11})
+        with self.assertRaises(ValueError):
+            save_scores(sub, self.topic_rubric, {self.cohort_rubric.criteria.get().pk: 1})
+        with self.assertRaises(ValueError):
+            set_adjustment(self.g2, self.s1.pk, 5)
+
+        save_scores(sub, self.topic_rubric, {report.pk: 7, demo.pk: 2}, actor=self.teacher)
+        self.assertEqual(save_scores(sub, self.topic_rubric, {report.pk: 7, demo.pk: None}), 1)
+        self.assertEqual(list(CriterionScore.objects.filter(submission=sub).values_list('score', flat=True)), [7])
+        entry = AuditEntry.objects.filter(model='submission', object_id=sub.pk).order_by('-id').first()
+        self.assertEqual(entry.changes, {'score:Demo': [2, None]})
+
+    def test_views_and_csv_export(self):
+        sub = make_submission(self.g1)
+        report, demo = self.topic_rubric.criteria.all()
+        self.client.force_login(self.teacher)
+
+        response = self.client.post(reverse('grade_submission', args=[sub.pk]), {
+            f'criterion_{report.pk}': '6', f'criterion_{demo.pk}': '',
+        })
+        self.assertRedirects(response, reverse('review_submission', args=[sub.pk]), fetch_redirect_response=False)
+        response = self.client.post(reverse('grade_submission', args=[sub.pk]), {f'criterion_{report.pk}': '60'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(CriterionScore.objects.get(submission=sub).score, 6)
+
+        next_url = reverse('cohort_grades') + '?semester=5'
+        response = self.client.post(reverse('member_adjustment', args=[self.g1.pk]), {
+            'student': self.s1.pk, 'delta': '-10', 'next': next_url,
+        })
+        self.assertRedirects(response, next_url, fetch_redirect_response=False)
+        response = self.client.post(reverse('member_adjustment', args=[self.g1.pk]), {
+            'student': self.s1.pk, 'delta': '1', 'next': 'https://example.com/',
+        })
+        self.assertRedirects(response, reverse('cohort_grades'), fetch_redirect_response=False)
+
+        response = self.client.get(reverse('export_grades'), {'semester': 5, 'division': 'A'})
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], ','.join(GRADE_COLUMNS))
+        self.assertEqual(len(lines), 3)
+        self.assertIn(f'{self.g1.pk},{self.s1.pk},{self.s1.roll_no},{self.s1.username},{self.g1.name},', lines[1])
+        self.assertTrue(lines[1].endswith(',40.0,1.0,41.0'))
+
+        self.client.force_login(make_teacher())
+        self.assertEqual(self.client.get(reverse('grade_submission', args=[sub.pk])).status_code, 404)
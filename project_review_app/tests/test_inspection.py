@@ -0,0 +1,101 @@
+import io
+import os
+import tarfile
+import tempfile
+import zipfile
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from .. import inspection, processing
+from ..inspection import inspect_file
+from ..models import SubmissionManifest
+from ..processing import inspect_submission
+from .base import AppTestCase
+from .factories import make_group, make_student, make_submission, make_teacher
+
+PDF = b'%PDF-1.4\n1 0 obj<</Type /Pages>>endobj\n' + b'2 0 obj<</Type /Page>>endobj\n' * 3
+
+
+def _zip(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def _tar(files):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode='w:gz') as tf:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+class InspectFileTests(SimpleTestCase):
+    def inspect(self, data, suffix):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        return inspect_file(path)
+
+    def test_zip_listing_preview_and_pdf(self):
+        manifest = self.inspect(_zip({
+            'src/main.py': b'print(1)', 'README.md': b'# Demo\nRun main.py', 'docs/report.pdf': PDF,
+        }), '.zip')
+        self.assertEqual(manifest['kind'], 'zip')
+        self.assertEqual(manifest['file_count'], 3)
+        self.assertEqual(manifest['total_size'], 8 + 18 + len(PDF))
+        self.assertEqual((manifest['preview_name'], manifest['preview_text']), ('README.md', '# Demo\nRun main.py'))
+        self.assertEqual(manifest['pdf'], {'name': 'docs/report.pdf', 'pages': 3})
+
+    def test_tar_is_streamed_and_listing_is_capped(self):
+        files = {f'f{i}.txt': b'x' for i in range(5)}
+        with mock.patch.object(inspection, 'MAX_ENTRIES', 3):
+            manifest = self.inspect(_tar({**files, 'readme.txt': b'hello'}), '.tar.gz')
+        self.assertEqual((manifest['kind'], manifest['file_count'], len(manifest['entries'])), ('tar', 6, 3))
+        self.assertTrue(manifest['truncated'])
+        self.assertEqual(manifest['preview_text'], 'hello')
+
+    def test_pdf_pages_counted_across_chunks(self):
+        with mock.patch.object(inspection, 'PDF_SCAN_CHUNK', 7):
+            manifest = self.inspect(PDF, '.pdf')
+        self.assertEqual((manifest['kind'], manifest['pdf']['pages']), ('file', 3))
+
+    def test_plain_text_preview_is_bounded(self):
+        manifest = self.inspect(b'a' * (inspection.PREVIEW_BYTES + 100), '.txt')
+        self.assertEqual(len(manifest['preview_text']), inspection.PREVIEW_BYTES)
+
+
+class InspectSubmissionTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.group = make_group(cls.teacher, members=[make_student()])
+
+    def test_manifest_is_saved_and_shown_to_the_reviewer(self):
+        sub = make_submission(self.group)
+        sub.file.save('code.zip', ContentFile(_zip({'README': b'steps', 'a.py': b'x = 1'})))
+        inspect_submission(sub, mode='sync')
+
+        manifest = SubmissionManifest.objects.get(submission=sub)
+        self.assertEqual((manifest.status, manifest.file_count, manifest.preview_text), ('ready', 2, 'steps'))
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse('review_submission', args=[sub.pk]))
+        self.assertContains(response, '2 file(s)')
+
+    def test_failures_are_recorded_and_off_mode_skips(self):
+        sub = make_submission(self.group, content=b'data')
+        inspect_submission(sub, mode='off')
+        self.assertFalse(SubmissionManifest.objects.exists())
+
+        with mock.patch.object(processing, 'analyse_file', side_effect=zipfile.BadZipFile('bad archive')):
+            inspect_submission(sub, mode='sync')
+        manifest = SubmissionManifest.objects.get(submission=sub)
+        self.assertEqual((manifest.status, manifest.error), ('failed', 'bad archive'))
@@ -0,0 +1,51 @@
+from django.contrib.auth import authenticate
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..models import CustomUser
+from .base import AppTestCase
+from .factories import make_admin, make_teacher
+
+
+class EmailLoginTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher(email='  Asha.Rao@College.EDU ')
+
+    def test_email_is_stored_lowercase(self):
+        self.assertEqual(self.teacher.email, 'asha.rao@college.edu')
+        with self.assertRaises(IntegrityError):
+            CustomUser.objects.filter(pk=self.teacher.pk).update(email='Asha.Rao@College.EDU')
+
+    def test_login_ignores_case_with_one_lookup(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(reverse('login'), {'username': 'ASHA.RAO@college.edu', 'password': 'pass'})
+        self.assertRedirects(response, reverse('teacher_dashboard'), fetch_redirect_response=False)
+        # baaki queries session + last_login ki hain
+        lookups = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT') and '_customuser' in q['sql']]
+        self.assertEqual(len(lookups), 1)
+        self.assertIn('"email" = \'asha.rao@college.edu\'', lookups[0])
+
+    def test_wrong_password_or_unknown_email_is_rejected(self):
+        for email, password in [('asha.rao@college.edu', 'nope'), ('nobody@college.edu', 'pass')]:
+            with self.subTest(email):
+                response = self.client.post(reverse('login'), {'username': email, 'password': password})
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.context['form'].errors)
+                self.assertNotIn('_auth_user_id', self.client.session)
+
+    def test_usernames_skip_the_email_backend(self):
+        admin = make_admin()
+        with self.assertNumQueries(1):
+            self.assertEqual(authenticate(username=admin.username, password='pass'), admin)
+        response = self.client.post(reverse('admin_login'), {'username': admin.username, 'password': 'pass'})
+        self.assertRedirects(response, reverse('dashboard'), fetch_redirect_response=False)
+
+    def test_signup_with_other_case_is_a_duplicate(self):
+        response = self.client.post(reverse('signup'), {
+            'username': 'asha2', 'email': 'ASHA.RAO@COLLEGE.EDU', 'password1': 'Str0ng-pass!',
+            'password2': 'Str0ng-pass!', 'semester': 5, 'division': 'A', 'roll_no': 'Z1',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['form'].has_error('email'))
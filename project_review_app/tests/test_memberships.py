@@ -0,0 +1,148 @@
+from django.urls import reverse
+
+from ..memberships import MembershipError, add_member, current_membership, set_members
+from ..models import GroupMember, ProjectGroup
+from .base import AppTestCase, ThreadedTestCase
+from .factories import make_group, make_student, make_teacher
+
+
+def seats(group):
+    return ProjectGroup.objects.values_list('member_count', flat=True).get(pk=group.pk)
+
+
+class MembershipTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.group = make_group(cls.teacher, name='Pair', max_members=2, semester=5)
+
+    def test_group_never_exceeds_max_members(self):
+        add_member(self.group, make_student())
+        add_member(self.group, make_student())
+        with self.assertRaisesMessage(MembershipError, 'Pair is full'):
+            add_member(self.group, make_student())
+        self.assertEqual(seats(self.group), 2)
+        self.assertEqual(self.group.members.count(), 2)
+
+    def test_one_group_per_semester(self):
+        student = make_student()
+        add_member(self.group, student)
+        with self.assertRaisesMessage(MembershipError, 'already in another group this semester'):
+            add_member(make_group(self.teacher, semester=5), student)
+        with self.assertRaisesMessage(MembershipError, 'already in this group'):
+            add_member(self.group, student)
+        self.assertEqual(seats(self.group), 1)
+
+        # pichhla semester alag cohort hai; bina semester wala group student ka semester leta hai
+        add_member(make_group(self.teacher, semester=4), student)
+        with self.assertRaises(MembershipError):
+            add_member(make_group(self.teacher), student)
+
+    def test_deletes_release_seats(self):
+        first, second = make_student(), make_student()
+        add_member(self.group, first)
+        member = add_member(self.group, second)
+        member.delete()
+        first.delete()
+        self.assertEqual(seats(self.group), 0)
+
+    def test_set_members_is_all_or_nothing(self):
+        keep, drop = make_student(), make_student()
+        set_members(self.group, [keep, drop])
+        busy = make_student()
+        make_group(self.teacher, semester=5, members=[busy])
+        with self.assertRaises(MembershipError):
+            set_members(self.group, [keep, busy])
+        self.assertEqual(set(self.group.members.values_list('student_id', flat=True)), {keep.pk, drop.pk})
+
+        newcomer = make_student()
+        set_members(self.group, [keep, newcomer])
+        self.assertEqual(set(self.group.members.values_list('student_id', flat=True)), {keep.pk, newcomer.pk})
+        self.assertEqual(seats(self.group), 2)
+
+    def test_current_membership_picks_this_semesters_group(self):
+        student = make_student()
+        old = make_group(self.teacher, name='Old', semester=4, members=[student])
+        add_member(self.group, student)
+        self.assertEqual(current_membership(student).get().group, self.group)
+        # purana ``.first()`` yahan pichhle semester ka group deta tha
+        self.assertEqual(GroupMember.objects.filter(student=student).first().group, old)
+
+        self.client.force_login(student)
+        response = self.client.get(reverse('project_submission'))
+        self.assertEqual(response.context['group'], self.group)
+
+
+class GroupFormTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.a, cls.b = make_student(), make_student()
+        cls.group = make_group(cls.teacher, name='Trio', semester=5, members=[cls.a, cls.b])
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.teacher)
+
+    def post(self, **data):
+        return self.client.post(reverse('group_update', args=[self.group.pk]), {
+            'name': 'Trio', 'max_members': 3, 'semester': 5, **data,
+        })
+
+    def test_max_members_cannot_drop_below_members(self):
+        response = self.post(max_members=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['form'].has_error('max_members'))
+        self.assertRedirects(self.post(max_members=2), reverse('group_detail', args=[self.group.pk]),
+                             fetch_redirect_response=False)
+
+    def test_semester_change_moves_members_cohort(self):
+        self.post(semester=6)
+        self.assertEqual(set(GroupMember.objects.filter(group=self.group).values_list('semester', flat=True)), {6})
+        make_group(self.teacher, semester=4, members=[self.a])
+        response = self.post(semester=4)
+        self.assertContains(response, 'A member is already in another group for this semester.')
+        self.assertEqual(ProjectGroup.objects.get(pk=self.group.pk).semester, 6)
+
+    def test_stale_form_save_keeps_counter(self):
+        group = ProjectGroup.objects.get(pk=self.group.pk)
+        add_member(group, make_student())
+        group.name = 'Renamed'
+        group.save()
+        self.assertEqual(seats(group), 3)
+
+    def test_assign_members_reports_full_group(self):
+        extra = [make_student() for _ in range(2)]
+        response = self.client.post(reverse('assign_members', args=[self.group.pk]), {
+            'students': [self.a.pk, self.b.pk, *(s.pk for s in extra)],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['form'].has_error('students'))
+        self.assertEqual(seats(self.group), 2)
+
+
+class ConcurrentMembershipTests(ThreadedTestCase):
+    def test_parallel_joins_respect_both_constraints(self):
+        def setup():
+            teacher = make_teacher()
+            groups = [make_group(teacher, max_members=3, semester=5) for _ in range(4)]
+            return groups, [make_student() for _ in range(20)]
+
+        groups, students = self.in_thread(setup)
+        # 40 requests: har student do alag groups me ek saath
+        results = self.run_threads(lambda i: add_member(groups[i % 4], students[i // 2]), 40)
+
+        joined = [r for r in results if isinstance(r, GroupMember)]
+        self.assertEqual(len(joined), 12)
+        self.assertTrue(all(isinstance(r, (GroupMember, MembershipError)) for r in results), results)
+
+        def check():
+            counts = dict(ProjectGroup.objects.values_list('pk', 'member_count'))
+            real = {g.pk: g.members.count() for g in groups}
+            per_student = GroupMember.objects.values_list('student_id', flat=True)
+            return counts, real, len(per_student), len(set(per_student))
+
+        counts, real, rows, distinct = self.in_thread(check)
+        self.assertEqual(counts, real)
+        self.assertEqual(set(counts.values()), {3})
+        self.assertEqual(rows, distinct)
@@ -0,0 +1,105 @@
+import json
+import shutil
+import tempfile
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .. import metrics
+from ..middleware import AuditMiddleware, MetricsMiddleware
+from .base import AppTestCase
+from .factories import make_teacher
+
+
+def view_count(metric, **labels):
+    return metric.values.get(metrics._label_key(labels), 0)
+
+
+class MetricsMiddlewareTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.teacher)
+        self.async_client.force_login(self.teacher)
+
+    def test_counts_queries_on_sync_and_async_chains(self):
+        url = reverse('submissions_list')
+        before = view_count(metrics.DB_QUERIES, view='submissions_list')
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        sync_queries = view_count(metrics.DB_QUERIES, view='submissions_list') - before
+        self.assertEqual(sync_queries, len(ctx.captured_queries))
+
+        # ASGI: view ki queries sync_to_async thread par hoti hain
+        requests = view_count(metrics.REQUESTS, view='submissions_list', method='GET', status=200)
+        response = async_to_sync(self.async_client.get)(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(view_count(metrics.DB_QUERIES, view='submissions_list') - before, 2 * sync_queries)
+        self.assertEqual(view_count(metrics.REQUESTS, view='submissions_list', method='GET', status=200), requests + 1)
+
+    def test_middlewares_follow_the_chain_mode(self):
+        async def get_response(request):
+            return None
+
+        for middleware in (MetricsMiddleware, AuditMiddleware):
+            with self.subTest(middleware.__name__):
+                self.assertTrue(iscoroutinefunction(middleware(get_response)))
+                self.assertFalse(iscoroutinefunction(middleware(lambda request: None)))
+
+
+class ExpositionTests(SimpleTestCase):
+    def data(self):
+        return {
+            'jobs_total': {'type': 'counter', 'help': 'Jobs.', 'buckets': None, 'values': {
+                metrics._label_key({'queue': 'a"b\\c'}): 3,
+            }},
+            'job_seconds': {'type': 'histogram', 'help': 'Job time.', 'buckets': (1, 5), 'values': {
+                metrics._label_key({}): [2, 1, 1, 9.5],
+            }},
+            'cache_requests_total': {'type': 'counter', 'help': 'Cache.', 'buckets': None, 'values': {
+                metrics._label_key({'cache': 'x', 'result': 'hit'}): 3,
+                metrics._label_key({'cache': 'x', 'result': 'miss'}): 1,
+            }},
+        }
+
+    def test_prometheus_text_format(self):
+        lines = metrics.render(self.data()).splitlines()
+        self.assertIn('# TYPE jobs_total counter', lines)
+        self.assertIn('jobs_total{queue="a\\"b\\\\c"} 3', lines)
+        # buckets cumulative, +Inf = count
+        self.assertEqual([line for line in lines if line.startswith('job_seconds')], [
+            'job_seconds_bucket{le="1"} 2',
+            'job_seconds_bucket{le="5"} 3',
+            'job_seconds_bucket{le="+Inf"} 4',
+            'job_seconds_sum 9.5',
+            'job_seconds_count 4',
+        ])
+        self.assertEqual(lines[-1], 'cache_hit_ratio 0.75')
+
+    def test_workers_are_merged_from_the_multiproc_dir(self):
+        directory = tempfile.mkdtemp(prefix='project-review-metrics-')
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        with override_settings(METRICS_MULTIPROC_DIR=directory):
+            with open(f'{directory}/metrics-1.json', 'w') as f:
+                json.dump(self.data(), f)
+            with open(f'{directory}/metrics-2.json', 'w') as f:
+                f.write('{"half written')
+            before = metrics.snapshot()['logins_total']['values'].get(metrics._label_key({'result': 'success'}), 0)
+            metrics.LOGINS.inc(result='success')
+            merged = metrics.collect()
+        self.assertEqual(merged['job_seconds']['values'][metrics._label_key({})], [2, 1, 1, 9.5])
+        self.assertEqual(merged['logins_total']['values'][metrics._label_key({'result': 'success'})], before + 1)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_endpoint_requires_the_token(self):
+        url = reverse('metrics')
+        self.assertEqual(self.client.get(url).status_code, 401)
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        self.assertIn(b'# TYPE http_requests_total counter', response.content)
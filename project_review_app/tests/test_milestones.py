@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from ..milestones import admit_upload, issue_ticket, milestones_for
+from ..models import Milestone, Submission
+from .base import AppTestCase
+from .factories import make_group, make_student, make_teacher
+
+
+@override_settings(UPLOAD_GRACE_MINUTES=30)
+class MilestoneWindowTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.student = make_student()
+        cls.group = make_group(cls.teacher, semester=5, division='A', members=[cls.student])
+        cls.now = timezone.now()
+
+    def window(self, opens, closes, **scope):
+        scope.setdefault('semester', 5)
+        return Milestone.objects.create(
+            title='Review 1', opens_at=self.now + timedelta(minutes=opens),
+            closes_at=self.now + timedelta(minutes=closes), **scope,
+        )
+
+    def test_groups_without_milestones_always_upload(self):
+        self.assertEqual(admit_upload(self.student, self.group), (True, None))
+
+    def test_group_milestones_override_the_cohort(self):
+        cohort = self.window(-60, 60)
+        self.window(-60, 60, semester=5, division='B')
+        self.assertEqual(milestones_for(self.group), [cohort])
+        own = self.window(-10, 10, group=self.group, semester=None)
+        self.assertEqual(milestones_for(self.group), [own])
+
+    def test_ticket_from_before_the_deadline_gets_grace(self):
+        milestone = self.window(-60, 0)
+        ticket = issue_ticket(self.student, self.group, milestone, now=self.now - timedelta(minutes=1))
+        later = self.now + timedelta(minutes=10)
+
+        self.assertEqual(admit_upload(self.student, self.group, now=later), (False, None))
+        self.assertEqual(admit_upload(self.student, self.group, ticket, now=later), (True, milestone))
+        # grace khatam, doosre student / group ka ticket, ya jhootha ticket
+        self.assertFalse(admit_upload(self.student, self.group, ticket, now=self.now + timedelta(minutes=31))[0])
+        self.assertFalse(admit_upload(make_student(), self.group, ticket, now=later)[0])
+        self.assertFalse(admit_upload(self.student, self.group, ticket + 'x', now=later)[0])
+
+    def test_ticket_issued_after_the_deadline_is_useless(self):
+        milestone = self.window(-60, 0)
+        ticket = issue_ticket(self.student, self.group, milestone, now=self.now + timedelta(minutes=1))
+        self.assertFalse(admit_upload(self.student, self.group, ticket, now=self.now + timedelta(minutes=2))[0])
+
+    def test_upload_view_enforces_the_window(self):
+        milestone = self.window(-60, 60)
+        self.client.force_login(self.student)
+        page = self.client.get(reverse('project_submission'))
+        ticket = page.context['upload_ticket']
+        self.assertTrue(ticket)
+
+        def upload(**params):
+            url = reverse('upload_submission')
+            if params:
+                url += '?ticket=' + params['ticket']
+            return async_to_sync(self.async_client.post)(url, {
+                'file': SimpleUploadedFile('report.txt', b'hello'), 'note': '',
+            })
+
+        self.async_client.force_login(self.student)
+        self.assertRedirects(upload(), reverse('view_submissions'), fetch_redirect_response=False)
+        self.assertEqual(Submission.objects.get().milestone, milestone)
+
+        # deadline page khulne ke baad nikal gayi
+        Milestone.objects.filter(pk=milestone.pk).update(closes_at=timezone.now())
+        self.assertRedirects(upload(), reverse('project_submission'), fetch_redirect_response=False)
+        self.assertRedirects(upload(ticket=ticket), reverse('view_submissions'), fetch_redirect_response=False)
+        self.assertEqual(Submission.objects.count(), 2)
@@ -0,0 +1,104 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+from django.utils import timezone
+
+from .. import async_views
+from ..models import PubSubEvent, Submission
+from ..pubsub import DatabaseBackend, has_local_subscribers, publish, subscribe
+from ..queries import group_channel
+from ..reviews import record_review
+from .base import AppTestCase
+from .factories import make_group, make_student, make_submission, make_teacher
+
+
+class DatabaseBackendTests(AppTestCase):
+    def age_events(self):
+        PubSubEvent.objects.update(created_at=timezone.now() - timedelta(minutes=5))
+
+    async def received(self, sub):
+        got = []
+        while (message := await sub.get(timeout=0.05)) is not None:
+            got.append(message[1]['n'])
+        return got
+
+    async def test_cursor_starts_at_subscribe_and_drops_idle_backlog(self):
+        backend = DatabaseBackend()
+        backend._thread = _Alive()   # poller thread test khud chalata hai
+        publish = sync_to_async(backend.publish)
+        poll = sync_to_async(backend.poll_once)
+        age_events = sync_to_async(self.age_events)
+
+        await publish('group-1', {'n': 0})
+        await age_events()
+        with subscribe('group-1') as sub:
+            backend.on_subscribe()
+            # subscribe ke baad par pehle poll se pehle
+            await publish('group-1', {'n': 1})
+            await poll()
+            await publish('group-1', {'n': 2})
+            await poll()
+            self.assertEqual(await self.received(sub), [1, 2])
+
+        backend.reset_cursor()   # poller ne dekha: koi subscriber nahi
+        await publish('group-1', {'n': 3})
+        await age_events()
+        with subscribe('group-1') as sub:
+            backend.on_subscribe()
+            await poll()
+            await publish('group-1', {'n': 4})
+            await poll()
+            self.assertEqual(await self.received(sub), [4])
+
+
+class _Alive:
+    def is_alive(self):
+        return True
+
+
+class LivePushTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.student = make_student()
+        cls.group = make_group(cls.teacher, members=[cls.student])
+        cls.sub = make_submission(cls.group)
+
+    def review(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record_review(Submission.objects.get(pk=self.sub.pk), self.teacher, 'approved', 'ok')
+
+    async def test_local_publish_reaches_only_its_channel_across_threads(self):
+        with subscribe('group-1') as one, subscribe('group-2') as two:
+            await sync_to_async(publish, thread_sensitive=False)('group-1', {'n': 1})
+            self.assertEqual(await one.get(timeout=1), ('group-1', {'n': 1}))
+            self.assertIsNone(await two.get(timeout=0.05))
+        self.assertFalse(has_local_subscribers())
+
+    async def test_review_is_pushed_to_the_sse_stream(self):
+        with mock.patch.object(async_views, 'SSE_HEARTBEAT', 0.05):
+            stream = async_views._sse_stream([group_channel(self.group.pk)])
+            self.assertEqual(await anext(stream), 'retry: 3000\n\n')
+            self.assertEqual(await anext(stream), ': keep-alive\n\n')
+
+            # query events is stream par nahi aate
+            publish(group_channel(self.group.pk), {'type': 'query', 'id': 1})
+            await sync_to_async(self.review)()
+            event = await anext(stream)
+            await stream.aclose()
+        name, data = event.strip().split('\n')
+        self.assertEqual(name, 'event: submission')
+        payload = json.loads(data.removeprefix('data: '))
+        self.assertEqual((payload['id'], payload['status']), (self.sub.pk, 'approved'))
+
+    async def test_sse_endpoint_is_for_students(self):
+        await self.async_client.aforce_login(self.student)
+        response = await self.async_client.get(reverse('submission_events'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        await response.streaming_content.aclose()
+        await self.async_client.aforce_login(self.teacher)
+        response = await self.async_client.get(reverse('submission_events'))
+        self.assertNotEqual(response.status_code, 200)
@@ -0,0 +1,78 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+
+from .. import async_views
+from ..queries import inbox_groups, mark_read, thread_messages, unread_count
+from .base import AppTestCase
+from .factories import make_group, make_query, make_student, make_teacher
+
+
+class QueryThreadTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.student = make_student()
+        cls.group = make_group(cls.teacher, name='Alpha', members=[cls.student])
+        cls.quiet = make_group(cls.teacher, name='Beta')
+        cls.messages = [make_query(cls.group, message=f'm{i}') for i in range(5)]
+
+    def ids(self, thread):
+        return [m.pk for m in thread]
+
+    def test_keyset_pages(self):
+        pks = self.ids(self.messages)
+        self.assertEqual(self.ids(thread_messages(self.group.pk, limit=2)), pks[3:])
+        self.assertEqual(self.ids(thread_messages(self.group.pk, before=pks[3], limit=2)), pks[1:3])
+        self.assertEqual(self.ids(thread_messages(self.group.pk, after=pks[1], limit=2)), pks[2:4])
+
+    def test_unread_counts_skip_own_messages_and_never_go_back(self):
+        self.assertEqual(unread_count(self.teacher, self.group.pk), 5)
+        self.assertEqual(unread_count(self.student, self.group.pk), 0)
+
+        mark_read(self.teacher, self.group.pk, self.messages[2].pk)
+        self.assertEqual(unread_count(self.teacher, self.group.pk), 2)
+        # purana page dekhne se marker peeche nahi jata
+        mark_read(self.teacher, self.group.pk, self.messages[0].pk)
+        self.assertEqual(unread_count(self.teacher, self.group.pk), 2)
+
+        make_query(self.group, author=self.teacher)
+        self.assertEqual(unread_count(self.teacher, self.group.pk), 2)
+        self.assertEqual(unread_count(self.student, self.group.pk), 1)
+
+    def test_inbox_orders_by_latest_message_with_unread(self):
+        mark_read(self.teacher, self.group.pk, self.messages[3].pk)
+        with self.assertNumQueries(1):
+            inbox = [(g.name, g.unread) for g in inbox_groups(self.teacher)]
+        self.assertEqual(inbox, [('Alpha', 1), ('Beta', 0)])
+
+    def test_opening_thread_marks_it_read(self):
+        self.client.force_login(self.teacher)
+        self.client.get(reverse('group_queries', args=[self.group.pk]))
+        self.assertEqual(unread_count(self.teacher, self.group.pk), 0)
+        self.client.force_login(make_student())
+        self.assertEqual(self.client.get(reverse('group_queries', args=[self.group.pk])).status_code, 404)
+
+    def post_message(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_query(self.group, message='Any update?')
+
+    async def test_long_poll_wakes_on_new_message(self):
+        await self.async_client.aforce_login(self.student)
+        url = reverse('group_queries_poll', args=[self.group.pk])
+        last = self.messages[-1]
+
+        poll = asyncio.ensure_future(self.async_client.get(url, {'after': last.pk}))
+        await asyncio.sleep(0.1)
+        new = await sync_to_async(self.post_message)()
+        response = await asyncio.wait_for(poll, 5)
+        self.assertEqual([m['id'] for m in response.json()['messages']], [new.pk])
+
+        with mock.patch.object(async_views, 'LONG_POLL_TIMEOUT', 0.05):
+            response = await self.async_client.get(url, {'after': new.pk})
+        self.assertEqual(response.json(), {'messages': []})
+
+        await self.async_client.aforce_login(await sync_to_async(make_student)())
+        self.assertEqual((await self.async_client.get(url)).status_code, 404)
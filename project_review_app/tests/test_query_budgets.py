@@ -0,0 +1,192 @@
+from collections import namedtuple
+from datetime import timedelta
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from django.utils import timezone
+
+from ..grading import save_scores
+from ..milestones import issue_ticket
+from ..models import MemberAdjustment, Milestone
+from ..urls import urlpatterns
+from .base import AppTestCase
+from .factories import (
+    make_admin, make_group, make_query, make_rubric, make_student, make_submission, make_teacher, make_topic,
+)
+
+
+# Write paths ke budget me audit log ka ek bulk_create shamil hai.
+# url name, kaun request karega (test ka attribute, None = anonymous), query
+# budget; ``args`` bhi attribute names hain (unka ``pk`` URL me jata hai)
+Case = namedtuple('Case', 'name user budget args method data query', defaults=((), 'get', None, ''))
+
+BUDGETS = [
+    # static + auth
+    Case('home', 'teacher', 2),
+    Case('about', None, 0),
+    Case('contact', None, 0),
+    Case('login', None, 0),
+    Case('admin_login', None, 0),
+    Case('logout', 'teacher', 4, method='post'),
+    Case('admin_logout', 'admin', 4),
+    Case('signup', None, 0),
+
+    # admin dashboard
+    Case('dashboard', 'admin', 3),
+    Case('add_admin', 'admin', 0),
+    Case('manage_admins', 'admin', 1),
+    Case('edit_admin', 'admin', 1, args=('admin',)),
+    Case('delete_admin', 'admin', 1, args=('other_admin',)),
+    Case('audit_log', 'admin', 3),
+    Case('add_teacher', 'admin', 0),
+    Case('manage_teachers', 'admin', 1),
+    Case('edit_teacher', 'admin', 1, args=('teacher',)),
+    Case('delete_teacher', 'admin', 1, args=('other_teacher',)),
+    Case('manage_students', 'admin', 1),
+    Case('edit_student', 'admin', 1, args=('s1',)),
+    Case('delete_student', 'admin', 1, args=('loner',)),
+
+    # teacher
+    Case('teacher_dashboard', 'teacher', 3),
+    Case('dashboard_counters', 'teacher', 6),
+    Case('dashboard_counters_sync', 'teacher', 6),
+    Case('teacher_search', 'teacher', 5, query='q=gr'),
+    Case('teacher_search_sync', 'teacher', 5, query='q=gr'),
+    Case('view_students', 'teacher', 2),
+    Case('student_roster', 'teacher', 4),
+    Case('create_topic', 'teacher', 2),
+    Case('create_group', 'teacher', 3),
+    Case('assign_members', 'teacher', 6, args=('g1',)),
+    Case('submissions_list', 'teacher', 3),
+    Case('review_submission', 'teacher', 4, args=('sub1',)),
+    Case('start_review', 'teacher', 4, args=('sub1',), method='post'),
+    Case('review_queue_next', 'teacher', 7, method='post'),
+    Case('bulk_review_submissions', 'teacher', 11, method='post',
+         data={'submission_ids': ['sub1', 'sub2'], 'status': 'approved', 'feedback': 'ok'}),
+    Case('group_list', 'teacher', 3),
+    Case('group_detail', 'teacher', 5, args=('g1',)),
+    Case('group_update', 'teacher', 4, args=('g1',)),
+    Case('group_delete', 'teacher', 3, args=('g1',)),
+    Case('edit_topic', 'teacher', 3, args=('topic1',)),
+    Case('delete_topic', 'teacher', 3, args=('topic1',)),
+    Case('topic_detail', 'teacher', 4, args=('topic1',)),
+    Case('student_detail', 'teacher', 3, args=('s1',)),
+    Case('topics_list', 'teacher', 3),
+    Case('topic_catalogue', 's3', 5),
+    Case('claim_topic', 's3', 11, args=('topic2',), method='post'),
+    Case('milestone_list', 'teacher', 4),
+    Case('milestone_delete', 'teacher', 6, args=('milestone',), method='post'),
+    Case('rubric_list', 'teacher', 4),
+    Case('rubric_edit', 'teacher', 5, args=('rubric',)),
+    Case('grade_submission', 'teacher', 6, args=('sub1',)),
+    # poore cohort ke marks 5 queries me, cohort ke size se independent
+    Case('cohort_grades', 'teacher', 7),
+    # cohort_grades ka cached result
+    Case('export_grades', 'teacher', 2),
+    Case('member_adjustment', 'teacher', 11, args=('g1',), method='post', data={'student': ['s2'], 'delta': '-5'}),
+
+    # student
+    Case('student_dashboard', 's1', 3),
+    Case('my_group', 's1', 4),
+    Case('project_submission', 's1', 4),
+    Case('upload_submission', 's1', 8, method='upload'),
+    Case('download_submission', 's1', 3, args=('sub1',)),
+    Case('download_submission_sync', 's1', 3, args=('sub1',)),
+    Case('view_submissions', 's1', 3),
+    Case('submission_events', 's1', 2),  # test client WSGI hai: 204, stream nahi
+    Case('profile', 's1', 2),
+    Case('help_center', 's1', 2),
+
+    # q&a threads
+    Case('group_queries', 's1', 9, args=('g1',)),
+    Case('group_queries_messages', 's1', 4, args=('g1',), query='before=999999'),
+    Case('group_queries_poll', 's1', 4, args=('g1',), query='after=0'),
+    Case('query_inbox', 'teacher', 3),
+
+    Case('metrics', None, 0),
+
+    # json api
+    Case('api_changes', 'teacher', 10),
+    Case('api_cache_stats', 'teacher', 2),
+    Case('api_list', 'teacher', 3, args=('submissions',)),
+    Case('api_detail', 'teacher', 3, args=('groups', 'g1')),
+]
+
+
+class QueryBudgetTests(AppTestCase):
+    """
+    Har URL ka exact query budget. Data me har relation ki kai rows hain, to
+    view me N+1 aate hi count badhta hai aur CI fail hota hai. Budget badhana
+    ho to commit me wajah likho.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin()
+        cls.other_admin = make_admin()
+        cls.teacher = make_teacher()
+        cls.other_teacher = make_teacher()
+        cls.s1, cls.s2, cls.s3, cls.s4, cls.loner = (make_student() for _ in range(5))
+
+        cls.topic1 = make_topic(cls.teacher, 'Graph databases')
+        cls.topic2 = make_topic(cls.teacher, 'Compilers')
+        make_topic(cls.other_teacher, 'Networks')
+
+        cls.g1 = make_group(cls.teacher, cls.topic1, name='Group one', members=[cls.s1, cls.s2])
+        cls.g2 = make_group(cls.teacher, cls.topic2, name='Group two', members=[cls.s4])
+        cls.g3 = make_group(cls.teacher, name='Group three', members=[cls.s3])
+        make_group(cls.other_teacher, name='Elsewhere', members=[make_student()])
+
+        cls.sub1 = make_submission(cls.g1, content=b'chapter one')
+        cls.sub2 = make_submission(cls.g1, uploaded_by=cls.s2)
+        make_submission(cls.g2)
+        for _ in range(3):
+            make_query(cls.g1)
+        make_query(cls.g1, author=cls.teacher)
+
+        now = timezone.now()
+        cls.milestone = Milestone.objects.create(
+            title='Final report', group=cls.g1, created_by=cls.teacher,
+            opens_at=now - timedelta(days=1), closes_at=now + timedelta(days=1),
+        )
+        Milestone.objects.create(
+            title='Synopsis', semester=5, created_by=cls.teacher,
+            opens_at=now - timedelta(days=10), closes_at=now - timedelta(days=5),
+        )
+
+        cls.rubric = make_rubric(cls.teacher, topic=cls.topic1)
+        make_rubric(cls.teacher, semester=5, criteria=(('Viva', 1, 10),))
+        save_scores(cls.sub1, cls.rubric, {c.pk: 4 for c in cls.rubric.criteria.all()})
+        MemberAdjustment.objects.create(group=cls.g1, student=cls.s1, delta=3)
+
+    def _pk(self, value):
+        obj = getattr(self, value, None)
+        return value if obj is None else obj.pk
+
+    def _request(self, case):
+        url = reverse(case.name, args=[self._pk(a) for a in case.args])
+        if case.query:
+            url = f'{url}?{case.query}'
+        if case.method == 'upload':
+            ticket = issue_ticket(self.s1, self.g1, self.milestone, timezone.now())
+            upload = SimpleUploadedFile('final.txt', b'final report', content_type='text/plain')
+            return self.client.post(f'{url}?ticket={ticket}', {'file': upload, 'note': 'final'})
+        if case.method == 'post':
+            data = {k: [self._pk(v) for v in vs] if isinstance(vs, list) else vs
+                    for k, vs in (case.data or {}).items()}
+            return self.client.post(url, data)
+        return self.client.get(url)
+
+    def test_every_url_has_a_budget(self):
+        names = {p.name for p in urlpatterns}
+        self.assertEqual(names - {c.name for c in BUDGETS}, set())
+
+    def test_budgets(self):
+        for case in BUDGETS:
+            with self.subTest(case.name):
+                self.client.logout()
+                if case.user:
+                    self.client.force_login(getattr(self, case.user))
+                with self.assertNumQueries(case.budget):
+                    response = self._request(case)
+                self.assertLess(response.status_code, 400, case.name)
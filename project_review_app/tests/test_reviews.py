@@ -0,0 +1,175 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from ..models import ReviewLog, Submission
+from ..reviews import ReviewConflict, bulk_review, claim_next_submission, claim_submission, record_review
+from .base import AppTestCase, ThreadedTestCase
+from .factories import make_group, make_student, make_submission, make_teacher, make_topic
+
+
+class ConcurrentReviewTests(ThreadedTestCase):
+    def test_parallel_claims_and_reviews_do_not_lock(self):
+        # settings wale transaction mode me: DEFERRED hota to read lock upgrade
+        # par kuch threads ko turant "database is locked" milta
+        def setup():
+            teacher = make_teacher()
+            group = make_group(teacher, members=[make_student()])
+            return teacher, [make_submission(group) for _ in range(10)]
+
+        teacher, subs = self.in_thread(setup)
+
+        def work(i):
+            if i % 3 == 0:
+                return claim_next_submission(teacher)
+            if i % 3 == 1:
+                return record_review(subs[i % 10], teacher, 'approved', 'ok')
+            return bulk_review(teacher, [s.pk for s in subs[:5]], 'rejected', 'redo')
+
+        results = self.run_threads(work, 30)
+        errors = [r for r in results if isinstance(r, Exception)]
+        self.assertEqual(errors, [])
+
+        def check():
+            return (
+                Submission.objects.filter(status=Submission.STATUS_PENDING).count(),
+                ReviewLog.objects.filter(bulk=False).count(),
+            )
+
+        pending, single = self.in_thread(check)
+        self.assertEqual(single, 10)
+        self.assertLess(pending, 10)
+
+
+class ReviewLeaseTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_teacher()
+        # topic ka owner bhi group ke submissions review kar sakta hai
+        cls.other = make_teacher(first_name='Asha', last_name='Rao')
+        group = make_group(cls.owner, make_topic(cls.other), members=[make_student()])
+        cls.first = make_submission(group)
+        cls.second = make_submission(group)
+        Submission.objects.filter(pk=cls.first.pk).update(submitted_at=timezone.now() - timedelta(hours=1))
+
+    def refreshed(self, sub):
+        return Submission.objects.get(pk=sub.pk)
+
+    def test_queue_hands_out_oldest_and_keeps_it_for_the_same_reviewer(self):
+        claimed = claim_next_submission(self.owner)
+        self.assertEqual(claimed.pk, self.first.pk)
+        self.assertEqual(claimed.claimed_by, self.owner)
+        self.assertGreater(claimed.claimed_until, timezone.now())
+        self.assertEqual(claim_next_submission(self.owner).pk, self.first.pk)
+
+    def test_active_lease_blocks_other_reviewers_until_it_expires(self):
+        self.assertTrue(claim_submission(self.first, self.owner))
+        self.assertFalse(claim_submission(self.refreshed(self.first), self.other))
+        with self.assertRaises(ReviewConflict):
+            record_review(self.refreshed(self.first), self.other, 'approved', 'ok')
+        self.assertEqual(self.refreshed(self.first).status, Submission.STATUS_PENDING)
+
+        Submission.objects.filter(pk=self.first.pk).update(claimed_until=timezone.now() - timedelta(seconds=1))
+        record_review(self.refreshed(self.first), self.other, 'approved', 'Nice work')
+        sub = self.refreshed(self.first)
+        self.assertEqual((sub.status, sub.feedback, sub.claimed_by_id), ('approved', 'Nice work', None))
+        self.assertEqual(list(ReviewLog.objects.filter(submission=sub).values_list('reviewer', 'bulk')),
+                         [(self.other.pk, False)])
+
+    def test_review_keeps_student_fields_and_rejects_bad_status(self):
+        Submission.objects.filter(pk=self.first.pk).update(note='late because of lab')
+        stale = Submission.objects.get(pk=self.first.pk)
+        Submission.objects.filter(pk=self.first.pk).update(note='edited note')
+        record_review(stale, self.owner, 'rejected', 'redo')
+        self.assertEqual(self.refreshed(self.first).note, 'edited note')
+        with self.assertRaises(ValueError):
+            record_review(stale, self.owner, 'maybe', '')
+
+    def test_review_page_shows_lease_and_post_conflict(self):
+        claim_submission(self.first, self.owner)
+        self.client.force_login(self.other)
+        url = reverse('review_submission', args=[self.first.pk])
+        response = self.client.get(url)
+        self.assertTrue(response.context['claimed_by_other'])
+        self.assertEqual(self.refreshed(self.first).claimed_by, self.owner)
+
+        response = self.client.post(url, {'status': 'approved', 'feedback': 'ok'}, follow=True)
+        self.assertRedirects(response, reverse('submissions_list'))
+        self.assertContains(response, 'being reviewed by another teacher')
+        self.assertEqual(self.refreshed(self.first).status, Submission.STATUS_PENDING)
+
+    def test_review_page_get_does_not_take_lease(self):
+        self.client.force_login(self.owner)
+        url = reverse('review_submission', args=[self.first.pk])
+        response = self.client.get(url)
+        self.assertContains(response, reverse('start_review', args=[self.first.pk]))
+        self.assertIsNone(self.refreshed(self.first).claimed_by)
+
+        response = self.client.post(reverse('start_review', args=[self.first.pk]), follow=True)
+        self.assertRedirects(response, url)
+        self.assertTrue(response.context['claimed_by_me'])
+        self.assertEqual(self.refreshed(self.first).claimed_by, self.owner)
+
+        self.client.force_login(self.other)
+        response = self.client.post(reverse('start_review', args=[self.first.pk]), follow=True)
+        self.assertContains(response, 'being reviewed by another teacher')
+        self.assertEqual(self.refreshed(self.first).claimed_by, self.owner)
+
+    def test_queue_next_view(self):
+        self.client.force_login(self.owner)
+        response = self.client.post(reverse('review_queue_next'))
+        self.assertRedirects(response, reverse('review_submission', args=[self.first.pk]), fetch_redirect_response=False)
+        Submission.objects.update(status='approved')
+        response = self.client.post(reverse('review_queue_next'), follow=True)
+        self.assertContains(response, 'No pending submissions')
+
+
+class BulkReviewTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher(first_name='Asha', last_name='Rao')
+        cls.rival = make_teacher()
+        group = make_group(cls.teacher, members=[make_student()])
+        cls.subs = [make_submission(group) for _ in range(3)]
+        cls.foreign = make_submission(make_group(cls.rival, members=[make_student()]))
+
+    def test_updates_own_unleased_submissions_in_one_batch(self):
+        leased = self.subs[2]
+        Submission.objects.filter(pk=leased.pk).update(
+            claimed_by=self.rival, claimed_until=timezone.now() + timedelta(minutes=5),
+        )
+        ids = [s.pk for s in self.subs] + [self.foreign.pk]
+        updated = bulk_review(self.teacher, ids, 'approved', 'Checked by {teacher} ({status})')
+
+        self.assertEqual(sorted(updated), [self.subs[0].pk, self.subs[1].pk])
+        rows = dict(Submission.objects.values_list('pk', 'status'))
+        self.assertEqual(rows[leased.pk], Submission.STATUS_PENDING)
+        self.assertEqual(rows[self.foreign.pk], Submission.STATUS_PENDING)
+        feedback = set(Submission.objects.filter(pk__in=updated).values_list('feedback', flat=True))
+        self.assertEqual(feedback, {'Checked by Asha Rao (Approved)'})
+        self.assertEqual(ReviewLog.objects.filter(bulk=True).count(), 2)
+
+    def test_topic_creator_has_same_scope_as_single_review(self):
+        # rival ke topic par kisi aur teacher ka group
+        other = make_teacher()
+        topic = make_topic(self.rival)
+        sub = make_submission(make_group(other, topic, members=[make_student()]))
+
+        self.assertTrue(Submission.objects.for_teacher(self.rival).filter(pk=sub.pk).exists())
+        self.assertEqual(bulk_review(self.rival, [sub.pk, self.subs[0].pk], 'approved'), [sub.pk])
+        self.assertEqual(bulk_review(self.teacher, [sub.pk], 'rejected'), [])
+
+    def test_invalid_status_changes_nothing(self):
+        with self.assertRaises(ValueError):
+            bulk_review(self.teacher, [self.subs[0].pk], 'maybe')
+        self.assertFalse(ReviewLog.objects.exists())
+
+    def test_view_reports_skipped_rows(self):
+        self.client.force_login(self.teacher)
+        response = self.client.post(reverse('bulk_review_submissions'), {
+            'submission_ids': [self.subs[0].pk, self.foreign.pk], 'status': 'rejected', 'feedback': 'redo',
+        }, follow=True)
+        self.assertContains(response, '1 submission(s) reviewed.')
+        self.assertContains(response, '1 submission(s) skipped')
+        self.assertEqual(Submission.objects.get(pk=self.subs[0].pk).status, 'rejected')
@@ -0,0 +1,68 @@
+from django.db.models import F
+from django.urls import reverse
+
+from ..roster import ROSTER_COLUMNS, ROSTER_ORDER, roster_page, roster_queryset
+from .base import AppTestCase
+from .factories import make_student, make_teacher
+
+
+class StudentRosterTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.students = [
+            make_student(semester=sem, division=div, roll_no=roll)
+            for sem, div, roll in [
+                (5, 'A', 'R1'), (5, 'A', 'R2'), (5, 'B', 'R1'), (3, 'A', None),
+                (None, None, None), (3, None, 'R9'), (5, 'A', 'R3'), (6, 'C', 'R3'),
+                # roll no NULL ho to unique constraint nahi lagta — sirf id se tie-break
+                (3, 'A', None),
+            ]
+        ]
+
+    def walk(self, students, limit):
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = roster_page(students, cursor, limit)
+            seen.extend(page['rows'])
+            pages += 1
+            cursor = page['next']
+            if cursor is None:
+                return seen, pages
+
+    def test_keyset_pages_match_full_ordering(self):
+        students = roster_queryset()
+        expected = list(
+            students.order_by(*(F(name).asc(nulls_first=True) for name in ROSTER_ORDER)).values_list(*ROSTER_COLUMNS)
+        )
+        for limit in (1, 3, 100):
+            with self.subTest(limit=limit):
+                seen, pages = self.walk(students, limit)
+                self.assertEqual(seen, expected)
+                self.assertEqual(pages, -(-len(expected) // limit))
+
+    def test_feed_is_compact_and_filtered(self):
+        self.client.force_login(self.teacher)
+        # session, user, count, rows
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('student_roster'), {'semester': 5, 'division': 'A', 'limit': 2})
+        page = response.json()
+        self.assertEqual(page['columns'], list(ROSTER_COLUMNS))
+        self.assertEqual(page['total'], 3)
+        self.assertEqual([row[2] for row in page['rows']], ['R1', 'R2'])
+        self.assertNotIn(b'password', response.content)
+        self.assertNotIn(b' ', response.content)
+
+        # aage ke pages par count dobara nahi hota
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('student_roster'), {
+                'semester': 5, 'division': 'A', 'limit': 2, 'cursor': page['next'],
+            })
+        self.assertNotIn('total', response.json())
+        self.assertEqual(len(response.json()['rows']), 1)
+
+    def test_bad_cursor_and_students_are_rejected(self):
+        self.client.force_login(self.teacher)
+        self.assertEqual(self.client.get(reverse('student_roster'), {'cursor': 'nope'}).status_code, 400)
+        self.client.force_login(self.students[0])
+        self.assertEqual(self.client.get(reverse('student_roster')).status_code, 403)
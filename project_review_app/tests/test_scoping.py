@@ -0,0 +1,162 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import override_settings
+from django.urls import reverse
+
+from ..models import ProjectGroup, Query, ScopedQuerySet, Submission, Topic
+from .base import AppTestCase
+from .factories import (
+    make_admin, make_group, make_query, make_student, make_submission, make_teacher, make_topic, make_user,
+)
+
+
+class ScopedDataMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.t1 = make_teacher()
+        cls.t2 = make_teacher()
+        cls.s1 = make_student()
+        cls.s2 = make_student()
+        cls.admin = make_admin()
+
+        cls.topic1 = make_topic(cls.t1, 'Compilers')
+        cls.topic2 = make_topic(cls.t2, 'Databases')
+        cls.topic3 = make_topic(cls.t2, 'Networks', teacher=cls.t1)
+
+        # g1: t1 ka group; g2: t2 ka group par topic t1 ka; g3: sirf t2
+        cls.g1 = make_group(cls.t1, name='Alpha', members=[cls.s1])
+        cls.g2 = make_group(cls.t2, cls.topic1, name='Beta')
+        cls.g3 = make_group(cls.t2, cls.topic2, name='Gamma', members=[cls.s2])
+
+        cls.sub1 = make_submission(cls.g1)
+        cls.sub2 = make_submission(cls.g2)
+        cls.sub3 = make_submission(cls.g3)
+        cls.q1 = make_query(cls.g1, message='When is the demo?')
+        cls.q3 = make_query(cls.g3, message='Can we use Rust?')
+
+
+class ScopedQuerySetTests(ScopedDataMixin, AppTestCase):
+    def ids(self, qs, expected_queries=1):
+        with self.assertNumQueries(expected_queries):
+            return set(qs.values_list('pk', flat=True))
+
+    def test_groups(self):
+        self.assertEqual(self.ids(ProjectGroup.objects.for_teacher(self.t1)), {self.g1.pk, self.g2.pk})
+        self.assertEqual(self.ids(ProjectGroup.objects.for_teacher(self.t2)), {self.g2.pk, self.g3.pk})
+        self.assertEqual(self.ids(ProjectGroup.objects.for_student(self.s1)), {self.g1.pk})
+        self.assertEqual(self.ids(ProjectGroup.objects.for_admin()), {self.g1.pk, self.g2.pk, self.g3.pk})
+
+    def test_topics(self):
+        self.assertEqual(self.ids(Topic.objects.for_teacher(self.t1)), {self.topic1.pk, self.topic3.pk})
+        # s2 ke group teacher (t2) ke topics
+        self.assertEqual(self.ids(Topic.objects.for_student(self.s2)), {self.topic2.pk, self.topic3.pk})
+        # s1 ka group bina topic ke hai; t1 ke topics dikhte hain
+        self.assertEqual(self.ids(Topic.objects.for_student(self.s1)), {self.topic1.pk, self.topic3.pk})
+
+    def test_submissions_and_queries(self):
+        self.assertEqual(self.ids(Submission.objects.for_teacher(self.t1)), {self.sub1.pk, self.sub2.pk})
+        self.assertEqual(self.ids(Submission.objects.for_student(self.s2)), {self.sub3.pk})
+        self.assertEqual(self.ids(Query.objects.for_teacher(self.t2)), {self.q3.pk})
+        self.assertEqual(self.ids(Query.objects.for_student(self.s1)), {self.q1.pk})
+
+    def test_for_user_dispatch(self):
+        self.assertEqual(self.ids(Submission.objects.for_user(self.admin)), {self.sub1.pk, self.sub2.pk, self.sub3.pk})
+        self.assertEqual(self.ids(Submission.objects.for_user(self.s1)), {self.sub1.pk})
+        self.assertEqual(self.ids(Submission.objects.for_user(AnonymousUser()), expected_queries=0), set())
+
+    def test_every_model_and_role(self):
+        loner = make_student()
+        superuser = make_user(role='teacher', is_superuser=True)
+        expected = {
+            ProjectGroup: {
+                self.t1: {self.g1, self.g2}, self.t2: {self.g2, self.g3},
+                self.s1: {self.g1}, self.s2: {self.g3}, loner: set(), superuser: {self.g1, self.g2, self.g3},
+            },
+            Topic: {
+                self.t1: {self.topic1, self.topic3}, self.t2: {self.topic2, self.topic3},
+                self.s1: {self.topic1, self.topic3}, self.s2: {self.topic2, self.topic3},
+                loner: set(), superuser: {self.topic1, self.topic2, self.topic3},
+            },
+            Submission: {
+                self.t1: {self.sub1, self.sub2}, self.t2: {self.sub2, self.sub3},
+                self.s1: {self.sub1}, self.s2: {self.sub3}, loner: set(), superuser: {self.sub1, self.sub2, self.sub3},
+            },
+            Query: {
+                self.t1: {self.q1}, self.t2: {self.q3},
+                self.s1: {self.q1}, self.s2: {self.q3}, loner: set(), superuser: {self.q1, self.q3},
+            },
+        }
+        for model, by_user in expected.items():
+            for user, rows in by_user.items():
+                with self.subTest(model=model.__name__, user=user.username):
+                    self.assertEqual(self.ids(model.objects.for_user(user)), {obj.pk for obj in rows})
+
+    def test_scope_composes_into_one_query(self):
+        qs = Submission.objects.for_teacher(self.t1).filter(status='pending').select_related('group__topic')
+        with self.assertNumQueries(1):
+            rows = {(sub.pk, sub.group.topic_id) for sub in qs}
+        self.assertEqual(rows, {(self.sub1.pk, None), (self.sub2.pk, self.topic1.pk)})
+        # doosre teacher ka object WHERE clause me hi ruk jata hai
+        with self.assertNumQueries(1), self.assertRaises(ProjectGroup.DoesNotExist):
+            ProjectGroup.objects.for_teacher(self.t1).get(pk=self.g3.pk)
+
+    def test_unscoped_roles_see_nothing(self):
+        qs = ScopedQuerySet(Topic)
+        self.assertEqual(self.ids(qs.for_user(self.t1), expected_queries=0), set())
+        self.assertEqual(self.ids(qs.for_user(self.s1), expected_queries=0), set())
+        self.assertEqual(self.ids(qs.for_user(self.admin)), {self.topic1.pk, self.topic2.pk, self.topic3.pk})
+
+
+class ScopedViewTests(ScopedDataMixin, AppTestCase):
+    def test_teacher_cannot_open_other_teachers_objects(self):
+        self.client.force_login(self.t1)
+        self.assertEqual(self.client.get(reverse('group_detail', args=[self.g3.pk])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('group_update', args=[self.g3.pk])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('group_delete', args=[self.g3.pk])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('review_submission', args=[self.sub3.pk])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('topic_detail', args=[self.topic2.pk])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('group_detail', args=[self.g2.pk])).status_code, 200)
+
+    def test_submissions_list_is_scoped(self):
+        self.client.force_login(self.t1)
+        # session, user, submissions (group + uploader joined)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('submissions_list'))
+        self.assertEqual({s.pk for s in response.context['submissions']}, {self.sub1.pk, self.sub2.pk})
+
+    def test_student_thread_access(self):
+        self.client.force_login(self.s1)
+        self.assertEqual(self.client.get(reverse('group_queries', args=[self.g3.pk])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('group_queries', args=[self.g1.pk])).status_code, 200)
+        self.assertEqual(self.client.get(reverse('topic_detail', args=[self.topic1.pk])).status_code, 200)
+        self.assertEqual(self.client.get(reverse('topic_detail', args=[self.topic2.pk])).status_code, 404)
+
+    def test_api_list_is_scoped(self):
+        self.client.force_login(self.t2)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('api_list', args=['submissions']))
+        self.assertEqual({row['id'] for row in response.json()['results']}, {self.sub2.pk, self.sub3.pk})
+        response = self.client.get(reverse('api_list', args=['members']))
+        self.assertEqual({row['group'] for row in response.json()['results']}, {self.g3.pk})
+        self.assertEqual(self.client.get(reverse('api_detail', args=['groups', self.g1.pk])).status_code, 404)
+
+    @override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+    def test_change_feed_is_scoped(self):
+        def feed(user):
+            self.client.force_login(user)
+            changes = self.client.get(reverse('api_changes')).json()['changes']
+            return {(c['resource'], c['id']) for c in changes if c['resource'] in ('groups', 'submissions')}
+
+        # deletes tombstones se aate hain; sub1 t1 ka, sub3 t2 ka
+        deleted1, deleted3 = self.sub1.pk, self.sub3.pk
+        self.sub3.delete()
+        self.sub1.delete()
+        self.assertEqual(feed(self.t1), {('groups', self.g1.pk), ('groups', self.g2.pk), ('submissions', self.sub2.pk),
+                                         ('submissions', deleted1)})
+        self.assertEqual(feed(self.t2), {('groups', self.g2.pk), ('groups', self.g3.pk), ('submissions', self.sub2.pk),
+                                         ('submissions', deleted3)})
+        self.assertEqual(len(feed(self.admin)), 6)
+
+    async def test_download_requires_membership(self):
+        await self.async_client.aforce_login(self.s2)
+        response = await self.async_client.get(reverse('download_submission', args=[self.sub1.pk]))
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.db import connection
+from django.test import SimpleTestCase
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+def run_python(code, **env):
+    # settings module import time par hi fail/pass hote hain, isliye har case
+    # naye interpreter me
+    env = {**os.environ, 'DJANGO_SECRET_KEY': '', **env}
+    return subprocess.run(
+        [sys.executable, '-c', code], cwd=BASE_DIR, env=env, capture_output=True, text=True, timeout=60,
+    )
+
+
+class SettingsProfileTests(SimpleTestCase):
+    def test_suite_runs_on_test_profile(self):
+        from django.conf import settings
+        self.assertEqual(os.environ['DJANGO_SETTINGS_MODULE'], 'project_review.settings.test')
+        self.assertTrue(connection.is_in_memory_db())
+        self.assertEqual(settings.PASSWORD_HASHERS, ['django.contrib.auth.hashers.MD5PasswordHasher'])
+
+    def test_prod_requires_secret_key(self):
+        result = run_python('import project_review.settings.prod')
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('DJANGO_SECRET_KEY must be set', result.stderr)
+
+    def test_prod_rejects_per_process_cache(self):
+        result = run_python('import project_review.settings.prod', DJANGO_SECRET_KEY='x', CACHE_PROFILE='locmem')
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('is per-process', result.stderr)
+
+    def test_prod_reads_hosts_and_keeps_connections(self):
+        result = run_python(
+            'from project_review.settings import prod as s;'
+            'print(s.DEBUG, s.ALLOWED_HOSTS, s.DATABASES["default"]["CONN_MAX_AGE"])',
+            DJANGO_SECRET_KEY='x', DJANGO_ALLOWED_HOSTS='a.example, b.example', DB_CONN_MAX_AGE='30',
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "False ['a.example', 'b.example'] 30")
+
+    def test_worker_boot_skips_archive_imports(self):
+        result = run_python(
+            'import sys, django;'
+            'django.setup();'
+            'import project_review.urls, project_review_app.archival;'
+            'print("tarfile" in sys.modules)',
+            DJANGO_SETTINGS_MODULE='project_review.settings.dev',
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+from django.db import IntegrityError
+from django.test import Client
+from django.urls import reverse
+
+from ..forms import UNIQUE_ERRORS, StudentSignUpForm, TeacherForm, unique_error
+from ..models import CustomUser
+from .base import AppTestCase, ThreadedTestCase
+from .factories import make_admin, make_student
+
+
+def signup_data(n, **extra):
+    data = {
+        'username': f'new{n}', 'email': f'new{n}@example.com', 'password1': 'Str0ng-pass!', 'password2': 'Str0ng-pass!',
+        'semester': 5, 'division': 'A', 'roll_no': f'N{n:04d}',
+    }
+    data.update(extra)
+    return data
+
+
+class SignupTests(AppTestCase):
+    def test_signup_logs_in_and_lands_on_dashboard(self):
+        response = self.client.post(reverse('signup'), signup_data(1))
+        self.assertRedirects(response, reverse('student_dashboard'), fetch_redirect_response=False)
+        user = CustomUser.objects.get(email='new1@example.com')
+        self.assertEqual(user.role, 'student')
+        self.assertEqual(int(self.client.session['_auth_user_id']), user.pk)
+
+    def test_duplicates_get_a_friendly_error(self):
+        existing = make_student(roll_no='N0001')
+        cases = [
+            ('email', signup_data(2, email=existing.email)),
+            ('roll_no', signup_data(3, roll_no=' N0001 ')),
+            ('username', signup_data(4, username=existing.username)),
+        ]
+        for field, data in cases:
+            with self.subTest(field):
+                response = self.client.post(reverse('signup'), data)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.context['form'].has_error(field))
+        self.assertEqual(CustomUser.objects.filter(email__startswith='new').count(), 0)
+
+    def test_roll_no_is_unique_per_semester_and_division(self):
+        make_student(roll_no='N0005')
+        for n, extra in enumerate([{'division': 'B'}, {'semester': 6}], start=5):
+            with self.subTest(extra):
+                response = self.client.post(reverse('signup'), signup_data(n, roll_no='N0005', **extra))
+                self.assertEqual(response.status_code, 302)
+                self.client.logout()
+
+    def test_validation_does_no_uniqueness_queries(self):
+        form = StudentSignUpForm(signup_data(7))
+        with self.assertNumQueries(0):
+            self.assertTrue(form.is_valid())
+
+    def test_race_between_validated_forms(self):
+        # dono forms valid — jo pehle save hua wo jeeta, doosre ko error milta hai
+        first, second = StudentSignUpForm(signup_data(8)), StudentSignUpForm(signup_data(9, email='new8@example.com'))
+        self.assertTrue(first.is_valid() and second.is_valid())
+        self.assertIsNotNone(first.save_or_error())
+        self.assertIsNone(second.save_or_error())
+        self.assertTrue(second.has_error('email'))
+
+    def test_unique_error_matches_constraints_exactly(self):
+        def error(message, constraint=None):
+            # psycopg ka error ``diag.constraint_name`` deta hai
+            cause = Exception(message)
+            cause.diag = SimpleNamespace(constraint_name=constraint)
+            exc = IntegrityError(message)
+            exc.__cause__ = cause
+            return unique_error(exc)
+
+        table = CustomUser._meta.db_table
+        self.assertEqual(error(f'UNIQUE constraint failed: {table}.email')[0], 'email')
+        self.assertEqual(error(f'UNIQUE constraint failed: {table}.semester, {table}.division, {table}.roll_no')[0],
+                         'roll_no')
+        # roll_no/email naam wale doosre violations user ko galat field error na dein
+        self.assertIsNone(error('UNIQUE constraint failed: project_review_app_rollnoaudit.roll_no'))
+        self.assertIsNone(error('CHECK constraint failed: user_email_lowercase'))
+        self.assertIsNone(error('NOT NULL constraint failed: project_review_app_customuser.email'))
+        # Postgres
+        self.assertEqual(error('duplicate key', 'student_roll_no_uniq')[0], 'roll_no')
+        self.assertEqual(error('duplicate key', f'{table}_username_key')[0], 'username')
+        self.assertEqual(error('duplicate key', f'{table}_email_6f2a1c_uniq')[0], 'email')
+        self.assertIsNone(error('check', 'user_email_lowercase'))
+
+    def test_teacher_and_admin_creation_report_duplicates(self):
+        admin = make_admin()
+        self.client.force_login(admin)
+        form = TeacherForm({'username': 't-new', 'email': admin.email, 'password': 'x'})
+        self.assertTrue(form.is_valid())
+        self.assertIsNone(form.save_or_error())
+
+        response = self.client.post(reverse('add_admin'), {
+            'username': 'admin-new', 'email': admin.email, 'password1': 'pw', 'password2': 'pw',
+        })
+        self.assertContains(response, 'An account with this email already exists.')
+        self.assertFalse(CustomUser.objects.filter(username='admin-new').exists())
+        response = self.client.post(reverse('add_admin'), {
+            'username': 'admin-new', 'email': 'admin-new@example.com', 'password1': 'pw', 'password2': 'pw',
+        })
+        self.assertRedirects(response, reverse('manage_admins'), fetch_redirect_response=False)
+        self.assertTrue(CustomUser.objects.get(username='admin-new').check_password('pw'))
+
+
+class ConcurrentSignupTests(ThreadedTestCase):
+    THREADS = 200
+
+    def test_parallel_signups(self):
+        # intake khulte hi 100 students, har ek ka form do baar (double submit);
+        # har pair me ek hi account banna chahiye, baaki ko friendly error
+        def post(n):
+            return Client().post(reverse('signup'), signup_data(n // 2, username=f'new{n // 2}-{n % 2}'))
+
+        responses = self.run_threads(post, self.THREADS)
+        statuses = [r.status_code for r in responses]
+        self.assertEqual(sorted(set(statuses)), [200, 302])
+        self.assertEqual(statuses.count(302), self.THREADS // 2)
+        messages = {message for *_, message in UNIQUE_ERRORS}
+        for response in responses:
+            if response.status_code == 200:
+                self.assertTrue(any(message in response.content.decode() for message in messages))
+        self.assertEqual(self.in_thread(CustomUser.objects.count), self.THREADS // 2)
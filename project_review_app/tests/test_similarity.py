@@ -0,0 +1,130 @@
+import io
+import random
+import zipfile
+import zlib
+from unittest import mock
+
+from django.urls import reverse
+
+from .. import inspection
+from ..archival import purge_groups
+from ..fingerprints import K, WINDOW, fingerprint, winnow
+from ..inspection import analyse_file, extract_text
+from ..models import Fingerprint, SimilarityMatch
+from ..processing import inspect_submission
+from .base import AppTestCase
+from .factories import make_group, make_student, make_submission, make_teacher
+
+
+def _words(seed, n):
+    rng = random.Random(seed)
+    return ' '.join(''.join(rng.choice('abcdefghij') for _ in range(6)) for _ in range(n))
+
+
+def _zip(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def _pdf(text):
+    content = f'BT /F1 12 Tf ({text}) Tj ET'.encode()
+    return b'%PDF-1.4\n1 0 obj<</Filter/FlateDecode>>stream\n' + zlib.compress(content) + b'\nendstream\nendobj\n'
+
+
+class FingerprintTests(AppTestCase):
+    def test_shared_passage_always_shares_a_fingerprint(self):
+        passage = _words(1, K + WINDOW - 1)
+        a = fingerprint(f'{_words(2, 200)} {passage} {_words(3, 50)}')
+        b = fingerprint(f'{_words(4, 80)} {passage.upper()}')
+        self.assertTrue(set(a) & set(b))
+        self.assertFalse(set(fingerprint(_words(5, 300))) & set(a))
+
+    def test_winnow_and_limit(self):
+        self.assertEqual(winnow([5, 3, 7, 1, 9, 8, 6, 4], 4), [1, 4])
+        self.assertEqual(winnow([2, 1], 4), [1])
+        self.assertEqual(fingerprint('too short'), [])
+        capped = fingerprint(_words(6, 3000), limit=100)
+        self.assertEqual(capped, sorted(fingerprint(_words(6, 3000)))[:100])
+
+    def test_extract_text_from_archive(self):
+        path = f'{self._media_root}/bundle.zip'
+        with open(path, 'wb') as f:
+            f.write(_zip({
+                'src/main.py': 'def main():\n    return 42\n',
+                'report.pdf': _pdf('Hello \\(pdf\\) world'),
+                'logo.png': b'\x89PNG\x00\x01',
+            }))
+        text = extract_text(path)
+        self.assertIn('return 42', text)
+        self.assertIn('Hello (pdf) world', text)
+        self.assertNotIn('PNG', text)
+        result = analyse_file(path)
+        self.assertEqual(result['file_count'], 3)
+        self.assertTrue(result['fingerprints'])
+
+    def test_pdf_text_is_streamed_and_bounded(self):
+        pdf = b''.join(_pdf(f'page {n}') for n in range(3)) + b'3 0 obj stream\nplain (raw) Tj\nendstream'
+        # chhote chunks: markers chunk boundaries par katte hain
+        with mock.patch.object(inspection, 'PDF_SCAN_CHUNK', 5):
+            text = inspection._pdf_text(io.BytesIO(pdf))
+        self.assertEqual(text.split(), ['page', '0', 'page', '1', 'page', '2', 'raw'])
+
+        # 5 MB inflate hone wali stream (~5 KB compressed) aur aise kai streams
+        bomb = b'(x) Tj ' * (5 * 1024 * 1024 // 7)
+        stream = b'stream\n' + zlib.compress(bomb, 9) + b'\nendstream\n'
+        with mock.patch.object(inspection, 'MAX_PDF_INFLATED_TOTAL', 6 * 1024 * 1024):
+            text = inspection._pdf_text(io.BytesIO(stream * 5))
+        # per-stream cap 4 MB, document cap 6 MB: 4 + 2 MB output, har 7 bytes par 'x '
+        self.assertEqual(text.count('x'), (6 * 1024 * 1024) // 7)
+
+
+class SimilarityTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.g1 = make_group(teacher=cls.teacher, members=[make_student()])
+        cls.g2 = make_group(teacher=cls.teacher, members=[make_student()])
+        cls.g3 = make_group(teacher=cls.teacher, members=[make_student()])
+
+    def upload(self, group, text):
+        sub = make_submission(group, content=_zip({'main.py': text.encode()}), name='code.zip')
+        inspect_submission(sub, mode='sync')
+        return sub
+
+    def test_copied_submission_is_matched_both_ways(self):
+        original = _words(10, 400)
+        sub1 = self.upload(self.g1, original)
+        unrelated = self.upload(self.g3, _words(11, 400))
+        same_group = self.upload(self.g1, original)
+        copy = self.upload(self.g2, _words(12, 40) + ' ' + original[:2000])
+
+        # apne group ke submissions aapas me match nahi hote
+        matches = {m.other_id: m for m in copy.similarity_matches.all()}
+        self.assertEqual(set(matches), {sub1.pk, same_group.pk})
+        self.assertGreater(matches[sub1.pk].score, 0.8)
+        self.assertEqual(list(sub1.similarity_matches.values_list('other_id', flat=True)), [copy.pk])
+        self.assertEqual(list(same_group.similarity_matches.values_list('other_id', flat=True)), [copy.pk])
+        self.assertFalse(unrelated.similarity_matches.exists())
+        self.assertEqual(copy.manifest.fingerprint_count, Fingerprint.objects.filter(submission=copy).count())
+
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse('review_submission', args=[sub1.pk]))
+        self.assertContains(response, 'Similar submissions')
+        self.assertContains(response, self.g2.name)
+
+    def test_reinspect_replaces_index_and_purge_clears_it(self):
+        original = _words(20, 300)
+        sub1 = self.upload(self.g1, original)
+        copy = self.upload(self.g2, original)
+        self.assertEqual(SimilarityMatch.objects.count(), 2)
+
+        copy.file.save('code.zip', io.BytesIO(_zip({'main.py': _words(21, 300).encode()})))
+        inspect_submission(copy, mode='sync')
+        self.assertFalse(SimilarityMatch.objects.exists())
+
+        purge_groups([self.g1.pk])
+        self.assertFalse(Fingerprint.objects.filter(submission=sub1).exists())
+        self.assertTrue(Fingerprint.objects.filter(submission=copy).exists())
@@ -0,0 +1,55 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+from ..models import GroupSummary, Topic
+from ..reviews import bulk_review, record_review
+from ..summaries import check_consistency
+from .base import AppTestCase
+from .factories import make_group, make_member, make_submission, make_teacher, make_topic
+
+
+class GroupSummaryTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.topic = make_topic(cls.teacher, title='Compilers')
+        cls.group = make_group(cls.teacher, cls.topic)
+
+    def summary(self):
+        return GroupSummary.objects.get(group=self.group)
+
+    def test_projection_follows_writes(self):
+        make_member(self.group)
+        first = make_submission(self.group)
+        second = make_submission(self.group)
+        summary = self.summary()
+        self.assertEqual((summary.member_count, summary.pending_count, summary.topic_title), (1, 2, 'Compilers'))
+
+        record_review(first, self.teacher, 'approved', '')
+        bulk_review(self.teacher, [second.pk], 'rejected')
+        summary = self.summary()
+        self.assertEqual((summary.pending_count, summary.latest_status), (0, 'rejected'))
+
+        # deletes ke baad refresh commit par hota hai
+        with self.captureOnCommitCallbacks(execute=True):
+            Topic.objects.get(pk=self.topic.pk).delete()
+        self.assertEqual(self.summary().topic_title, '')
+        self.assertEqual(check_consistency(), [])
+
+    def test_checker_reports_drift_and_rebuild_fixes_it(self):
+        make_member(self.group)
+        other = make_group(self.teacher)
+        GroupSummary.objects.filter(group=self.group).update(member_count=7)
+        GroupSummary.objects.filter(group=other).delete()
+
+        self.assertEqual(check_consistency(), [(self.group.pk, 'member_count', 7, 1), (other.pk, '*', None, 'missing')])
+        stdout = StringIO()
+        with self.assertRaisesMessage(CommandError, '2 summary mismatch(es) found.'):
+            call_command('rebuild_group_summaries', '--check', stdout=stdout)
+        self.assertIn(f'group {self.group.pk}: member_count stored=7 live=1', stdout.getvalue())
+
+        call_command('rebuild_group_summaries', stdout=StringIO())
+        self.assertEqual(check_consistency(), [])
+        call_command('rebuild_group_summaries', '--check', stdout=stdout)
+        self.assertIn('consistent', stdout.getvalue())
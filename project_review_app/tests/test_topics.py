@@ -0,0 +1,100 @@
+from django.urls import reverse
+
+from ..forms import GroupForm, TopicForm
+from ..models import ProjectGroup, Topic
+from ..topics import TopicUnavailable, catalogue_stats, claim_topic
+from .base import AppTestCase, ThreadedTestCase
+from .factories import make_group, make_teacher, make_topic
+
+
+class StaleFormTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+        cls.topic = make_topic(cls.teacher, capacity=2)
+
+    def claimed(self):
+        return Topic.objects.values_list('claimed_count', flat=True).get(pk=self.topic.pk)
+
+    def test_topic_edit_keeps_parallel_claims(self):
+        form = TopicForm({'title': 'Renamed', 'description': '', 'capacity': 2}, instance=self.topic)
+        self.assertTrue(form.is_valid())
+        claim_topic(make_group(self.teacher), self.topic.pk)
+        self.assertIsNotNone(form.save_or_error())
+        self.assertEqual(self.claimed(), 1)
+
+    def test_capacity_below_parallel_claims_is_a_form_error(self):
+        self.client.force_login(self.teacher)
+        form = TopicForm({'title': 'T', 'description': '', 'capacity': 1}, instance=self.topic)
+        self.assertTrue(form.is_valid())
+        claim_topic(make_group(self.teacher), self.topic.pk)
+        claim_topic(make_group(self.teacher), self.topic.pk)
+        self.assertIsNone(form.save_or_error())
+        self.assertEqual(form.errors['capacity'], ['2 groups already have this topic.'])
+        self.assertEqual(Topic.objects.get(pk=self.topic.pk).capacity, 2)
+
+        response = self.client.post(reverse('edit_topic', args=[self.topic.pk]), {
+            'title': 'T', 'description': '', 'capacity': 1,
+        })
+        self.assertContains(response, '2 groups already have this topic.')
+
+    def test_group_edit_keeps_parallel_topic_claim(self):
+        group = make_group(self.teacher, name='Alpha')
+        form = GroupForm({'name': 'Beta', 'max_members': 3, 'topic': ''}, instance=group, user=self.teacher)
+        self.assertTrue(form.is_valid())
+        # student ne form khula rehte topic claim kiya
+        claim_topic(ProjectGroup.objects.get(pk=group.pk), self.topic.pk)
+        form.save()
+        group = ProjectGroup.objects.get(pk=group.pk)
+        self.assertEqual((group.name, group.topic_id), ('Beta', self.topic.pk))
+        self.assertEqual(self.claimed(), 1)
+
+
+class UnlimitedCapacityTests(AppTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher()
+
+    def test_blank_capacity_means_no_limit(self):
+        form = TopicForm({'title': 'Open topic', 'description': '', 'capacity': ''})
+        self.assertTrue(form.is_valid(), form.errors)
+        form.instance.created_by = self.teacher
+        topic = form.save_or_error()
+        self.assertIsNone(topic.capacity)
+
+        for _ in range(5):
+            claim_topic(make_group(self.teacher), topic.pk)
+        topic.refresh_from_db()
+        self.assertEqual((topic.claimed_count, topic.available, topic.has_seats), (5, None, True))
+
+        stats = catalogue_stats(Topic.objects.filter(pk=topic.pk))
+        self.assertEqual(stats, {'total': 1, 'open_topics': 1, 'seats_left': 0})
+
+
+class ConcurrentClaimTests(ThreadedTestCase):
+    def test_parallel_claims_never_exceed_capacity(self):
+        def setup():
+            teacher = make_teacher()
+            topics = [make_topic(teacher, capacity=2), make_topic(teacher, capacity=2)]
+            return topics, [make_group(teacher) for _ in range(8)]
+
+        topics, groups = self.in_thread(setup)
+        # har group dono topics ek saath claim karta hai
+        results = self.run_threads(lambda i: claim_topic(groups[i // 2], topics[i % 2].pk), 16)
+        self.assertEqual(
+            {type(r) for r in results if r is not None}, {TopicUnavailable},
+        )
+
+        def check():
+            claimed = dict(Topic.objects.values_list('pk', 'claimed_count'))
+            assigned = {
+                topic.pk: ProjectGroup.objects.filter(topic=topic).count() for topic in topics
+            }
+            with_topic = ProjectGroup.objects.filter(topic__isnull=False).count()
+            return claimed, assigned, with_topic
+
+        claimed, assigned, with_topic = self.in_thread(check)
+        self.assertEqual(claimed, assigned)
+        self.assertEqual(set(claimed.values()), {2})
+        self.assertEqual(with_topic, 4)
+        self.assertEqual(len([r for r in results if r is None]), 4)
@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from . import audit
+from .caching import bump_on_commit
+from .models import TOPIC_HAS_SEATS, AuditEntry, ProjectGroup, Topic
+from .summaries import refresh_group_summaries
+
+
+# --------------------
+# Topic catalogue / claims
+# --------------------
+# Topic selection day par bahut groups ek saath same topic claim karte hain.
+# Claim ek conditional ``UPDATE topic SET claimed_count = claimed_count + 1
+# WHERE id = ? AND (capacity IS NULL OR claimed_count < capacity)`` hai: database
+# khud decide karta hai ki kaun pehle aaya, koi row lock / SELECT FOR UPDATE
+# nahi, aur capacity se zyada assignment possible nahi (CheckConstraint bhi
+# hai). Bina capacity wale topics kitne bhi groups le sakte hain. Group ka topic bhi
+# compare-and-swap se badalta hai, taaki do parallel claims ek group ko do
+# topics na de dein.
+
+CATALOGUE_PAGE_SIZE = 20
+
+
+class TopicUnavailable(Exception):
+    """Topic full hai, exist nahi karta, ya group ka topic beech me badal gaya."""
+
+
+def catalogue(user, q=''):
+    """User ko dikhne wale topics (``Topic.objects.for_user``), title se search."""
+    topics = Topic.objects.for_user(user).select_related('created_by')
+    if q:
+        topics = topics.filter(title__icontains=q)
+    return topics.order_by('title', 'pk')
+
+
+def catalogue_stats(topics):
+    """
+    Total, open topics aur bachi hui seats — ek aggregate query me. Seats sirf
+    limit wale topics ki ginti hain.
+    """
+    stats = topics.order_by().aggregate(
+        total=Count('pk'),
+        open_topics=Count('pk', filter=TOPIC_HAS_SEATS),
+        seats_left=Sum(Greatest(F('capacity') - F('claimed_count'), 0), filter=Q(capacity__isnull=False)),
+    )
+    stats['seats_left'] = stats['seats_left'] or 0
+    return stats
+
+
+def _after_change(group_ids):
+    # queryset update() signals nahi bhejta
+    refresh_group_summaries(group_ids)
+    bump_on_commit(Topic, ProjectGroup)
+
+
+def change_topic(group, new_topic_id, expected_topic_id):
+    """
+    Group ka topic ``expected_topic_id`` se ``new_topic_id`` karo. Naya topic full
+    ho ya group ka topic beech me kisi aur ne badal diya ho to ``TopicUnavailable``
+    aur kuch nahi badalta.
+    """
+    if new_topic_id == expected_topic_id:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        swapped = ProjectGroup.objects.filter(pk=group.pk, topic_id=expected_topic_id).update(
+            topic_id=new_topic_id, updated_at=now,
+        )
+        if not swapped:
+            raise TopicUnavailable("The group's topic was changed by someone else.")
+        if new_topic_id is not None:
+            claimed = Topic.objects.filter(TOPIC_HAS_SEATS, pk=new_topic_id).update(
+                claimed_count=F('claimed_count') + 1, updated_at=now,
+            )
+            if not claimed:
+                # group wala swap bhi rollback ho jaye
+                raise TopicUnavailable("This topic has no seats left.")
+        if expected_topic_id is not None:
+            Topic.objects.filter(pk=expected_topic_id, claimed_count__gt=0).update(
+                claimed_count=F('claimed_count') - 1, updated_at=now,
+            )
+        _after_change([group.pk])
+        # update() signals nahi bhejta
+        audit.record(AuditEntry.ACTION_UPDATE, group, {'topic': [expected_topic_id, new_topic_id]})
+    group.topic_id = new_topic_id
+
+
+def claim_topic(group, topic_id):
+    """Student flow: sirf bina topic wala group claim kar sakta hai."""
+    if group.topic_id is not None:
+        raise TopicUnavailable("Your group already has a topic.")
+    change_topic(group, topic_id, None)
+
+
+def release_claims(topic_counts):
+    """``{topic_id: n}`` — deleted groups ke seats wapas do."""
+    now = timezone.now()
+    for topic_id, n in topic_counts.items():
+        Topic.objects.filter(pk=topic_id).update(
+            claimed_count=Greatest(F('claimed_count') - n, 0), updated_at=now,
+        )
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, async_views, views
 from django.contrib.auth import views as auth_views
 
 urlpatterns = [
@@ -21,6 +21,7 @@ urlpatterns = [
     path("manage-admins/", views.manage_admins, name="manage_admins"),
     path("edit-admin/<int:admin_id>/", views.edit_admin, name="edit_admin"),
     path("delete-admin/<int:admin_id>/", views.delete_admin, name="delete_admin"),
+    path("dashboard/audit-log/", views.audit_log, name="audit_log"),
 
     #admin manage krega teachers ko
     path("dashboard/add-teacher/", views.add_teacher, name="add_teacher"),
@@ -35,12 +36,20 @@ urlpatterns = [
 
     # teacher
     path('teacher-dashboard/', views.teacher_dashboard, name='teacher_dashboard'),
+    path('teacher-dashboard/counters/', async_views.dashboard_counters, name='dashboard_counters'),
+    path('teacher-dashboard/counters/sync/', views.dashboard_counters_sync, name='dashboard_counters_sync'),
+    path('teacher/search/', async_views.search, name='teacher_search'),
+    path('teacher/search/sync/', views.search_sync, name='teacher_search_sync'),
     path('teacher/view-students/', views.view_students, name='view_students'),
+    path('teacher/view-students/roster/', views.student_roster, name='student_roster'),
     path('teacher/create-topic/', views.create_topic, name='create_topic'),
     path('teacher/create-group/', views.create_group, name='create_group'),
     path('teacher/group/<int:group_id>/assign/', views.assign_members, name='assign_members'),
     path('teacher/submissions/', views.submissions_list, name='submissions_list'),
     path('teacher/submission/<int:sub_id>/review/', views.review_submission, name='review_submission'),
+    path('teacher/submission/<int:sub_id>/review/start/', views.start_review, name='start_review'),
+    path('teacher/review-queue/next/', views.review_queue_next, name='review_queue_next'),
+    path('teacher/submissions/bulk-review/', views.bulk_review_submissions, name='bulk_review_submissions'),
 
     #grp crud
     path('groups/', views.group_list, name='group_list'),
@@ -54,6 +63,20 @@ urlpatterns = [
     path("topics/<int:pk>/", views.topic_detail, name="topic_detail"),
     path('teacher/view-students/<int:student_id>/', views.student_detail, name='student_detail'),
     path("topics/", views.topics_list, name="topics_list"),
+    path('topics/catalogue/', views.topic_catalogue, name='topic_catalogue'),
+    path('topics/<int:pk>/claim/', views.claim_topic_view, name='claim_topic'),
+
+    # milestones (submission windows)
+    path('teacher/milestones/', views.milestone_list, name='milestone_list'),
+    path('teacher/milestones/<int:pk>/delete/', views.milestone_delete, name='milestone_delete'),
+
+    # rubrics & grading
+    path('teacher/rubrics/', views.rubric_list, name='rubric_list'),
+    path('teacher/rubrics/<int:pk>/', views.rubric_edit, name='rubric_edit'),
+    path('teacher/submission/<int:sub_id>/grade/', views.grade_submission, name='grade_submission'),
+    path('teacher/grades/', views.cohort_grades, name='cohort_grades'),
+    path('teacher/grades/export/', views.export_grades, name='export_grades'),
+    path('teacher/group/<int:group_id>/adjust/', views.member_adjustment, name='member_adjustment'),
 
     
 
@@ -61,8 +84,26 @@ urlpatterns = [
     path('student-dashboard/', views.student_dashboard, name='student_dashboard'),
     path('student/my-group/', views.my_group, name='my_group'),
     path('project-submission/', views.project_submission, name='project_submission'),
+    path('project-submission/upload/', async_views.upload_submission, name='upload_submission'),
+    path('submissions/<int:sub_id>/download/', async_views.download_submission, name='download_submission'),
+    path('submissions/<int:sub_id>/download/sync/', views.download_submission_sync, name='download_submission_sync'),
     path('my-submissions/', views.view_submissions, name='view_submissions'),
+    path('my-submissions/events/', async_views.submission_events, name='submission_events'),
     path('profile/', views.profile, name='profile'),
     path('help-center/', views.help_center, name='help_center'),
 
+    # group q&a threads
+    path('groups/<int:group_id>/queries/', views.group_queries, name='group_queries'),
+    path('groups/<int:group_id>/queries/messages/', views.group_queries_messages, name='group_queries_messages'),
+    path('groups/<int:group_id>/queries/poll/', async_views.group_queries_poll, name='group_queries_poll'),
+    path('teacher/queries/', views.query_inbox, name='query_inbox'),
+
+    path('metrics/', views.metrics_view, name='metrics'),
+
+    # json api (v1)
+    path('api/v1/changes/', api.api_changes, name='api_changes'),
+    path('api/v1/cache-stats/', api.api_cache_stats, name='api_cache_stats'),
+    path('api/v1/<str:resource>/', api.api_list, name='api_list'),
+    path('api/v1/<str:resource>/<int:pk>/', api.api_detail, name='api_detail'),
+
 ]
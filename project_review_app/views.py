@@ -1,14 +1,44 @@
-from django.contrib.auth import login, authenticate, logout
+from django.contrib.auth import login, logout
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.utils import timezone
 from django.contrib import messages
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch, Q, Sum
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.paginator import Paginator
 from django.urls import reverse_lazy, reverse
 from django.views.generic import DeleteView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from .models import *
-from .forms import *
+from django.contrib.auth.forms import AuthenticationForm
+from .models import (
+    AuditEntry, CriterionScore, CustomUser, GroupMember, Milestone, ProjectGroup, Rubric, Submission, Topic,
+)
+from .forms import (
+    AdjustmentForm, AdminForm, AssignMembersForm, CriterionFormSet, EmailAuthenticationForm, GroupForm, MilestoneForm,
+    QueryForm, RubricForm, ScoreForm, StudentForm, StudentSignUpForm, SubmissionForm, TeacherForm, TopicForm,
+    unique_error,
+)
+from .archival import purge_groups
+from .topics import CATALOGUE_PAGE_SIZE, TopicUnavailable, catalogue, catalogue_stats, claim_topic
+from .memberships import MembershipError, current_membership, set_members
+from .milestones import issue_ticket, milestones_for, next_milestone, open_milestone
+from .caching import cached
+from .roster import ROSTER_MAX_PAGE_SIZE, ROSTER_PAGE_SIZE, roster_page, roster_queryset
+from .similarity import TOP_MATCHES
+from .dashboards import admin_overview, dashboard_for, student_overview, teacher_overview
+from .grading import cohort_grades as grade_rows, csv_lines, rubric_for, save_scores, set_adjustment
+from . import audit, metrics
+from .async_views import counter_querysets, search_querysets, submission_file_response
+from .queries import (
+    PAGE_SIZE as QUERY_PAGE_SIZE, inbox_groups, mark_read,
+    serialize_message, thread_messages,
+)
+from .reviews import (
+    ReviewConflict, bulk_review, claim_next_submission, claim_submission, record_review,
+)
 
 
 # --------------------
@@ -30,16 +60,13 @@ def student_signup(request):
 
     if request.method == 'POST':
         form = StudentSignUpForm(request.POST)
-        if form.is_valid():
-            user = form.save()
-            # auto-login (safe because we know the password just set)
-            user = authenticate(request, username=user.username, password=form.cleaned_data['password1'])
-            if user:
-                login(request, user)
-                messages.success(request, "Welcome! Your student account is ready.")
-                return redirect('home')
-            messages.info(request, "Account created. Please login.")
-            return redirect('login')
+        # email / roll no ka duplicate DB constraint pakadta hai (pre-check nahi)
+        user = form.save_or_error() if form.is_valid() else None
+        if user:
+            # abhi banaya hua user — authenticate() se dobara lookup + hash ki zaroorat nahi
+            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+            messages.success(request, "Welcome! Your student account is ready.")
+            return redirect(dashboard_for(user))
     else:
         form = StudentSignUpForm()
     return render(request, 'signup.html', {'form': form, 'signup_title': 'Student Sign Up Only'})
@@ -48,19 +75,12 @@ def student_signup(request):
 def login_view(request):
     if request.method == "POST":
         form = EmailAuthenticationForm(request, data=request.POST)
+        # is_valid() authenticate() chala chuka hai (EmailBackend: ek indexed
+        # lookup + ek hash); dobara lookup nahi
         if form.is_valid():
-            email = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            try:
-                user_obj = CustomUser.objects.get(email=email)
-                user = authenticate(request, username=user_obj.username, password=password)
-                if user:
-                    login(request, user)
-                    return redirect('home')
-                else:
-                    form.add_error('password', 'Incorrect password')
-            except CustomUser.DoesNotExist:
-                form.add_error('username', 'No account found with this email')
+            user = form.get_user()
+            login(request, user)
+            return redirect(dashboard_for(user))
     else:
         form = EmailAuthenticationForm()
     return render(request, 'login.html', {'form': form})
@@ -72,15 +92,7 @@ def dashboard_view(request):
     if not (request.user.is_superuser or request.user.role == "admin"):
         return redirect("home")   # non-admin ko hata do
 
-    total_teachers = CustomUser.objects.filter(role="teacher").count()
-    total_students = CustomUser.objects.filter(role="student").count()
-    total_admins = CustomUser.objects.filter(role="admin").count()
-
-    return render(request, "admin/dashboard.html", {
-        "total_teachers": total_teachers,
-        "total_students": total_students,
-        "total_admins": total_admins,
-    })
+    return render(request, "admin/dashboard.html", admin_overview())
 
 
 
@@ -101,6 +113,40 @@ def admin_login(request):
 
 
 
+@login_required(login_url="admin_login")
+def audit_log(request):
+    if not (request.user.is_superuser or request.user.role == "admin"):
+        return redirect("home")
+
+    params = request.GET
+    filters = {
+        'model': params.get('model', ''),
+        'object_id': params.get('object_id', ''),
+        'actor': params.get('actor', ''),
+        'action': params.get('action', ''),
+        'since': params.get('since', ''),
+        'until': params.get('until', ''),
+    }
+    try:
+        entries = audit.search(
+            before=int(params['before']) if params.get('before') else None,
+            **{key: value or None for key, value in filters.items()},
+        )
+        entries = list(entries[:audit.AUDIT_PAGE_SIZE + 1])
+    except (ValueError, ValidationError):
+        messages.error(request, "Invalid filter value.")
+        entries = []
+    has_more = len(entries) > audit.AUDIT_PAGE_SIZE
+    entries = entries[:audit.AUDIT_PAGE_SIZE]
+    return render(request, "admin/audit_log.html", {
+        'entries': entries,
+        'filters': filters,
+        'next_before': entries[-1].pk if has_more else None,
+        'models': [m._meta.model_name for m in audit.AUDITED_MODELS],
+        'actions': AuditEntry.ACTION_CHOICES,
+    })
+
+
 def admin_logout(request):
     logout(request)
     return redirect("admin_login") 
@@ -114,24 +160,32 @@ def add_admin(request):
     if request.method == "POST":
         email = request.POST.get("email")
         username = request.POST.get("username")
-        password = request.POST.get("password")
+        # template password1/password2 bhejta hai
+        password = request.POST.get("password1")
 
-        if CustomUser.objects.filter(email=email).exists():
-            messages.error(request, "Email already exists.")
+        if not password or password != request.POST.get("password2"):
+            messages.error(request, "Passwords do not match.")
         else:
-            user = CustomUser.objects.create_user(
-                email=email, username=username, password=password, role="admin"
-            )
-            messages.success(request, "Admin added successfully!")
-            return redirect("manage_admins")
+            try:
+                with transaction.atomic():
+                    CustomUser.objects.create_user(
+                        email=email, username=username, password=password, role="admin"
+                    )
+            except IntegrityError as exc:
+                found = unique_error(exc)
+                if found is None:
+                    raise
+                messages.error(request, found[1])
+            else:
+                messages.success(request, "Admin added successfully!")
+                return redirect("manage_admins")
     return render(request, "admin/add_admin.html")
 
 def edit_admin(request, admin_id):
     admin = get_object_or_404(CustomUser, id=admin_id)  # 👈 User ki jagah CustomUser lo
     if request.method == "POST":
         form = AdminForm(request.POST, instance=admin)
-        if form.is_valid():
-            form.save()
+        if form.is_valid() and form.save_or_error():
             return redirect("manage_admins")
     else:
         form = AdminForm(instance=admin)
@@ -158,10 +212,9 @@ def manage_teachers(request):
 def add_teacher(request):
     if request.method == "POST":
         form = TeacherForm(request.POST)
-        if form.is_valid():
-            form.save()
+        if form.is_valid() and form.save_or_error():
             messages.success(request, "Teacher added successfully!")
-            return redirect("admin_dashboard")
+            return redirect("manage_teachers")
     else:
         form = TeacherForm()
     return render(request, "admin/add_teacher.html", {"form": form})
@@ -170,8 +223,7 @@ def edit_teacher(request, teacher_id):
     teacher = get_object_or_404(CustomUser, id=teacher_id, role="teacher")
     if request.method == "POST":
         form = TeacherForm(request.POST, instance=teacher)
-        if form.is_valid():
-            form.save()
+        if form.is_valid() and form.save_or_error():
             return redirect("manage_teachers")
     else:
         form = TeacherForm(instance=teacher)
@@ -196,8 +248,7 @@ def edit_student(request, student_id):
     student = get_object_or_404(CustomUser, id=student_id, role="student")
     if request.method == "POST":
         form = StudentForm(request.POST, instance=student)
-        if form.is_valid():
-            form.save()
+        if form.is_valid() and form.save_or_error():
             messages.success(request, "Student updated successfully!")
             return redirect("manage_students")
     else:
@@ -222,9 +273,7 @@ def logout_view(request):
 @login_required
 def home(request):
     """Redirect user based on role"""
-    if request.user.role == 'teacher':
-        return redirect('teacher_dashboard')
-    return redirect('student_dashboard')
+    return redirect(dashboard_for(request.user))
 
 
 # --------------------
@@ -248,56 +297,134 @@ def student_required(view_func):
 # --------------------
 @teacher_required
 def teacher_dashboard(request):
-    teacher = request.user  
-    context = {
-        "students_count": CustomUser.objects.filter(role="student").count(),
-        "topics_count": Topic.objects.filter(created_by=teacher).count(),
-        "groups_count": ProjectGroup.objects.filter(topic__created_by=teacher).count(),
-        "pending_reviews_count": Submission.objects.filter(
-            status="pending",
-            group__topic__created_by=teacher
-        ).count(),
-    }
-    return render(request, "teacher_dashboard.html", context)
+    return render(request, "teacher_dashboard.html", teacher_overview(request.user))
 
 
 @teacher_required
 def view_students(request):
-    students = CustomUser.objects.filter(role='student').order_by('semester', 'division', 'roll_no')
-    semester = request.GET.get('semester')
-    division = request.GET.get('division')
-
-    if semester:
-        students = students.filter(semester=semester)
-    if division:
-        students = students.filter(division=division)
-
+    # rows page par JS roster feed (student_roster) se aati hain
     return render(request, 'teacher/view_students.html', {
-        'students': students,
-        'current_semester': semester or '',
-        'current_division': division or '',
+        'current_semester': request.GET.get('semester') or '',
+        'current_division': request.GET.get('division') or '',
         'semester_choices': CustomUser.SEMESTER_CHOICES,
         'division_choices': CustomUser.DIVISION_CHOICES
     })
 
 
+@teacher_required
+def student_roster(request):
+    """Compact columnar JSON roster, keyset paginated (``?cursor=&limit=``)."""
+    try:
+        limit = min(max(int(request.GET.get('limit', ROSTER_PAGE_SIZE)), 1), ROSTER_MAX_PAGE_SIZE)
+    except ValueError:
+        limit = ROSTER_PAGE_SIZE
+    students = roster_queryset(request.GET.get('semester'), request.GET.get('division'))
+    try:
+        page = roster_page(students, request.GET.get('cursor'), limit)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid cursor.'}, status=400)
+    return JsonResponse(page, json_dumps_params={'separators': (',', ':')})
+
+
 @teacher_required
 def submissions_list(request):
-    subs = Submission.objects.all().order_by('-submitted_at')
-    return render(request, 'teacher/submissions_list.html', {'subs': subs})
+    subs = Submission.objects.for_teacher(request.user).select_related('group', 'uploaded_by').order_by('-submitted_at')
+    status = request.GET.get('status')
+    if status:
+        subs = subs.filter(status=status)
+    return render(request, 'teacher/submissions_list.html', {
+        'submissions': subs,
+        'status_choices': Submission.STATUS_CHOICES,
+        'current_status': status or '',
+    })
+
+
+@teacher_required
+def review_queue_next(request):
+    """Queue se agla pending submission claim karke seedha review page kholo."""
+    if request.method != 'POST':
+        return redirect('submissions_list')
+    sub = claim_next_submission(request.user)
+    if sub is None:
+        messages.info(request, 'No pending submissions in your review queue.')
+        return redirect('submissions_list')
+    return redirect('review_submission', sub_id=sub.id)
+
+
+@teacher_required
+def bulk_review_submissions(request):
+    """Milestone checkpoints par selected submissions ek hi POST me review karo."""
+    if request.method != 'POST':
+        return redirect('submissions_list')
+    ids = [int(i) for i in request.POST.getlist('submission_ids') if i.isdigit()]
+    if not ids:
+        messages.error(request, 'Select at least one submission.')
+        return redirect('submissions_list')
+    try:
+        updated = bulk_review(
+            request.user,
+            ids,
+            request.POST.get('status'),
+            request.POST.get('feedback', '').strip(),
+        )
+    except ValueError:
+        messages.error(request, 'Please choose a valid status.')
+        return redirect('submissions_list')
+
+    skipped = len(ids) - len(updated)
+    messages.success(request, f'{len(updated)} submission(s) reviewed.')
+    if skipped:
+        messages.warning(request, f'{skipped} submission(s) skipped (not your group or topic, or being reviewed by someone else).')
+    return redirect('submissions_list')
 
 
 @teacher_required
 def review_submission(request, sub_id):
-    sub = get_object_or_404(Submission, id=sub_id)
+    sub = get_object_or_404(
+        Submission.objects.for_teacher(request.user).select_related('group', 'uploaded_by', 'claimed_by', 'manifest'),
+        id=sub_id,
+    )
     if request.method == 'POST':
-        sub.status = request.POST.get('status')
-        sub.feedback = request.POST.get('feedback', '').strip()
-        sub.reviewed_at = timezone.now()
-        sub.save()
+        try:
+            record_review(
+                sub,
+                request.user,
+                request.POST.get('status'),
+                request.POST.get('feedback', '').strip(),
+            )
+        except ValueError:
+            messages.error(request, 'Please choose a valid status.')
+            return redirect('review_submission', sub_id=sub.id)
+        except ReviewConflict:
+            messages.error(request, 'This submission is being reviewed by another teacher.')
+            return redirect('submissions_list')
         messages.success(request, 'Submission reviewed successfully.')
         return redirect('submissions_list')
-    return render(request, 'teacher/review_submission.html', {'sub': sub})
+
+    # GET sirf lease dikhata hai; lease "Start review" (start_review) ya queue se milta hai
+    now = timezone.now()
+    claimed_by_other = sub.is_claimed_by_other(request.user, now)
+    claimed_by_me = sub.claimed_by_id == request.user.pk and sub.claimed_until is not None and sub.claimed_until > now
+    matches = sub.similarity_matches.select_related('other__group')[:TOP_MATCHES]
+    return render(request, 'teacher/review_submission.html', {
+        'sub': sub,
+        'claimed_by_other': claimed_by_other,
+        'claimed_by_me': claimed_by_me,
+        'matches': matches,
+    })
+
+
+@teacher_required
+def start_review(request, sub_id):
+    """Review page se is submission ka lease lo (POST only)."""
+    if request.method != 'POST':
+        return redirect('review_submission', sub_id=sub_id)
+    sub = get_object_or_404(Submission.objects.for_teacher(request.user), id=sub_id)
+    if sub.status != Submission.STATUS_PENDING:
+        messages.info(request, 'This submission has already been reviewed.')
+    elif not claim_submission(sub, request.user):
+        messages.error(request, 'This submission is being reviewed by another teacher.')
+    return redirect('review_submission', sub_id=sub.id)
 
 
 # ---- Topic CRUD ----
@@ -317,7 +444,10 @@ def create_topic(request):
 
 @teacher_required
 def topics_list(request):
-    topics = Topic.objects.filter(created_by=request.user)
+    topics = cached(
+        'topics_list', [request.user.pk], [Topic],
+        lambda: list(Topic.objects.filter(created_by=request.user)),
+    )
     return render(request, 'teacher/topics_list.html', {'topics': topics, 'title': 'My Topics'})
 
 @teacher_required
@@ -325,8 +455,7 @@ def edit_topic(request, pk):
     topic = get_object_or_404(Topic, pk=pk, created_by=request.user)
     if request.method == 'POST':
         form = TopicForm(request.POST, instance=topic)
-        if form.is_valid():
-            form.save()
+        if form.is_valid() and form.save_or_error() is not None:
             return redirect('topics_list')
     else:
         form = TopicForm(instance=topic)
@@ -340,20 +469,230 @@ class TopicDeleteView(DeleteView):
     def get_queryset(self):
         return Topic.objects.filter(created_by=self.request.user)
 
+@login_required
 def topic_detail(request, pk):
-    topic = get_object_or_404(Topic, pk=pk)
+    # visibility har user ke liye alag hai, isliye cache se pehle scoped check
+    if not Topic.objects.for_user(request.user).filter(pk=pk).exists():
+        raise Http404("Topic not found")
+    topic = cached(
+        'topic_detail', [pk], [Topic, CustomUser],
+        lambda: Topic.objects.select_related('created_by').filter(pk=pk).first(),
+    )
+    if topic is None:
+        raise Http404("Topic not found")
     return render(request, "teacher/topic_detail.html", {"topic": topic})
 
 
+# ---- Topic catalogue ----
+@login_required
+def topic_catalogue(request):
+    group = None
+    if request.user.role == 'student':
+        member = current_membership(request.user).select_related('group', 'group__topic').first()
+        group = member.group if member else None
+    q = request.GET.get('q', '').strip()
+    topics = catalogue(request.user, q)
+
+    # stats aggregate hi paginator ka count bhi hai (alag COUNT query nahi)
+    stats = catalogue_stats(topics)
+    paginator = Paginator(topics, CATALOGUE_PAGE_SIZE)
+    paginator.count = stats['total']
+    page = paginator.get_page(request.GET.get('page'))
+    return render(request, 'topics/catalogue.html', {
+        'page': page,
+        'stats': stats,
+        'group': group,
+        'q': q,
+        'can_claim': group is not None and group.topic_id is None,
+    })
+
+
+@student_required
+def claim_topic_view(request, pk):
+    if request.method != 'POST':
+        return redirect('topic_catalogue')
+    member = current_membership(request.user).select_related('group').first()
+    if member is None:
+        messages.error(request, 'You are not assigned to any group yet.')
+        return redirect('topic_catalogue')
+    if not catalogue(request.user).filter(pk=pk).exists():
+        raise Http404("Topic not found")
+    try:
+        claim_topic(member.group, pk)
+    except TopicUnavailable as exc:
+        messages.error(request, str(exc))
+    else:
+        messages.success(request, 'Topic claimed for your group.')
+    return redirect('topic_catalogue')
+
+
+# ---- Milestones ----
+@teacher_required
+def milestone_list(request):
+    if request.method == 'POST':
+        form = MilestoneForm(request.POST, user=request.user)
+        if form.is_valid():
+            milestone = form.save(commit=False)
+            milestone.created_by = request.user
+            milestone.save()
+            messages.success(request, "Milestone created.")
+            return redirect('milestone_list')
+    else:
+        form = MilestoneForm(user=request.user)
+    milestones = (
+        Milestone.objects.filter(Q(created_by=request.user) | Q(group__teacher=request.user))
+        .select_related('group')
+        .distinct()
+    )
+    return render(request, 'teacher/milestones.html', {
+        'form': form, 'milestones': milestones, 'now': timezone.now(),
+    })
+
+
+@teacher_required
+def milestone_delete(request, pk):
+    milestone = get_object_or_404(Milestone, pk=pk, created_by=request.user)
+    if request.method == 'POST':
+        milestone.delete()
+        messages.success(request, "Milestone deleted.")
+    return redirect('milestone_list')
+
+
+# ---- Rubrics & grading ----
+GRADES_PAGE_SIZE = 100
+
+
+@teacher_required
+def rubric_list(request):
+    if request.method == 'POST':
+        form = RubricForm(request.POST, user=request.user)
+        if form.is_valid():
+            rubric = form.save(commit=False)
+            rubric.created_by = request.user
+            rubric.save()
+            messages.success(request, "Rubric created. Add its criteria below.")
+            return redirect('rubric_edit', pk=rubric.pk)
+    else:
+        form = RubricForm(user=request.user)
+    rubrics = (
+        Rubric.objects.filter(created_by=request.user).select_related('topic')
+        .annotate(criteria_count=Count('criteria'), total_weight=Sum('criteria__weight'))
+        .order_by('-created_at')
+    )
+    return render(request, 'teacher/rubrics.html', {'form': form, 'rubrics': rubrics})
+
+
+@teacher_required
+def rubric_edit(request, pk):
+    rubric = get_object_or_404(Rubric, pk=pk, created_by=request.user)
+    if request.method == 'POST':
+        form = RubricForm(request.POST, instance=rubric, user=request.user)
+        formset = CriterionFormSet(request.POST, instance=rubric)
+        if form.is_valid() and formset.is_valid():
+            form.save()
+            formset.save()
+            messages.success(request, "Rubric saved.")
+            return redirect('rubric_edit', pk=rubric.pk)
+    else:
+        form = RubricForm(instance=rubric, user=request.user)
+        formset = CriterionFormSet(instance=rubric)
+    return render(request, 'teacher/rubric_form.html', {'rubric': rubric, 'form': form, 'formset': formset})
+
+
+@teacher_required
+def grade_submission(request, sub_id):
+    sub = get_object_or_404(Submission.objects.for_teacher(request.user).select_related('group'), id=sub_id)
+    rubric = rubric_for(sub.group)
+    if rubric is None:
+        messages.error(request, "No rubric applies to this group yet. Create one for its topic or semester.")
+        return redirect('rubric_list')
+    scores = dict(CriterionScore.objects.filter(submission=sub).values_list('criterion_id', 'score'))
+    form = ScoreForm(request.POST or None, criteria=rubric.criteria.all(), scores=scores)
+    if request.method == 'POST' and form.is_valid():
+        try:
+            save_scores(sub, rubric, form.values(), actor=request.user)
+        except ValueError as exc:
+            form.add_error(None, str(exc))
+        else:
+            messages.success(request, "Scores saved.")
+            return redirect('review_submission', sub_id=sub.id)
+    return render(request, 'teacher/grade_submission.html', {'sub': sub, 'rubric': rubric, 'form': form})
+
+
+def _grade_filters(request):
+    semester = request.GET.get('semester') or None
+    if semester and not semester.isdigit():
+        semester = None
+    return semester and int(semester), request.GET.get('division') or None
+
+
+@teacher_required
+def cohort_grades(request):
+    semester, division = _grade_filters(request)
+    rows = grade_rows(request.user, semester, division)
+    page = Paginator(rows, GRADES_PAGE_SIZE).get_page(request.GET.get('page'))
+    return render(request, 'teacher/grades.html', {
+        'page': page,
+        'semester': semester,
+        'division': division,
+        'semesters': CustomUser.SEMESTER_CHOICES,
+        'divisions': CustomUser.DIVISION_CHOICES,
+    })
+
+
+@teacher_required
+def member_adjustment(request, group_id):
+    group = get_object_or_404(ProjectGroup, pk=group_id, teacher=request.user)
+    if request.method == 'POST':
+        form = AdjustmentForm(request.POST)
+        if not form.is_valid():
+            messages.error(request, "Enter an adjustment between -100 and 100.")
+        else:
+            try:
+                set_adjustment(group, form.cleaned_data['student'], form.cleaned_data['delta'], form.cleaned_data['reason'])
+            except ValueError as exc:
+                messages.error(request, str(exc))
+            else:
+                messages.success(request, "Adjustment saved.")
+    # sirf grades page par wapas (filters/page ke saath); bahar ka URL nahi
+    back = request.POST.get('next', '')
+    if not back.startswith(reverse('cohort_grades')):
+        back = reverse('cohort_grades')
+    return redirect(back)
+
+
+@teacher_required
+def export_grades(request):
+    semester, division = _grade_filters(request)
+    rows = grade_rows(request.user, semester, division)
+    response = StreamingHttpResponse(csv_lines(rows), content_type='text/csv')
+    suffix = f"-sem{semester}" if semester else ''
+    suffix += f"-{division}" if division else ''
+    response['Content-Disposition'] = f'attachment; filename="grades{suffix}.csv"'
+    return response
+
+
 # ---- Group CRUD ----
 @login_required
 def group_list(request):
-    groups = ProjectGroup.objects.filter(teacher=request.user)
+    groups = ProjectGroup.objects.filter(teacher=request.user).select_related('summary')
     return render(request, 'teacher/group_list.html', {'groups': groups})
 
+@login_required
 def group_detail(request, pk):
-    group = get_object_or_404(ProjectGroup, id=pk)
-    members = group.members.select_related("student")
+    if not ProjectGroup.objects.for_user(request.user).filter(pk=pk).exists():
+        raise Http404("Group not found")
+
+    def load():
+        group = ProjectGroup.objects.select_related('topic').filter(id=pk).first()
+        if group is None:
+            return None
+        return group, list(group.members.select_related("student"))
+
+    data = cached('group_detail', [pk], [ProjectGroup, Topic, GroupMember, CustomUser], load)
+    if data is None:
+        raise Http404("Group not found")
+    group, members = data
     return render(request, 'teacher/group_detail.html', {'group': group, 'members': members})
 
 @login_required
@@ -361,25 +700,35 @@ def create_group(request):
     if request.method == "POST":
         form = GroupForm(request.POST, user=request.user)
         if form.is_valid():
-            group = form.save(commit=False)
-            group.teacher = request.user
-            group.save()
-            messages.success(request, "Group created successfully!")
-            return redirect("assign_members", group_id=group.id)
+            form.instance.teacher = request.user
+            try:
+                group = form.save()
+            except TopicUnavailable as exc:
+                form.instance.pk = None
+                form.add_error('topic', str(exc))
+            else:
+                messages.success(request, "Group created successfully!")
+                return redirect("assign_members", group_id=group.id)
     else:
         form = GroupForm(user=request.user)
     return render(request, 'teacher/create_group.html', {'form': form})
 
 @teacher_required
 def group_update(request, pk):
-    group = get_object_or_404(ProjectGroup, pk=pk)
+    group = get_object_or_404(ProjectGroup.objects.for_teacher(request.user), pk=pk)
     if request.method == 'POST':
-        form = GroupForm(request.POST, instance=group)
+        form = GroupForm(request.POST, instance=group, user=request.user)
         if form.is_valid():
-            form.save()
-            return redirect('group_detail', pk=group.id)
+            try:
+                form.save()
+            except TopicUnavailable as exc:
+                form.add_error('topic', str(exc))
+            except MembershipError as exc:
+                form.add_error(None, str(exc))
+            else:
+                return redirect('group_detail', pk=group.id)
     else:
-        form = GroupForm(instance=group)
+        form = GroupForm(instance=group, user=request.user)
     return render(request, 'teacher/create_group.html', {'form': form, 'title': 'Edit Group'})
 
 class GroupDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
@@ -390,9 +739,17 @@ class GroupDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     def test_func(self):
         return self.request.user.role == 'teacher'
 
+    def get_queryset(self):
+        return ProjectGroup.objects.for_teacher(self.request.user)
+
+    def form_valid(self, form):
+        # collector ki jagah set-based purge (files bhi hat jati hain)
+        purge_groups([self.object.pk])
+        return redirect(self.get_success_url())
+
 @teacher_required 
 def assign_members(request, group_id):
-    group = get_object_or_404(ProjectGroup, id=group_id)
+    group = get_object_or_404(ProjectGroup.objects.for_teacher(request.user), id=group_id)
     current_members = group.members.values_list('student_id', flat=True)
 
     sel_semester = request.GET.get('semester')
@@ -407,11 +764,13 @@ def assign_members(request, group_id):
     if request.method == 'POST':
         form = AssignMembersForm(request.POST, students_qs=students)
         if form.is_valid():
-            group.members.all().delete()
-            for student in form.cleaned_data['students']:
-                GroupMember.objects.create(group=group, student=student)
-            messages.success(request, 'Members updated successfully!')
-            return redirect('group_detail', pk=group.id)
+            try:
+                set_members(group, form.cleaned_data['students'])
+            except MembershipError as exc:
+                form.add_error('students', str(exc))
+            else:
+                messages.success(request, 'Members updated successfully!')
+                return redirect('group_detail', pk=group.id)
     else:
         form = AssignMembersForm(students_qs=students, initial={'students': current_members})
 
@@ -431,72 +790,165 @@ def assign_members(request, group_id):
 # --------------------
 @student_required
 def student_dashboard(request):
-    return render(request, "student_dashboard.html")
+    memberships = student_overview(request.user)
+    summaries = [getattr(m.group, 'summary', None) for m in memberships]
+    return render(request, "student_dashboard.html", {
+        "memberships": memberships,
+        "groups_count": len(memberships),
+        "submissions_count": sum(m.submissions_count for m in memberships),
+        "pending_reviews": sum(s.pending_count for s in summaries if s),
+        "unread_count": sum(m.unread for m in memberships),
+    })
 
 
 @student_required
 def my_group(request):
-    student = request.user
-    group_memberships = GroupMember.objects.filter(student=student).select_related("group")
-
-    if not group_memberships.exists():
-        return render(request, "student/my_group.html")
-
-    groups_data = []
-    for gm in group_memberships:
-        group = gm.group
-        members = group.members.select_related("student")
-        groups_data.append({
-            "group": group,
-            "members": members,
-            "topic": group.topic,
-            "teacher": group.teacher,
-        })
-
+    # memberships + topic/teacher ek join me, saare groups ke members ek prefetch me
+    group_memberships = (
+        GroupMember.objects.filter(student=request.user)
+        .select_related("group__topic", "group__teacher")
+        .prefetch_related(Prefetch(
+            "group__members", queryset=GroupMember.objects.select_related("student").order_by("joined_at", "pk"),
+        ))
+    )
+    groups_data = [
+        {
+            "group": gm.group,
+            "members": gm.group.members.all(),
+            "topic": gm.group.topic,
+            "teacher": gm.group.teacher,
+        }
+        for gm in group_memberships
+    ]
     return render(request, "student/my_group.html", {"groups_data": groups_data})
 
 
 @student_required
 def project_submission(request):
-    member = GroupMember.objects.filter(student=request.user).select_related('group').first()
+    member = current_membership(request.user).select_related('group', 'group__topic').first()
     group = member.group if member else None
-    form = SubmissionForm()
-    return render(request, 'student/project_submission.html', {'group': group, 'form': form})
+    context = {'group': group, 'form': SubmissionForm()}
+    if group is not None:
+        now = timezone.now()
+        windows = milestones_for(group)
+        milestone = open_milestone(windows, now)
+        context.update({
+            'has_milestones': bool(windows),
+            'milestone': milestone,
+            'next_milestone': next_milestone(windows, now),
+            # deadline se pehle khula page deadline ke baad bhi grace tak upload kar sake
+            'upload_ticket': issue_ticket(request.user, group, milestone, now) if milestone else '',
+        })
+    return render(request, 'student/project_submission.html', context)
 
 
-@student_required
-def submit_project(request):
-    if request.method == 'POST':
-        member = GroupMember.objects.filter(student=request.user).select_related('group').first()
-        if not member:
-            messages.error(request, 'You are not assigned to any group yet.')
-            return redirect('student_dashboard')
+@login_required
+def student_detail(request, student_id):
+    student = get_object_or_404(CustomUser, id=student_id, role='student')
+    return render(request, 'teacher/student_detail.html', {'student': student})
+
+
+# --------------------
+# Group Q&A threads (students + their teacher)
+# --------------------
+@login_required
+def group_queries(request, group_id):
+    group = get_object_or_404(
+        ProjectGroup.objects.for_user(request.user).select_related('topic', 'teacher'), id=group_id
+    )
 
-        form = SubmissionForm(request.POST, request.FILES)
+    if request.method == 'POST':
+        form = QueryForm(request.POST)
         if form.is_valid():
-            sub = form.save(commit=False)
-            sub.group = member.group
-            sub.uploaded_by = request.user
-            sub.save()
-            messages.success(request, 'Project submitted successfully.')
-            return redirect('student_dashboard')
-        else:
-            messages.error(request, 'Submission failed. Please check the form.')
-            return redirect('my_group')
-    return redirect('my_group')
+            msg = form.save(commit=False)
+            msg.group = group
+            msg.author = request.user
+            if request.user.role == 'student':
+                msg.student = request.user
+            msg.save()
+            mark_read(request.user, group.id, msg.id)
+            return redirect('group_queries', group_id=group.id)
+    else:
+        form = QueryForm()
+
+    thread = thread_messages(group.id)
+    if thread:
+        mark_read(request.user, group.id, thread[-1].id)
+    return render(request, 'queries/thread.html', {
+        'group': group,
+        'thread': thread,
+        'form': form,
+        'has_older': len(thread) == QUERY_PAGE_SIZE,
+    })
 
 
 @login_required
-def student_detail(request, student_id):
-    student = get_object_or_404(CustomUser, id=student_id, role='student')
-    return render(request, 'teacher/student_detail.html', {'student': student})
+def group_queries_messages(request, group_id):
+    """Purane messages (``?before=<id>``) JSON me, thread page ke 'load older' ke liye."""
+    group = get_object_or_404(ProjectGroup.objects.for_user(request.user), id=group_id)
+    try:
+        before = int(request.GET['before']) if request.GET.get('before') else None
+    except ValueError:
+        before = None
+    thread = thread_messages(group.id, before=before)
+    return JsonResponse({
+        'messages': [serialize_message(m, request.user) for m in thread],
+        'has_older': len(thread) == QUERY_PAGE_SIZE,
+    })
+
 
+@teacher_required
+def query_inbox(request):
+    return render(request, 'teacher/query_inbox.html', {'groups': inbox_groups(request.user)})
 
+
+@student_required
 def view_submissions(request):
-    return render(request, "student/view_submissions.html")
+    submissions = (
+        Submission.objects
+        .filter(group__members__student=request.user)
+        .select_related('group')
+        .order_by('-submitted_at')
+    )
+    return render(request, "student/view_submissions.html", {"submissions": submissions})
 
 def profile(request):
     return render(request, "student/profile.html")
 
 def help_center(request):
-    return render(request, "student/help_center.html")
\ No newline at end of file
+    return render(request, "student/help_center.html")
+
+
+# --------------------
+# Sync twins of async_views (WSGI)
+# --------------------
+# Wahi querysets/permissions, bas sync. WSGI deployments aur
+# benchmarks/http_load.py (sync-under-WSGI vs async-under-ASGI) ke liye.
+@teacher_required
+def dashboard_counters_sync(request):
+    return JsonResponse({name: qs.count() for name, qs in counter_querysets(request.user).items()})
+
+
+@teacher_required
+def search_sync(request):
+    results = {'topics': [], 'groups': [], 'students': []}
+    for name, qs in search_querysets(request.user, request.GET.get('q', '').strip()).items():
+        results[name] = list(qs)
+    return JsonResponse(results)
+
+
+@login_required
+def download_submission_sync(request, sub_id):
+    sub = get_object_or_404(Submission.objects.for_user(request.user), pk=sub_id)
+    return submission_file_response(sub)
+
+
+# --------------------
+# Metrics
+# --------------------
+def metrics_view(request):
+    """Prometheus scrape endpoint. ``METRICS_TOKEN`` set ho to bearer token chahiye."""
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse('Unauthorized', status=401, content_type='text/plain')
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')